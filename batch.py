@@ -0,0 +1,172 @@
+"""
+batch.py
+הרצת הרבה משחקים בלי חלון (headless) במקביל על כל הליבות.
+
+    python batch.py --matches 1000 --policy greedy [--enemy greedy] [--workers N] [--out results.jsonl]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from enemy_ai import EnemyAI
+from game import Game
+from policies import make_policy
+from settings import SIM_TICK_RATE, make_config
+
+
+class MatchResult(NamedTuple):
+    """תוצאה של משחק אחד (קטנה, כדי שיהיה זול להעביר בין תהליכים)."""
+
+    seed: int
+    policy: str
+    winner: str  # "player" / "enemy" / "draw" (נגמר הזמן)
+    duration_ms: int
+    player_units_spawned: int
+    enemy_units_spawned: int
+    player_turret_level: int
+    enemy_turret_level: int
+    # HP של הבסיסים, דגימה כל sample_ms
+    player_base_hp: tuple
+    enemy_base_hp: tuple
+    enemy: str = "timer"  # שם ה-policy של האויב ("timer" = האויב הישן)
+
+
+def play_match(seed, policy="greedy", max_ms=10 * 60 * 1000, sample_ms=1000, overrides=None, enemy=None):
+    """
+    משחק headless אחד מההתחלה ועד הסוף (או עד max_ms של זמן משחק).
+    overrides = dict של ערכי settings למשחק הזה (ראו settings.make_config).
+    enemy = policy לאויב (שם או אובייקט); None = האויב הישן עם הטיימר.
+    """
+    config = make_config(**(overrides or {}))
+    enemy_ai = None
+    if enemy is not None:
+        enemy_ai = EnemyAI(make_policy(enemy) if isinstance(enemy, str) else enemy)
+    game = Game(headless=True, seed=seed, config=config, enemy_policy=enemy_ai)
+    player = make_policy(policy) if isinstance(policy, str) else policy
+    player.reset(seed)
+
+    max_ticks = max_ms * SIM_TICK_RATE // 1000
+    sample_every = max(1, sample_ms * SIM_TICK_RATE // 1000)
+    player_hp = [game.player_base.hp]
+    enemy_hp = [game.enemy_base.hp]
+
+    while not game.game_over and game.tick < max_ticks:
+        game.apply_action(player.act(game))
+        game.step()
+        if game.tick % sample_every == 0:
+            player_hp.append(game.player_base.hp)
+            enemy_hp.append(game.enemy_base.hp)
+
+    if game.tick % sample_every != 0:
+        player_hp.append(game.player_base.hp)
+        enemy_hp.append(game.enemy_base.hp)
+
+    return MatchResult(
+        seed=seed,
+        policy=player.name,
+        winner=game.winner or "draw",
+        duration_ms=game.clock.get_ticks(),
+        player_units_spawned=game.player_units_spawned,
+        enemy_units_spawned=game.enemy_units_spawned,
+        player_turret_level=game.base_turret_level,
+        enemy_turret_level=game.enemy_turret_level,
+        player_base_hp=tuple(player_hp),
+        enemy_base_hp=tuple(enemy_hp),
+        enemy=enemy_ai.name if enemy_ai is not None else "timer",
+    )
+
+
+def seed_independent(policy="greedy", enemy=None):
+    """
+    True כשכל seed משחק בדיוק את אותו משחק. Game headless לא משתמש ב-RNG
+    שלו, אז seeds שונים נותנים משחקים שונים רק דרך policy עם seeded=True
+    (של השחקן או של האויב); האויב הישן (enemy=None) קבוע. במקרה כזה משחק
+    אחד אומר הכל, ויותר משחקים רק מנפחים את גודל המדגם.
+    """
+    for p in (policy, enemy):
+        if p is None:
+            continue
+        if isinstance(p, str):
+            p = make_policy(p)
+        if getattr(p, "seeded", True):
+            return False
+    return True
+
+
+def _play_star(args):
+    return play_match(*args)
+
+
+def run_batch(
+    seeds, policy="greedy", workers=None, max_ms=10 * 60 * 1000, sample_ms=1000, overrides=None, enemy=None
+):
+    """
+    מריץ משחק לכל seed על ProcessPoolExecutor ומחזיר generator של תוצאות
+    (לפי סדר ה-seeds). workers=1 -> בלי תהליכים (נוח לדיבאג ולפרופיילר).
+    """
+    jobs = [(seed, policy, max_ms, sample_ms, overrides, enemy) for seed in seeds]
+    yield from run_jobs(jobs, workers)
+
+
+def run_jobs(jobs, workers=None):
+    """
+    jobs = רשימה של tuples עם הפרמטרים של play_match (אחד לכל משחק).
+    """
+    if workers == 1:
+        yield from map(_play_star, jobs)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    # chunks keep the per-task IPC overhead small next to one short match
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_play_star, jobs, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless matches across all CPU cores.")
+    parser.add_argument("--matches", type=int, default=200)
+    parser.add_argument("--policy", default="greedy")
+    parser.add_argument("--enemy", default=None, help="enemy policy (default: the built-in spawn timer)")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0, help="first match seed")
+    parser.add_argument("--max-seconds", type=int, default=600, help="game time limit per match")
+    parser.add_argument("--out", default=None, help="write one JSON result per line")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    if args.matches > 1 and seed_independent(args.policy, args.enemy):
+        print(f"{args.policy} vs {args.enemy or 'timer'} plays the same game on every seed: running 1 match, not {args.matches}")
+        args.matches = 1
+    seeds = range(args.seed, args.seed + args.matches)
+
+    wins = {"player": 0, "enemy": 0, "draw": 0}
+    total_ms = 0
+    out = open(args.out, "w") if args.out else None
+    start = time.perf_counter()
+    try:
+        for result in run_batch(seeds, args.policy, workers, args.max_seconds * 1000, enemy=args.enemy):
+            wins[result.winner] += 1
+            total_ms += result.duration_ms
+            if out is not None:
+                out.write(json.dumps(result._asdict()) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    n = args.matches
+    print(f"{n} matches, policy={args.policy}, enemy={args.enemy or 'timer'}, workers={workers}")
+    print(f"player {wins['player']} / enemy {wins['enemy']} / draw {wins['draw']}")
+    print(f"mean game time {total_ms / max(1, n) / 1000:.1f} s")
+    print(f"{n / elapsed:.1f} matches/s ({n / elapsed / workers:.1f} per worker)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+bench_entities.py
+זיכרון לכל ישות וזמן לולאת העדכון של חלקיקים ורקע.
+
+    python bench_entities.py [--count 10000]
+"""
+
+import argparse
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from effects import ParticleSystem, Background, Cloud, Missile
+from entities import Base
+from settings import WIDTH, HEIGHT
+
+
+def bytes_per_object(make, count):
+    """Average traced allocation per object for count objects."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [make(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list itself holds one pointer per object
+    return (after - before) / count - 8, objs
+
+
+def bench_particles(count, frames=60):
+    ps = ParticleSystem(random.Random(1), capacity=count)
+    while ps.used < count:
+        ps.spawn_explosion((WIDTH / 2, HEIGHT / 2), count=50)
+    ps.life[:] = 10**9
+    ps.count = count
+    t = time.perf_counter()
+    for _ in range(frames):
+        ps.update(16)
+    return (time.perf_counter() - t) / frames * 1000.0
+
+
+def particle_bytes():
+    """Bytes per particle slot in the ParticleSystem arrays."""
+    ps = ParticleSystem(random.Random(1), capacity=1024)
+    total = sum(getattr(ps, name).nbytes for name in ps._FIELDS) + ps.color.nbytes
+    return total / ps.capacity
+
+
+def bench_background(frames=600):
+    bg = Background(None, random.Random(1))
+    t = time.perf_counter()
+    for _ in range(frames):
+        bg.update(16)
+    return (time.perf_counter() - t) / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    base_bytes, _ = bytes_per_object(lambda i: Base(40, 150, "player"), args.count)
+    missile_bytes, _ = bytes_per_object(
+        lambda i: Missile(float(i), 1.5, 2.5, 3.5, 1000 + i), args.count
+    )
+    cloud_bytes, _ = bytes_per_object(lambda i: Cloud(i + 1000, 50, 300, 1.5, 40, 2), args.count)
+
+    print(f"Particle: {particle_bytes():7.1f} bytes/slot")
+    print(f"Base:     {base_bytes:7.1f} bytes/object")
+    print(f"Missile:  {missile_bytes:7.1f} bytes/object")
+    print(f"Cloud:    {cloud_bytes:7.1f} bytes/object")
+    print(f"ParticleSystem.update, {args.count} particles: {bench_particles(args.count):.3f} ms/frame")
+    print(f"Background.update: {bench_background() * 1000:.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+bench_lookahead.py
+כמה rollouts בשנייה LookaheadPolicy מספיקה בתוך תקציב ההחלטה, ומה היא בוחרת.
+
+    python bench_lookahead.py [--seconds 60] [--budget-ms 20] [--enemy greedy] [--table 100000 --matches 4]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from enemy_ai import EnemyAI
+from game import Game
+from policies import LookaheadPolicy, make_policy
+from settings import SIM_TICK_RATE
+from transposition import TranspositionTable
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--seconds", type=int, default=60, help="game time to play")
+    parser.add_argument("--budget-ms", type=float, default=20)
+    parser.add_argument("--horizon-ms", type=int, default=4000)
+    parser.add_argument("--rollout-step-ms", type=int, default=50)
+    parser.add_argument("--enemy", default=None, help="enemy policy (default: the built-in spawn timer)")
+    parser.add_argument("--table", type=int, default=0, help="transposition table capacity (0 = off)")
+    parser.add_argument("--matches", type=int, default=1, help="matches in a row, sharing the table")
+    args = parser.parse_args()
+
+    table = TranspositionTable(args.table) if args.table else None
+    policy = LookaheadPolicy(
+        horizon_ms=args.horizon_ms, budget_ms=args.budget_ms, rollout_step_ms=args.rollout_step_ms, table=table
+    )
+    start = time.perf_counter()
+    game_ms = 0
+    for seed in range(args.seed, args.seed + args.matches):
+        enemy = EnemyAI(make_policy(args.enemy)) if args.enemy else None
+        game = Game(headless=True, seed=seed, enemy_policy=enemy)
+        # stats accumulate over all matches; only the plan in progress is dropped
+        policy.current = None
+        while not game.game_over and game.tick < args.seconds * SIM_TICK_RATE:
+            game.apply_action(policy.act(game))
+            game.step()
+        game_ms += game.clock.get_ticks()
+        print(f"seed {seed}: {game.tick / SIM_TICK_RATE:.1f} s, winner: {game.winner or 'none'}")
+    elapsed = time.perf_counter() - start
+
+    s = policy.stats()
+    print(f"{game_ms / 1000:.1f} s of game in {elapsed:.1f} s")
+    print(f"{s['decisions']} decisions, {s['rollouts']} rollouts ({s['rollouts'] / max(1, s['decisions']):.1f} per decision)")
+    print(f"{s['rollouts_per_s']:.0f} rollouts/s, {s['ms_per_decision']:.1f} ms per decision (budget {args.budget_ms:g} ms)")
+    print(f"choices: {s['choices']}")
+    if table is not None:
+        t = table.stats()
+        print(
+            f"table: {t['entries']} entries, hit rate {t['hit_rate']:.0%} "
+            f"({t['hits']} hits / {t['misses']} misses, {t['evictions']} evictions), "
+            f"saved ~{s['saved_ms'] / 1000:.1f} s of search"
+        )
+        # a partial entry (search cut short by the budget) only reorders the next search
+        print(f"complete-entry hits: {s['cache_hits']}, partial-entry hits: {s['partial_hits']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+bench_render.py
+זמן ציור של פריים עם הרבה חלקיקים (סצנה קפואה, בלי update).
+
+    python bench_render.py [--particles 5000] [--frames 60]
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from effects import ParticleSystem
+from game import Game
+from policies import GreedyPolicy
+from settings import WIDTH, HEIGHT
+from timing import SimClock
+from visuals import SPRITES, ensure_fonts
+
+
+def busy_game(particles, seed=0, ticks=1200):
+    """A windowed game in the middle of a fight, with explosions on screen."""
+    game = Game(clock=SimClock(), seed=seed)
+    policy = GreedyPolicy()
+    while game.tick < ticks and not game.game_over:
+        game.apply_action(policy.act(game))
+        game.step()
+    rng = random.Random(seed)
+    ps = ParticleSystem(rng, capacity=particles)
+    while ps.used < particles:
+        ps.spawn_explosion((rng.uniform(0, WIDTH), rng.uniform(HEIGHT * 0.3, HEIGHT * 0.8)), count=20)
+    # a few frames of motion so the alphas and positions spread out
+    for _ in range(10):
+        ps.update(16)
+    game.particles = ps
+    game.background.particles = ps
+    return game
+
+
+def ms_per_frame(fn, frames):
+    fn()
+    t = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t) / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--particles", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    pygame.init()
+    ensure_fonts()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    game = busy_game(args.particles)
+    layer = pygame.Surface((WIDTH, HEIGHT))
+
+    particles = ms_per_frame(lambda: game.particles.draw(layer), args.frames)
+    frame = ms_per_frame(lambda: game.draw(screen), args.frames)
+    print(f"{len(game.particles)} particles, {game.player_units.count + game.enemy_units.count} units")
+    print(f"ParticleSystem.draw: {particles:7.2f} ms/frame")
+    print(f"Game.draw:           {frame:7.2f} ms/frame")
+    for name, cache in (("particle sprites", game.particles.sprites), ("other sprites", SPRITES)):
+        s = cache.stats()
+        print(
+            f"{name}: {s['entries']} / {cache.capacity}, {s['bytes'] / 1024:.0f} KiB, "
+            f"hit rate {s['hit_rate']:.1%}, {s['evictions']} evictions"
+        )
+
+
+if __name__ == "__main__":
+    main()
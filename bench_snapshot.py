@@ -0,0 +1,53 @@
+"""
+bench_snapshot.py
+זמן של Game.snapshot / restore / clone באמצע משחק.
+
+    python bench_snapshot.py [--warmup 900] [--count 20000]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game import Game
+from policies import GreedyPolicy
+
+
+def warm_game(seed, ticks):
+    """Headless greedy match advanced to the middle of the fight."""
+    game = Game(headless=True, seed=seed)
+    policy = GreedyPolicy()
+    while game.tick < ticks and not game.game_over:
+        game.apply_action(policy.act(game))
+        game.step()
+    return game
+
+
+def per_call_us(fn, count):
+    t = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - t) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=900, help="ticks to play before measuring")
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    game = warm_game(args.seed, args.warmup)
+    snap = game.snapshot()
+    size = len(snap.player_units[-1]) + len(snap.enemy_units[-1])
+    print(f"tick {game.tick}: {len(game.player_units)} player / {len(game.enemy_units)} enemy units, {size} bytes of unit state")
+    print(f"snapshot: {per_call_us(game.snapshot, args.count):6.1f} us")
+    print(f"restore:  {per_call_us(lambda: game.restore(snap), args.count):6.1f} us")
+    clone_us = per_call_us(game.clone, args.count // 10)
+    print(f"clone:    {clone_us:6.1f} us ({1e6 / clone_us:.0f} clones/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+bench_targeting.py
+השוואת זמן חיפוש מטרה: סריקה ליניארית (האלגוריתם הישן של Unit.find_target)
+מול אינדקס הנתיב הממוין של UnitPool (bisect).
+
+    python bench_targeting.py [--sizes 100 1000 10000]
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+from entities import UnitPool
+from settings import UNIT_ATTACK_RANGE, UNIT_WIDTH
+
+
+class _OldUnit:
+    """Just enough of the old per-object Unit for the linear scan."""
+
+    def __init__(self, centerx):
+        self.centerx = centerx
+        self.alive = True
+
+
+def linear_find_target(cx, enemies):
+    """The old Unit.find_target loop (units only, no base check)."""
+    closest_enemy = None
+    closest_dist = 999999
+    for enemy in enemies:
+        if not enemy.alive:
+            continue
+        dist = abs(cx - enemy.centerx)
+        if dist > UNIT_ATTACK_RANGE:
+            continue
+        if dist < closest_dist:
+            closest_dist = dist
+            closest_enemy = enemy
+    return closest_enemy
+
+
+def make_armies(n, rng):
+    """Two armies of n units spread over an overlapping front line."""
+    px = [rng.uniform(150, 700) for _ in range(n)]
+    ex = [rng.uniform(300, 850) for _ in range(n)]
+    players = UnitPool("player", capacity=n)
+    enemies = UnitPool("enemy", capacity=n)
+    for x in px:
+        players.spawn(x)
+    for x in ex:
+        enemies.spawn(x)
+    old_enemies = [_OldUnit(int(x) + UNIT_WIDTH // 2) for x in ex]
+    return players, enemies, old_enemies
+
+
+def bench_linear(players, old_enemies, max_queries=200):
+    """
+    ms per tick for the linear scan. Large sizes only time a sample of
+    queries and scale up (the full 10,000 x 10,000 scan takes minutes).
+    """
+    cx = players.centerx().tolist()
+    sample = cx[:max_queries]
+    t = time.perf_counter()
+    for x in sample:
+        linear_find_target(x, old_enemies)
+    per_query = (time.perf_counter() - t) / len(sample)
+    return per_query * len(cx) * 1000.0
+
+
+def bench_lane(players, enemies, repeats=50):
+    """
+    ms per tick for the lane index: every unit moves a little, then the
+    whole side queries nearest-in-range in one vectorized bisect.
+    """
+    cx = players.centerx()
+    t = time.perf_counter()
+    for _ in range(repeats):
+        enemies.x[: enemies.count] -= 1.5
+        enemies._index_dirty = True
+        enemies.nearest(cx, UNIT_ATTACK_RANGE)
+    return (time.perf_counter() - t) / repeats * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'units/side':>10} {'linear ms':>12} {'lane ms':>10} {'speedup':>9}")
+    for n in args.sizes:
+        players, enemies, old_enemies = make_armies(n, rng)
+
+        # both methods must agree on who has a target
+        found_old = np.array([linear_find_target(x, old_enemies) is not None for x in players.centerx()[:200]])
+        found_new = enemies.nearest(players.centerx()[:200], UNIT_ATTACK_RANGE) >= 0
+        assert (found_old == found_new).all()
+
+        linear_ms = bench_linear(players, old_enemies)
+        lane_ms = bench_lane(players, enemies)
+        print(f"{n:>10} {linear_ms:>12.3f} {lane_ms:>10.3f} {linear_ms / lane_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
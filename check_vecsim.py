@@ -0,0 +1,152 @@
+"""
+check_vecsim.py
+בדיקה ש- vecsim.VecSim עדיין זהה ל- Game (ו- VecGameEnv ל- GameEnv).
+
+VecSim הוא מימוש שני של החוקים של Game.update, אז כל שינוי בחוקים ב-
+game.py / entities.py צריך לעבור את הבדיקה הזו:
+1) n משחקים עם פעולות אקראיות (קצב spawn שונה לכל משחק), והשוואה של כל
+   המצב (כסף, XP, בסיסים, טורטים, לוחמים, מנצח) אחרי כל טיק.
+2) VecGameEnv מול n אובייקטי GameEnv עם frame_skip ואיפוס אוטומטי:
+   תצפיות, תגמולים, done ו- info בכל צעד.
+
+    python check_vecsim.py [--games 24] [--ticks 20000] [--envs 32] [--steps 3000]
+
+יוצא עם קוד 1 בחוסר התאמה הראשון.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from env import GameEnv, VecGameEnv
+from game import Game
+from vecsim import VecSim, WINNERS
+
+# float32 sums of unit hp in the histograms may round differently
+OBS_TOLERANCE = 1e-5
+
+
+def random_actions(rng, rates):
+    """פעולה לכל משחק: spawn בקצב rates[i], upgrade ב-3% מהטיקים, אחרת noop."""
+    u = rng.random(len(rates))
+    return np.where(u < rates, 1, np.where(u > 0.97, 2, 0))
+
+
+def game_state(game):
+    units = []
+    for pool in (game.player_units, game.enemy_units):
+        n = pool.count
+        units.append(sorted(zip(pool.x[:n].tolist(), pool.hp[:n].tolist(), pool.last_attack_time[:n].tolist())))
+    return (
+        game.money, game.xp, game.enemy_money, game.enemy_xp,
+        game.player_base.hp, game.enemy_base.hp,
+        game.base_turret_level, game.base_turret_last_shot,
+        game.enemy_turret_level, game.enemy_turret_last_shot,
+        game.player_units_spawned, game.enemy_units_spawned,
+        game.game_over, game.winner, units,
+    )
+
+
+def sim_state(sim, i):
+    units = []
+    for lanes in (sim.players, sim.enemies):
+        alive = lanes.alive[i]
+        units.append(sorted(zip(lanes.x[i][alive].tolist(), lanes.hp[i][alive].tolist(), lanes.last_attack[i][alive].tolist())))
+    fields = (
+        sim.money, sim.xp, sim.enemy_money, sim.enemy_xp,
+        sim.player_base_hp, sim.enemy_base_hp,
+        sim.player_turret_level, sim.player_turret_last_shot,
+        sim.enemy_turret_level, sim.enemy_turret_last_shot,
+        sim.player_units_spawned, sim.enemy_units_spawned,
+    )
+    return tuple(int(f[i]) for f in fields) + (bool(sim.game_over[i]), WINNERS[sim.winner[i]], units)
+
+
+def check_sim(n, ticks, seed):
+    """Game מול VecSim, טיק אחרי טיק. מחזיר הודעת שגיאה או None."""
+    games = [Game(headless=True, seed=seed + i) for i in range(n)]
+    # small capacity, so the unit tables also grow during the check
+    sim = VecSim(n, capacity=4)
+    rng = np.random.default_rng(seed)
+    rates = np.linspace(0.0, 0.05, n)
+    for tick in range(ticks):
+        actions = random_actions(rng, rates)
+        for game, action in zip(games, actions.tolist()):
+            game.apply_action(action)
+            game.step()
+        sim.apply_actions(actions)
+        sim.step()
+        for i, game in enumerate(games):
+            expected, got = game_state(game), sim_state(sim, i)
+            if expected != got:
+                return f"tick {tick}, game {i}:\n  Game:   {expected}\n  VecSim: {got}"
+        if sim.game_over.all():
+            break
+    winners = sim.winners(np.arange(n))
+    print(
+        f"VecSim == Game: {n} games, {tick + 1} ticks "
+        f"(player won {winners.count('player')}, enemy won {winners.count('enemy')})"
+    )
+    return None
+
+
+def check_env(n, steps, seed, frame_skip=4, max_seconds=60):
+    """VecGameEnv מול n אובייקטי GameEnv. מחזיר הודעת שגיאה או None."""
+    venv = VecGameEnv(n, seed=seed, frame_skip=frame_skip, max_seconds=max_seconds)
+    envs = [GameEnv(None, frame_skip, max_seconds, encoder=venv.encoder) for _ in range(n)]
+    obs = venv.reset()
+    next_seed = seed
+    for i, env in enumerate(envs):
+        expected = env.reset(next_seed)
+        next_seed += 1
+        if np.abs(expected - obs[i]).max() > OBS_TOLERANCE:
+            return f"reset, env {i}: observations differ"
+
+    rng = np.random.default_rng(seed)
+    rates = np.linspace(0.0, 0.15, n)
+    episodes = 0
+    worst = 0.0
+    for t in range(steps):
+        actions = random_actions(rng, rates)
+        obs, rewards, dones, finished = venv.step(actions)
+        finished = dict(finished)
+        for i, env in enumerate(envs):
+            expected, reward, done, info = env.step(int(actions[i]))
+            if done != dones[i] or abs(reward - rewards[i]) > 1e-6:
+                return f"step {t}, env {i}: reward/done {reward}/{done} vs {rewards[i]}/{dones[i]}"
+            if done:
+                if finished.get(i) != info:
+                    return f"step {t}, env {i}: info {info} vs {finished.get(i)}"
+                episodes += 1
+                expected = env.reset(next_seed)
+                next_seed += 1
+            diff = float(np.abs(expected - obs[i]).max())
+            if diff > OBS_TOLERANCE:
+                return f"step {t}, env {i}: observations differ by {diff}"
+            worst = max(worst, diff)
+    print(f"VecGameEnv == GameEnv: {n} envs, {steps} steps, {episodes} episodes, max obs diff {worst:.1e}")
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--games", type=int, default=24)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--envs", type=int, default=32)
+    parser.add_argument("--steps", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    error = check_sim(args.games, args.ticks, args.seed) or check_env(args.envs, args.steps, args.seed)
+    if error is not None:
+        print("MISMATCH", error)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+combat.py
+באפר של כוונות תקיפה (attack intents) לטיק אחד.
+
+שלב 1: כל התוקפים (לוחמים + שני הטורטים) רושמים לכאן מי הם תוקפים,
+לפי המצב בתחילת הטיק.
+שלב 2: Game.resolve_combat() מחיל את כל הנזק, המוות, הפרסים והאפקטים
+בבת אחת. כך התוצאה לא תלויה בסדר הרשימות, וכל הקרב הוא שלב אחד למדידה.
+"""
+
+import numpy as np
+
+from pool import ColumnBuffer
+
+
+# צד התוקף (אינדקס ל-SIDES)
+SIDES = ("player", "enemy")
+SIDE_PLAYER = 0
+SIDE_ENEMY = 1
+
+# מקור התקיפה
+SOURCE_UNIT = 0
+SOURCE_TURRET = 1
+
+# target = אינדקס לוחם בפול של הצד השני, או TARGET_BASE לבסיס שלו
+TARGET_BASE = -1
+
+
+class CombatBuffer(ColumnBuffer):
+    """
+    מערכים מוקצים מראש: side, source, target, damage לכל כוונת תקיפה.
+    The arrays only grow (doubling) and are reused every tick via clear().
+    """
+
+    _FIELDS = (
+        ("side", np.int8),
+        ("source", np.int8),
+        ("target", np.int64),
+        ("damage", np.int64),
+    )
+
+    def add(self, side, source, targets, damage):
+        """
+        מוסיף בלוק של כוונות: targets = מערך (או מספר בודד) של מטרות,
+        damage = נזק (מספר או מערך באותו אורך).
+        """
+        targets = np.atleast_1d(targets)
+        k = len(targets)
+        if k == 0:
+            return
+        s = self._reserve(k)
+        self.side[s] = side
+        self.source[s] = source
+        self.target[s] = targets
+        self.damage[s] = damage
+
+    def rows(self, side):
+        """
+        אינדקסים של כוונות התקיפה של צד אחד.
+        """
+        return np.flatnonzero(self.side[: self.count] == side)
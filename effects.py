@@ -1,7 +1,11 @@
 import random
 import math
+import numpy as np
 import pygame
 from settings import WIDTH, HEIGHT, GROUND_Y
+from lod import LOD_LEVELS
+from pool import ObjectPool
+from visuals import SPRITES, RenderBatch, SpriteCache, sprite_key, sprite_keys
 
 
 # =========================
@@ -9,56 +13,102 @@ from settings import WIDTH, HEIGHT, GROUND_Y
 # =========================
 
 
-class Particle:
-    """חלקיק אחד קטן (ניצוץ / עשן / אש וכו')."""
-
-    def __init__(self, pos, vel, color, radius, life, fade=True, gravity=300):
-        self.x, self.y = pos
-        self.vx, self.vy = vel
-        self.color = color
-        self.radius = radius
-        self.life = life  # כמה זמן נשאר (במילישניות)
-        self.max_life = life
-        self.fade = fade
-        self.gravity = gravity  # כמה החלקיק "נופל" למטה
-
-    def update(self, dt: int) -> None:
-        """עדכון מיקום, מהירות וזמן חיים.
-
-        dt במילישניות
-        """
-        t = dt / 1000.0
-        self.x += self.vx * t
-        self.y += self.vy * t
-
-        # גרביטציה קלה
-        self.vy += self.gravity * t
-
-        # פחות חיים
-        self.life -= dt
-
-    def draw(self, surface: pygame.Surface) -> None:
-        """ציור החלקיק כעיגול קטן עם אלפא (שקיפות)."""
-        if self.life <= 0:
-            return
-
-        # חישוב אלפא (שקיפות) לפי כמה זמן נשאר
-        alpha = 255
-        if self.fade:
-            alpha = int(255 * (self.life / max(1, self.max_life)))
+class BurstBank:
+    """
+    תבנית מוכנה מראש לסוג אחד של פיצוץ: vx, vy, radius, life לכל חלקיק.
+    vx/vy הן ליחידת speed (spawn_sparks/blood מכפילים ב- speed).
+    take(k) מחזיר התחלה של k רשומות רצופות, וכל קריאה ממשיכה מאיפה שהקודמת
+    עצרה, כך שפיצוצים רצופים לא נראים אותו דבר.
+    """
 
-        size = int(self.radius * 2)
-        temp = pygame.Surface((size, size), pygame.SRCALPHA)
-        c = (*self.color[:3], alpha)
-        pygame.draw.circle(temp, c, (self.radius, self.radius), int(self.radius))
-        surface.blit(temp, (int(self.x - self.radius), int(self.y - self.radius)))
+    __slots__ = ("vx", "vy", "radius", "life", "size", "cursor")
+
+    def __init__(self, vx, vy, radius, life):
+        self.vx = vx.astype(np.float32)
+        self.vy = vy.astype(np.float32)
+        self.radius = radius.astype(np.float32)
+        self.life = life.astype(np.float32)
+        self.size = len(self.vx)
+        self.cursor = 0
+
+    def take(self, k):
+        if self.cursor + k > self.size:
+            self.cursor = 0
+        start = self.cursor
+        self.cursor += k
+        return start
+
+
+def _radial_bank(rng, n, speed_min, speed_max, squash, radius, life):
+    """כיוון אקראי, מהירות בטווח, ורכיב אנכי מכווץ פי squash (כמו פעם)."""
+    ang = rng.uniform(0, 2 * math.pi, n)
+    spd = rng.uniform(speed_min, speed_max, n)
+    return BurstBank(
+        spd * np.cos(ang),
+        spd * np.sin(ang) * squash,
+        rng.uniform(radius[0], radius[1], n),
+        rng.integers(life[0], life[1], n, endpoint=True),
+    )
+
+
+def make_burst_banks(rng, n=512):
+    """תבניות של כל סוגי הפיצוצים, לפי הטווחים המקוריים של כל spawn_*."""
+    return {
+        # sparks/blood: speed fraction, times the speed argument at spawn
+        "sparks": _radial_bank(rng, n, 0.3, 1.0, -0.5, (2, 4), (220, 620)),
+        "blood": _radial_bank(rng, n, 0.2, 1.0, -0.3, (2, 5), (450, 950)),
+        "explosion": _radial_bank(rng, n, 60, 310, -0.2, (3, 7), (520, 1100)),
+        "smoke": BurstBank(
+            rng.uniform(-20, 20, n),
+            rng.uniform(-40, -10, n),
+            rng.uniform(8, 16, n),
+            rng.integers(800, 1600, n, endpoint=True),
+        ),
+    }
 
 
 class ParticleSystem:
-    """מערכת שמחזיקה את כל החלקיקים במשחק (ניצוצות, פיצוצים, עשן וכו')."""
+    """
+    כל החלקיקים במשחק (ניצוצות, פיצוצים, עשן וכו') כמערכים (struct-of-arrays):
+    x, y, vx, vy, life, max_life, radius, gravity ו-color (שורה של RGB לכל חלקיק).
+
+    המערכים בגודל קבוע (capacity) ומשמשים כ-ring buffer: חלקיק חדש נכתב
+    במקום הבא אחרי האחרון, וכשהמערך מלא הוא דורס את הישן ביותר (evicted).
+    update() הוא כמה פעולות NumPy על [0, used), בלי לולאה לכל חלקיק.
+    spawn_sparks/blood/smoke/explosion מעתיקים קטע מ- BurstBank (banks),
+    כך שהמחיר כמעט לא תלוי ב- count.
+    """
+
+    _FIELDS = ("x", "y", "vx", "vy", "life", "max_life", "radius", "gravity")
 
-    def __init__(self) -> None:
-        self.particles: list[Particle] = []
+    def __init__(
+        self,
+        rng: random.Random | None = None,
+        capacity: int = 4096,
+        sprites: SpriteCache | None = None,
+        bank_size: int = 512,
+    ) -> None:
+        self.capacity = capacity
+        for name in self._FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.head = 0  # המקום הבא לכתיבה
+        self.used = 0  # כמה מקומות נכתבו אי פעם (עד capacity)
+        self.count = 0  # כמה חלקיקים חיים
+        self.evicted = 0  # חלקיקים חיים שנדרסו כי המערך היה מלא
+        # RNG משלו (NumPy) שנגזר מה-RNG של המשחק: seed קבוע = אותם חלקיקים בכל הרצה
+        if rng is None:
+            rng = random.Random()
+        self.rng = np.random.default_rng(rng.getrandbits(64))
+        # תבניות מוכנות לכל סוג פיצוץ (מה-RNG הזה, פעם אחת)
+        self.banks = make_burst_banks(self.rng, bank_size)
+        # עיגולים מוכנים לציור (משותף גם לעותקים של snapshot)
+        self.sprites = sprites if sprites is not None else SpriteCache()
+        # רמת פירוט (lod.py); LodGovernor מחליף אותה תוך כדי משחק
+        self.lod = LOD_LEVELS[0]
+
+    def __len__(self) -> int:
+        return self.count
 
     # ---------- סוגי חלקיקים נוחים לשימוש ----------
 
@@ -70,17 +120,7 @@ class ParticleSystem:
         speed: float = 180,
     ) -> None:
         """ניצוצות קטנים (ירי / פגיעה)."""
-        px, py = pos
-        for _ in range(count):
-            ang = random.uniform(0, 2 * math.pi)
-            spd = random.uniform(0.3 * speed, 1.0 * speed)
-            vx = spd * math.cos(ang)
-            vy = spd * math.sin(ang) * -0.5
-            r = random.uniform(2, 4)
-            life = random.randint(220, 620)
-            self.particles.append(
-                Particle((px, py), (vx, vy), color, r, life, fade=True, gravity=260)
-            )
+        self._burst(self.banks["sparks"], count, pos[0], pos[1], color, 260, speed)
 
     def spawn_blood(
         self,
@@ -90,37 +130,13 @@ class ParticleSystem:
         speed: float = 120,
     ) -> None:
         """קשת חלקיקים אדומים – אפשר להשתמש כ"דם" אם תרצה."""
-        px, py = pos
-        for _ in range(count):
-            ang = random.uniform(0, 2 * math.pi)
-            spd = random.uniform(0.2 * speed, 1.0 * speed)
-            vx = spd * math.cos(ang)
-            vy = spd * math.sin(ang) * -0.3
-            r = random.uniform(2, 5)
-            life = random.randint(450, 950)
-            self.particles.append(
-                Particle((px, py), (vx, vy), color, r, life, fade=True, gravity=320)
-            )
+        self._burst(self.banks["blood"], count, pos[0], pos[1], color, 320, speed)
 
     def spawn_smoke(self, pos: tuple[float, float], count: int = 6) -> None:
-        """עשן שעולה למעלה (אפור)."""
-        px, py = pos
-        for _ in range(count):
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-40, -10)
-            r = random.uniform(8, 16)
-            life = random.randint(800, 1600)
-            self.particles.append(
-                Particle(
-                    (px, py),
-                    (vx, vy),
-                    (80, 80, 80),
-                    r,
-                    life,
-                    fade=True,
-                    gravity=35,
-                )
-            )
+        """עשן שעולה למעלה (אפור). ברמות LOD גבוהות אין עשן בכלל."""
+        if not self.lod.smoke:
+            return
+        self._burst(self.banks["smoke"], count, pos[0], pos[1], (80, 80, 80), 35)
 
     def spawn_explosion(
         self,
@@ -130,16 +146,7 @@ class ParticleSystem:
     ) -> None:
         """פיצוץ – כדורים זוהרים שמתפזרים לכל הכיוונים + קצת עשן."""
         px, py = pos
-        for _ in range(count):
-            ang = random.uniform(0, 2 * math.pi)
-            spd = random.uniform(60, 310)
-            vx = spd * math.cos(ang)
-            vy = spd * math.sin(ang) * -0.2
-            r = random.uniform(3, 7)
-            life = random.randint(520, 1100)
-            self.particles.append(
-                Particle((px, py), (vx, vy), color, r, life, fade=True, gravity=260)
-            )
+        self._burst(self.banks["explosion"], count, px, py, color, 260)
 
         # עשן עבה מעל הפיצוץ
         self.spawn_smoke((px, py - 10), count=8)
@@ -152,30 +159,125 @@ class ParticleSystem:
         life: int = 130,
     ) -> None:
         """שובל ירי לאורך קו (מספר חלקיקים קטנים מאוד)."""
-        sx, sy = start
-        ex, ey = end
-        steps = 6
-        for i in range(steps + 1):
-            t = i / steps
-            x = sx + (ex - sx) * t
-            y = sy + (ey - sy) * t
-            r = random.uniform(1.5, 3.0)
-            self.particles.append(
-                Particle((x, y), (0, 0), color, r, life, fade=True, gravity=0)
-            )
+        # 7 points at full detail, fewer (or none) under load
+        points = self.lod.tracers
+        if points == 0:
+            return
+        t = np.linspace(0.0, 1.0, points)
+        x = start[0] + (end[0] - start[0]) * t
+        y = start[1] + (end[1] - start[1]) * t
+        self._emit(x, y, 0.0, 0.0, color, (1.5, 3.0), (life, life), 0)
 
-    def update(self, dt: int) -> None:
-        """עדכון כל החלקיקים וניקוי מתים."""
-        alive: list[Particle] = []
-        for p in self.particles:
-            p.update(dt)
-            if p.life > 0:
-                alive.append(p)
-        self.particles = alive
+    def _burst(self, bank, count, px, py, color, gravity, speed=1.0) -> None:
+        """
+        count חלקיקים מ- bank, כולם מ- (px, py): העתקה של קטע רציף מה-bank
+        לקטע רציף במערכים (או שניים, אם ה-ring נגמר באמצע), בלי RNG.
+        """
+        k = min(self.lod.count(count), bank.size, self.capacity)
+        if k == 0:
+            return
+        src = bank.take(k)
+        head = self.head
+        first = min(k, self.capacity - head)
+        self._copy(head, src, first, bank, px, py, color, gravity, speed)
+        if first < k:
+            self._copy(0, src + first, k - first, bank, px, py, color, gravity, speed)
+        self.head = (head + k) % self.capacity
+        self.used = min(self.capacity, self.used + k)
+
+    def _copy(self, dst, src, k, bank, px, py, color, gravity, speed) -> None:
+        d = slice(dst, dst + k)
+        s = slice(src, src + k)
+        # הישנים ביותר נדרסים
+        alive = int(np.count_nonzero(self.life[d] > 0))
+        self.evicted += alive
+        self.count += k - alive
+
+        self.x[d] = px
+        self.y[d] = py
+        np.multiply(bank.vx[s], speed, out=self.vx[d])
+        np.multiply(bank.vy[s], speed, out=self.vy[d])
+        self.radius[d] = bank.radius[s]
+        np.multiply(bank.life[s], self.lod.life, out=self.life[d])
+        self.max_life[d] = self.life[d]
+        self.gravity[d] = gravity
+        self.color[d] = color[:3]
+
+    def _emit(self, x, y, vx, vy, color, radius, life, gravity) -> None:
+        """
+        בלוק של חלקיקים חדשים. x/y/vx/vy = מספר או מערך; radius = (min, max),
+        life = (min, max) במילישניות (כולל, לפני lod.life). הגודל נקבע לפי המערך הארוך.
+        """
+        k = max(np.size(x), np.size(vx))
+        cap = self.capacity
+        if k > cap:
+            # more than fit at once: only the last cap would survive anyway
+            x, y, vx, vy = (np.broadcast_to(a, k)[-cap:] for a in (x, y, vx, vy))
+            k = cap
+        idx = (self.head + np.arange(k)) % cap
+
+        # הישנים ביותר נדרסים
+        alive = int(np.count_nonzero(self.life[idx] > 0))
+        self.evicted += alive
+        self.count += k - alive
+
+        lo, hi = life
+        if self.lod.life != 1.0:
+            lo = int(lo * self.lod.life)
+            hi = int(hi * self.lod.life)
+        self.x[idx] = x
+        self.y[idx] = y
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+        self.radius[idx] = self.rng.uniform(radius[0], radius[1], k)
+        self.life[idx] = self.rng.integers(lo, hi, k, endpoint=True) if hi > lo else lo
+        self.max_life[idx] = self.life[idx]
+        self.gravity[idx] = gravity
+        self.color[idx] = color[:3]
+        self.head = (self.head + k) % cap
+        self.used = min(cap, self.used + k)
 
-    def draw(self, surface: pygame.Surface) -> None:
-        for p in self.particles:
-            p.draw(surface)
+    def update(self, dt: int) -> None:
+        """עדכון מיקום, מהירות (גרביטציה) וזמן חיים לכולם בבת אחת. dt במילישניות."""
+        if self.count == 0:
+            return
+        n = self.used
+        t = dt / 1000.0
+        x, y, vy = self.x[:n], self.y[:n], self.vy[:n]
+        x += self.vx[:n] * t
+        y += vy * t
+        vy += self.gravity[:n] * t
+        life = self.life[:n]
+        life -= dt
+        self.count = int(np.count_nonzero(life > 0))
+
+    def draw(self, surface: pygame.Surface, batch: RenderBatch | None = None) -> None:
+        """
+        כל חלקיק הוא עיגול מוכן מה- SpriteCache (לפי צבע, רדיוס ואלפא
+        מקוונטזים). הזוגות (sprite, מיקום) נאספים לשכבה "particles" של batch;
+        בלי batch הם מצוירים מיד בקריאת blits אחת.
+        """
+        if self.count == 0:
+            return
+        n = self.used
+        live = np.flatnonzero(self.life[:n] > 0)
+        alpha = (255 * self.life[live] / np.maximum(1, self.max_life[live])).astype(np.intp)
+        keys, half = sprite_keys(self.color[live], self.radius[live], alpha)
+        # alpha level 0 is invisible; under load the faintest ones are skipped too
+        visible = (keys & 0xF) >= self.lod.min_alpha
+        px = (self.x[live] - half)[visible].astype(np.intp)
+        py = (self.y[live] - half)[visible].astype(np.intp)
+        # one cache lookup per distinct sprite, then gather per particle
+        uniq, inv = np.unique(keys[visible], return_inverse=True)
+        table = np.empty(len(uniq), dtype=object)
+        table[:] = [self.sprites.get(key) for key in uniq.tolist()]
+        pairs = zip(table[inv].tolist(), zip(px.tolist(), py.tolist()))
+        if batch is None:
+            batch = RenderBatch()
+            batch.extend("particles", pairs)
+            batch.flush(surface, "particles")
+        else:
+            batch.extend("particles", pairs)
 
 
 # =========================
@@ -183,6 +285,83 @@ class ParticleSystem:
 # =========================
 
 
+# שחקני הרקע: מחלקות קטנות עם __slots__ (במקום dict לכל אחד)
+
+
+class Cloud:
+    __slots__ = ("x", "y", "w", "speed", "alpha", "layer")
+
+    def __init__(self, x, y, w, speed, alpha, layer):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.speed = speed
+        self.alpha = alpha
+        self.layer = layer
+
+
+class Gunship:
+    __slots__ = ("x", "y", "vx", "phase", "size")
+
+    def __init__(self, x, y, vx, phase, size):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.phase = phase
+        self.size = size
+
+
+class Drone:
+    __slots__ = ("x", "y", "vx", "timer")
+
+    def __init__(self, x, y, vx, timer=0):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.timer = timer
+
+
+class Searchlight:
+    __slots__ = ("x", "y", "base_angle", "sweep_speed", "length", "width", "phase")
+
+    def __init__(self, x, y, base_angle, sweep_speed, length, width, phase):
+        self.x = x
+        self.y = y
+        self.base_angle = base_angle
+        self.sweep_speed = sweep_speed
+        self.length = length
+        self.width = width
+        self.phase = phase
+
+
+class HorizonFire:
+    __slots__ = ("x", "y", "size")
+
+    def __init__(self, x, y, size):
+        self.x = x
+        self.y = y
+        self.size = size
+
+
+class Missile:
+    __slots__ = ("x", "y", "vx", "vy", "life", "max_life")
+
+    def __init__(self, x=0.0, y=0.0, vx=0.0, vy=0.0, life=0):
+        self.reset(x, y, vx, vy, life)
+
+    def reset(self, x, y, vx, vy, life):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.life = life
+        self.max_life = life
+
+
+def _has_life(m: Missile) -> bool:
+    return m.life > 0
+
+
 class Background:
     """רקע עתידני מלחמתי.
 
@@ -197,8 +376,17 @@ class Background:
     - ויגנטה כהה שמסגרת את כל התמונה
     """
 
-    def __init__(self, particles: ParticleSystem | None = None) -> None:
+    def __init__(
+        self,
+        particles: ParticleSystem | None = None,
+        rng: random.Random | None = None,
+        render_rng: random.Random | None = None,
+    ) -> None:
         self.particles = particles
+        self.rng = rng if rng is not None else random.Random()
+        # draw() runs at render FPS, so its flicker uses a separate stream
+        # and never consumes numbers from self.rng (which drives update())
+        self.render_rng = render_rng if render_rng is not None else random.Random()
 
         # זמן מצטבר למטרת אנימציות (ms)
         self.time = 0
@@ -208,76 +396,56 @@ class Background:
         self._build_static_background()
 
         # שכבות עננים (פרלקסה)
-        self.clouds: list[dict] = []
+        self.clouds: list[Cloud] = []
         for i in range(6):
-            y = random.randint(40, HEIGHT // 2)
-            speed = random.uniform(14 + i * 2.0, 26 + i * 2.8)
-            w = random.randint(240, 560)
-            alpha = random.randint(35, 75)
-            self.clouds.append(
-                {
-                    "x": random.randint(-w, WIDTH),
-                    "y": y,
-                    "w": w,
-                    "speed": speed,
-                    "alpha": alpha,
-                    "layer": i,
-                }
-            )
+            y = self.rng.randint(40, HEIGHT // 2)
+            speed = self.rng.uniform(14 + i * 2.0, 26 + i * 2.8)
+            w = self.rng.randint(240, 560)
+            alpha = self.rng.randint(35, 75)
+            self.clouds.append(Cloud(self.rng.randint(-w, WIDTH), y, w, speed, alpha, i))
 
         # ספינות גדולות בשמיים
-        self.gunships: list[dict] = []
+        self.gunships: list[Gunship] = []
         for _ in range(3):
-            sx = random.randint(-260, WIDTH + 260)
-            sy = random.randint(70, HEIGHT // 2 - 60)
-            vx = random.choice([1, -1]) * random.uniform(40, 70)
-            phase = random.uniform(0, 2 * math.pi)
-            size = random.randint(42, 70)
-            self.gunships.append(
-                {"x": sx, "y": sy, "vx": vx, "phase": phase, "size": size}
-            )
+            sx = self.rng.randint(-260, WIDTH + 260)
+            sy = self.rng.randint(70, HEIGHT // 2 - 60)
+            vx = self.rng.choice([1, -1]) * self.rng.uniform(40, 70)
+            phase = self.rng.uniform(0, 2 * math.pi)
+            size = self.rng.randint(42, 70)
+            self.gunships.append(Gunship(sx, sy, vx, phase, size))
 
         # דרונים קטנים ומהירים
-        self.drones: list[dict] = []
+        self.drones: list[Drone] = []
         for _ in range(6):
-            sx = random.randint(-150, WIDTH + 150)
-            sy = random.randint(40, HEIGHT // 2 - 40)
-            vx = random.choice([1, -1]) * random.uniform(65, 130)
-            self.drones.append({"x": sx, "y": sy, "vx": vx, "timer": 0})
+            sx = self.rng.randint(-150, WIDTH + 150)
+            sy = self.rng.randint(40, HEIGHT // 2 - 40)
+            vx = self.rng.choice([1, -1]) * self.rng.uniform(65, 130)
+            self.drones.append(Drone(sx, sy, vx))
 
         # זרקורים (searchlights)
-        self.searchlights: list[dict] = []
+        self.searchlights: list[Searchlight] = []
         city_line_y = int(HEIGHT * 0.58)
         for _ in range(4):
-            bx = random.randint(40, WIDTH - 40)
+            bx = self.rng.randint(40, WIDTH - 40)
             by = city_line_y
-            base_angle = random.uniform(-0.8, 0.2)
-            sweep_speed = random.uniform(0.5, 0.85)
-            length = random.randint(190, 260)
-            width = random.randint(35, 55)
+            base_angle = self.rng.uniform(-0.8, 0.2)
+            sweep_speed = self.rng.uniform(0.5, 0.85)
+            length = self.rng.randint(190, 260)
+            width = self.rng.randint(35, 55)
+            phase = self.rng.uniform(0, 2 * math.pi)
             self.searchlights.append(
-                {
-                    "x": bx,
-                    "y": by,
-                    "base_angle": base_angle,
-                    "sweep_speed": sweep_speed,
-                    "length": length,
-                    "width": width,
-                    "phase": random.uniform(0, 2 * math.pi),
-                }
+                Searchlight(bx, by, base_angle, sweep_speed, length, width, phase)
             )
 
         # מוקדי אש ועשן על האופק
-        self.horizon_fires: list[dict] = []
+        self.horizon_fires: list[HorizonFire] = []
         for _ in range(6):
-            fx = random.randint(40, WIDTH - 40)
-            fy = city_line_y + random.randint(10, 40)
-            self.horizon_fires.append(
-                {"x": fx, "y": fy, "size": random.randint(18, 30)}
-            )
+            fx = self.rng.randint(40, WIDTH - 40)
+            fy = city_line_y + self.rng.randint(10, 40)
+            self.horizon_fires.append(HorizonFire(fx, fy, self.rng.randint(18, 30)))
 
-        # טילים / פצצות
-        self.missiles: list[dict] = []
+        # טילים / פצצות (pool לשימוש חוזר)
+        self.missiles = ObjectPool(Missile)
         self.next_missile_time = 1500
 
         # פיצוצים רחוקים על האופק
@@ -333,9 +501,9 @@ class Background:
 
         # כוכבים בשמיים
         for _ in range(120):
-            sx = random.randint(0, WIDTH - 1)
-            sy = random.randint(0, HEIGHT // 2)
-            brightness = random.randint(150, 255)
+            sx = self.rng.randint(0, WIDTH - 1)
+            sy = self.rng.randint(0, HEIGHT // 2)
+            brightness = self.rng.randint(150, 255)
             surf.set_at((sx, sy), (brightness, brightness, brightness))
 
         # קו אופק עם עיר הרוסה
@@ -343,57 +511,57 @@ class Background:
         x = -60
         buildings: list[tuple[int, int, int, int]] = []
         while x < WIDTH + 80:
-            w = random.randint(40, 120)
-            h = random.randint(50, 150)
+            w = self.rng.randint(40, 120)
+            h = self.rng.randint(50, 150)
             b_x = x
             b_y = city_y - h
             color = (22, 24, 32)
             pygame.draw.rect(surf, color, (b_x, b_y, w, h))
 
             # גג שבור/משונן
-            if random.random() < 0.4:
+            if self.rng.random() < 0.4:
                 pts = [
                     (b_x, b_y),
                     (b_x + w, b_y),
                     (b_x + w, b_y + 8),
                 ]
                 for i in range(0, w, 10):
-                    pts.append((b_x + i, b_y + random.randint(0, 12)))
+                    pts.append((b_x + i, b_y + self.rng.randint(0, 12)))
                 pygame.draw.polygon(surf, color, pts)
 
             buildings.append((b_x, b_y, w, h))
-            x += random.randint(35, 120)
+            x += self.rng.randint(35, 120)
 
         # חלונות – חלקם כבויים, חלקם דולקים (אווירה אחרי קרב)
         for (bx, by, bw, bh) in buildings:
             for i in range(0, bw, 10):
                 for j in range(8, bh - 10, 14):
-                    if random.random() < 0.12:
-                        wx = bx + i + random.randint(0, 4)
-                        wy = by + j + random.randint(0, 3)
-                        if random.random() < 0.65:
+                    if self.rng.random() < 0.12:
+                        wx = bx + i + self.rng.randint(0, 4)
+                        wy = by + j + self.rng.randint(0, 3)
+                        if self.rng.random() < 0.65:
                             w_color = (
-                                random.randint(120, 230),
-                                random.randint(90, 180),
-                                random.randint(40, 120),
+                                self.rng.randint(120, 230),
+                                self.rng.randint(90, 180),
+                                self.rng.randint(40, 120),
                             )
                         else:
                             # אש בוערת בפנים
                             w_color = (
-                                random.randint(200, 255),
-                                random.randint(100, 160),
-                                random.randint(60, 120),
+                                self.rng.randint(200, 255),
+                                self.rng.randint(100, 160),
+                                self.rng.randint(60, 120),
                             )
                         pygame.draw.rect(surf, w_color, (wx, wy, 4, 6))
 
         # שכבת עשן דקה מעל העיר כדי לחזק תחושת מלחמה
         smoke = pygame.Surface((WIDTH, HEIGHT // 3), pygame.SRCALPHA)
         for i in range(6):
-            wx = random.randint(0, WIDTH - 200)
-            wy = random.randint(0, smoke.get_height() - 60)
-            ww = random.randint(200, 420)
-            wh = random.randint(40, 120)
-            alpha = random.randint(25, 60)
+            wx = self.rng.randint(0, WIDTH - 200)
+            wy = self.rng.randint(0, smoke.get_height() - 60)
+            ww = self.rng.randint(200, 420)
+            wh = self.rng.randint(40, 120)
+            alpha = self.rng.randint(25, 60)
             pygame.draw.ellipse(
                 smoke,
                 (30, 40, 50, alpha),
@@ -405,31 +573,31 @@ class Background:
 
     def _update_clouds(self, dt: int) -> None:
         for c in self.clouds:
-            layer_factor = 0.4 + c["layer"] * 0.12
-            c["x"] += c["speed"] * (dt / 1000.0) * layer_factor
-            if c["x"] - c["w"] > WIDTH + 60:
-                c["x"] = -c["w"] - random.randint(50, 200)
-                c["y"] = random.randint(40, HEIGHT // 2)
+            layer_factor = 0.4 + c.layer * 0.12
+            c.x += c.speed * (dt / 1000.0) * layer_factor
+            if c.x - c.w > WIDTH + 60:
+                c.x = -c.w - self.rng.randint(50, 200)
+                c.y = self.rng.randint(40, HEIGHT // 2)
 
     def _update_gunships(self, dt: int) -> None:
         t = self.time / 1000.0
         for ship in self.gunships:
-            ship["x"] += ship["vx"] * (dt / 1000.0)
-            ship["y"] += math.sin(t * 0.45 + ship["phase"]) * 0.08 * dt
-
-            if ship["vx"] > 0 and ship["x"] > WIDTH + 220:
-                ship["x"] = -220
-                ship["y"] = random.randint(60, HEIGHT // 2 - 60)
-                ship["phase"] = random.uniform(0, 2 * math.pi)
-            elif ship["vx"] < 0 and ship["x"] < -220:
-                ship["x"] = WIDTH + 220
-                ship["y"] = random.randint(60, HEIGHT // 2 - 60)
-                ship["phase"] = random.uniform(0, 2 * math.pi)
+            ship.x += ship.vx * (dt / 1000.0)
+            ship.y += math.sin(t * 0.45 + ship.phase) * 0.08 * dt
+
+            if ship.vx > 0 and ship.x > WIDTH + 220:
+                ship.x = -220
+                ship.y = self.rng.randint(60, HEIGHT // 2 - 60)
+                ship.phase = self.rng.uniform(0, 2 * math.pi)
+            elif ship.vx < 0 and ship.x < -220:
+                ship.x = WIDTH + 220
+                ship.y = self.rng.randint(60, HEIGHT // 2 - 60)
+                ship.phase = self.rng.uniform(0, 2 * math.pi)
 
             # ירי / ניצוצות מנועים
-            if self.particles is not None and random.random() < 0.003:
-                muzzle_x = ship["x"] + random.randint(-6, 6)
-                muzzle_y = ship["y"] + random.randint(8, 18)
+            if self.particles is not None and self.rng.random() < 0.003:
+                muzzle_x = ship.x + self.rng.randint(-6, 6)
+                muzzle_y = ship.y + self.rng.randint(8, 18)
                 self.particles.spawn_sparks(
                     (muzzle_x, muzzle_y),
                     color=(255, 200, 150),
@@ -439,23 +607,23 @@ class Background:
 
     def _update_drones(self, dt: int) -> None:
         for d in self.drones:
-            d["x"] += d["vx"] * (dt / 1000.0)
-            d["timer"] += dt
-            d["y"] += math.sin(self.time / 420.0 + d["x"] * 0.01) * 0.04 * dt
-
-            if d["vx"] > 0 and d["x"] > WIDTH + 120:
-                d["x"] = -120
-                d["y"] = random.randint(40, HEIGHT // 2 - 40)
-                d["timer"] = 0
-            elif d["vx"] < 0 and d["x"] < -120:
-                d["x"] = WIDTH + 120
-                d["y"] = random.randint(40, HEIGHT // 2 - 40)
-                d["timer"] = 0
-
-            if self.particles is not None and d["timer"] > random.randint(320, 880):
-                d["timer"] = 0
+            d.x += d.vx * (dt / 1000.0)
+            d.timer += dt
+            d.y += math.sin(self.time / 420.0 + d.x * 0.01) * 0.04 * dt
+
+            if d.vx > 0 and d.x > WIDTH + 120:
+                d.x = -120
+                d.y = self.rng.randint(40, HEIGHT // 2 - 40)
+                d.timer = 0
+            elif d.vx < 0 and d.x < -120:
+                d.x = WIDTH + 120
+                d.y = self.rng.randint(40, HEIGHT // 2 - 40)
+                d.timer = 0
+
+            if self.particles is not None and d.timer > self.rng.randint(320, 880):
+                d.timer = 0
                 self.particles.spawn_sparks(
-                    (int(d["x"]), int(d["y"])),
+                    (int(d.x), int(d.y)),
                     color=(200, 110, 255),
                     count=3,
                     speed=90,
@@ -464,69 +632,58 @@ class Background:
     def _update_missiles(self, dt: int) -> None:
         # שיגור טיל חדש כל פרק זמן
         if self.time > self.next_missile_time:
-            self.next_missile_time = self.time + random.randint(2200, 5200)
-            if random.random() < 0.8:
-                side = random.choice(["left", "right"])
+            self.next_missile_time = self.time + self.rng.randint(2200, 5200)
+            if self.rng.random() < 0.8:
+                side = self.rng.choice(["left", "right"])
                 if side == "left":
                     x = -50
-                    vx = random.uniform(140, 230)
+                    vx = self.rng.uniform(140, 230)
                 else:
                     x = WIDTH + 50
-                    vx = random.uniform(-230, -140)
-
-                y = random.randint(80, HEIGHT // 2 - 30)
-                vy = random.uniform(-15, 15)
-                life = random.randint(1700, 2600)
-                self.missiles.append(
-                    {
-                        "x": x,
-                        "y": y,
-                        "vx": vx,
-                        "vy": vy,
-                        "life": life,
-                        "max_life": life,
-                    }
-                )
+                    vx = self.rng.uniform(-230, -140)
+
+                y = self.rng.randint(80, HEIGHT // 2 - 30)
+                vy = self.rng.uniform(-15, 15)
+                life = self.rng.randint(1700, 2600)
+                self.missiles.acquire().reset(x, y, vx, vy, life)
 
-        alive: list[dict] = []
         for m in self.missiles:
             t = dt / 1000.0
-            m["x"] += m["vx"] * t
-            m["y"] += m["vy"] * t
-            m["vy"] += 28 * t
-            m["life"] -= dt
-
-            if self.particles is not None and random.random() < 0.65:
-                tail_x = m["x"] - m["vx"] * 0.03
-                tail_y = m["y"] - m["vy"] * 0.03
+            m.x += m.vx * t
+            m.y += m.vy * t
+            m.vy += 28 * t
+            m.life -= dt
+
+            if self.particles is not None and self.rng.random() < 0.65:
+                tail_x = m.x - m.vx * 0.03
+                tail_y = m.y - m.vy * 0.03
                 self.particles.spawn_tracer(
-                    (m["x"], m["y"]), (tail_x, tail_y), color=(255, 245, 220), life=220
+                    (m.x, m.y), (tail_x, tail_y), color=(255, 245, 220), life=220
                 )
 
             # תנאי פיצוץ
             if (
-                m["life"] <= 0
-                or m["y"] > GROUND_Y - 30
-                or m["x"] < -90
-                or m["x"] > WIDTH + 90
+                m.life <= 0
+                or m.y > GROUND_Y - 30
+                or m.x < -90
+                or m.x > WIDTH + 90
             ):
+                m.life = 0
                 if self.particles is not None:
                     self.particles.spawn_explosion(
-                        (m["x"], min(m["y"], GROUND_Y - 20)),
+                        (m.x, min(m.y, GROUND_Y - 20)),
                         color=(255, 150, 95),
                         count=22,
                     )
-            else:
-                alive.append(m)
-        self.missiles = alive
+        self.missiles.sweep(_has_life)
 
     def _update_far_explosions(self, dt: int) -> None:
         if self.particles is None:
             return
         if self.time > self.next_far_explosion_time:
-            self.next_far_explosion_time = self.time + random.randint(1600, 4200)
-            ex_x = random.randint(80, WIDTH - 80)
-            ex_y = random.randint(int(HEIGHT * 0.48), int(HEIGHT * 0.62))
+            self.next_far_explosion_time = self.time + self.rng.randint(1600, 4200)
+            ex_x = self.rng.randint(80, WIDTH - 80)
+            ex_y = self.rng.randint(int(HEIGHT * 0.48), int(HEIGHT * 0.62))
             self.particles.spawn_explosion(
                 (ex_x, ex_y), color=(255, 135, 80), count=14
             )
@@ -544,25 +701,25 @@ class Background:
 
     def _draw_clouds(self, surface: pygame.Surface) -> None:
         for c in self.clouds:
-            w = c["w"]
+            w = c.w
             h = 72
             cloud_surface = pygame.Surface((w, h), pygame.SRCALPHA)
-            alpha = c["alpha"]
+            alpha = c.alpha
             pygame.draw.ellipse(
                 cloud_surface,
                 (35, 60, 80, alpha),
                 (0, 0, w, h),
             )
-            surface.blit(cloud_surface, (int(c["x"]), int(c["y"])))
+            surface.blit(cloud_surface, (int(c.x), int(c.y)))
 
     def _draw_horizon_fires(self, surface: pygame.Surface) -> None:
         for f in self.horizon_fires:
-            x = f["x"]
-            y = f["y"]
-            size = f["size"]
+            x = f.x
+            y = f.y
+            size = f.size
 
             flame = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            base = random.randint(170, 255)
+            base = self.render_rng.randint(170, 255)
             color = (base, int(base * 0.6), int(base * 0.3), 190)
             pygame.draw.circle(flame, color, (size, size), size)
             surface.blit(flame, (x - size, y - size))
@@ -570,11 +727,11 @@ class Background:
     def _draw_searchlights(self, surface: pygame.Surface) -> None:
         light_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         for s in self.searchlights:
-            bx, by = s["x"], s["y"]
-            base_angle = s["base_angle"]
-            sweep_speed = s["sweep_speed"]
-            length = s["length"]
-            phase = s["phase"]
+            bx, by = s.x, s.y
+            base_angle = s.base_angle
+            sweep_speed = s.sweep_speed
+            length = s.length
+            phase = s.phase
 
             t = self.time / 1000.0
             angle = base_angle + math.sin(t * sweep_speed + phase) * 0.55
@@ -598,9 +755,9 @@ class Background:
 
     def _draw_gunships(self, surface: pygame.Surface) -> None:
         for ship in self.gunships:
-            x = int(ship["x"])
-            y = int(ship["y"])
-            size = ship["size"]
+            x = int(ship.x)
+            y = int(ship.y)
+            size = ship.size
 
             body_w = size
             body_h = size // 4
@@ -622,7 +779,7 @@ class Background:
             pygame.draw.rect(surface, (120, 145, 195), bridge_rect, border_radius=5)
 
             for i in range(-body_w // 2 + 6, body_w // 2 - 4, 11):
-                if random.random() < 0.6:
+                if self.render_rng.random() < 0.6:
                     pygame.draw.rect(
                         surface,
                         (235, 225, 170),
@@ -631,15 +788,17 @@ class Background:
 
             engine = pygame.Surface((12, 12), pygame.SRCALPHA)
             pygame.draw.circle(engine, (150, 220, 255, 210), (6, 6), 5)
-            if ship["vx"] > 0:
+            if ship.vx > 0:
                 surface.blit(engine, (body_rect.left - 6, y - 4))
             else:
                 surface.blit(engine, (body_rect.right - 6, y - 4))
 
-    def _draw_drones(self, surface: pygame.Surface) -> None:
+    def _draw_drones(self, surface: pygame.Surface, batch: RenderBatch) -> None:
+        key, half = sprite_key((200, 120, 255), 3, 190)
+        glow = SPRITES.get(key)
         for d in self.drones:
-            dx = int(d["x"])
-            dy = int(d["y"])
+            dx = int(d.x)
+            dy = int(d.y)
 
             pygame.draw.polygon(
                 surface,
@@ -654,20 +813,17 @@ class Background:
                 2,
             )
 
-            glow = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (200, 120, 255, 190), (3, 3), 3)
-            surface.blit(glow, (dx - 3, dy + 3))
+            batch.add("drones", glow, (dx - half, dy + 6 - half))
+        batch.flush(surface, "drones")
 
-    def _draw_missiles(self, surface: pygame.Surface) -> None:
+    def _draw_missiles(self, surface: pygame.Surface, batch: RenderBatch) -> None:
         for m in self.missiles:
-            x = int(m["x"])
-            y = int(m["y"])
-            alpha = max(80, int(220 * (m["life"] / max(1, m["max_life"]))))
-            color = (255, 240, 210, alpha)
-
-            missile_surf = pygame.Surface((10, 10), pygame.SRCALPHA)
-            pygame.draw.circle(missile_surf, color, (5, 5), 4)
-            surface.blit(missile_surf, (x - 5, y - 5))
+            x = int(m.x)
+            y = int(m.y)
+            alpha = max(80, int(220 * (m.life / max(1, m.max_life))))
+            key, half = sprite_key((255, 240, 210), 4, alpha)
+            batch.add("missiles", SPRITES.get(key), (x - half, y - half))
+        batch.flush(surface, "missiles")
 
     def _draw_vignette(self, surface: pygame.Surface) -> None:
         vign = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -681,17 +837,20 @@ class Background:
             )
         surface.blit(vign, (0, 0))
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface, batch: RenderBatch | None = None) -> None:
         """ציור הרקע השלם.
 
         החלקיקים עצמם (פיצוצים, ניצוצות וכו') מצוירים ע"י ParticleSystem
         מחוץ למחלקה הזו – כאן מצויר רק הרקע והאלמנטים ה"רחוקים".
+        הדרונים והטילים נאספים ל-batch ומצוירים בקריאת blits אחת לכל שכבה.
         """
+        if batch is None:
+            batch = RenderBatch()
         surface.blit(self.base_surface, (0, 0))
         self._draw_clouds(surface)
         self._draw_horizon_fires(surface)
         self._draw_searchlights(surface)
         self._draw_gunships(surface)
-        self._draw_drones(surface)
-        self._draw_missiles(surface)
+        self._draw_drones(surface, batch)
+        self._draw_missiles(surface, batch)
         self._draw_vignette(surface)
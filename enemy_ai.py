@@ -0,0 +1,192 @@
+"""
+enemy_ai.py
+AI לצד של האויב: כל Policy מ-policies.py (או כל אובייקט עם reset/act)
+מקבלת את המשחק "מהצד של האויב" ומחליטה על ACTION_* מאותה כלכלה של השחקן.
+
+    game = Game(enemy_policy=EnemyAI(make_policy("greedy"), budget_ms=2))
+    game = Game(enemy_policy=EnemyAI(SlowPolicy(), worker="thread"))
+
+worker=None   -> act() רץ בתוך הטיק (דטרמיניסטי; ל-batch, replay ו-env).
+worker="thread" / "process" -> act() רץ ברקע על עותק (clone) של המשחק; הטיק
+לא מחכה לו אף פעם, והפעולה מוחלת כשהיא מוכנה. לא דטרמיניסטי (תלוי בזמנים).
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+
+from game import ACTION_NOOP
+
+
+class EnemyView:
+    """
+    Game מהצד של האויב: money/xp/turret/units/bases מוחלפים, כך שאותה Policy
+    שנכתבה לשחקן עובדת גם לאויב. deadline = perf_counter() שעד אליו צריך
+    להחזיר פעולה (None = בלי הגבלה); policies יקרות יכולות לבדוק אותו.
+    """
+
+    side = "enemy"
+
+    def __init__(self, game, deadline=None):
+        self.game = game
+        self.deadline = deadline
+
+    @property
+    def money(self):
+        return self.game.enemy_money
+
+    @property
+    def xp(self):
+        return self.game.enemy_xp
+
+    @property
+    def unit_cost(self):
+        return self.game.unit_cost
+
+    @property
+    def base_turret_level(self):
+        return self.game.enemy_turret_level
+
+    @property
+    def enemy_turret_level(self):
+        return self.game.base_turret_level
+
+    @property
+    def player_units(self):
+        return self.game.enemy_units
+
+    @property
+    def enemy_units(self):
+        return self.game.player_units
+
+    @property
+    def player_base(self):
+        return self.game.enemy_base
+
+    @property
+    def enemy_base(self):
+        return self.game.player_base
+
+    @property
+    def tick(self):
+        return self.game.tick
+
+    @property
+    def config(self):
+        return self.game.config
+
+    def can_upgrade_turret(self):
+        return self.game.can_upgrade_turret("enemy")
+
+
+def _think(policy, game):
+    """רץ ב-worker: מחזיר גם את ה-policy, כדי שמצב פנימי שלה ישרוד מעבר לתהליך."""
+    return policy.act(EnemyView(game)), policy
+
+
+class EnemyAI:
+    """
+    עוטף Policy בשביל Game(enemy_policy=...).
+
+    budget_ms = זמן מקסימלי לטיק. בתוך הטיק אי אפשר לעצור קוד Python באמצע,
+    אז ה-policy מקבלת deadline, וכל חריגה נספרת ב- overruns.
+    worker = None / "thread" / "process" (ראו למעלה).
+    max_lag_ticks = תוצאה מה-worker שמגיעה מאוחר יותר מזה נזרקת (dropped).
+    """
+
+    def __init__(self, policy, budget_ms=None, worker=None, max_lag_ticks=30):
+        if worker not in (None, "thread", "process"):
+            raise ValueError(f"unknown worker {worker!r}, choose from None, 'thread', 'process'")
+        self.policy = policy
+        self.budget_ms = budget_ms
+        self.worker = worker
+        self.max_lag_ticks = max_lag_ticks
+        self.executor = None
+        self.pending = None
+        self.pending_tick = 0
+
+        # סטטיסטיקות
+        self.calls = 0
+        self.overruns = 0
+        self.dropped = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def name(self):
+        return self.policy.name
+
+    @property
+    def seeded(self):
+        # a policy that doesn't say is assumed to use its seed
+        return getattr(self.policy, "seeded", True)
+
+    def reset(self, seed):
+        self._cancel()
+        self.policy.reset(seed)
+
+    def act(self, game):
+        """נקרא מ-Game.update פעם בטיק; מחזיר את הפעולה של האויב."""
+        start = time.perf_counter()
+        if self.worker is None:
+            deadline = start + self.budget_ms / 1000.0 if self.budget_ms is not None else None
+            action = self.policy.act(EnemyView(game, deadline))
+        else:
+            action = self._act_async(game)
+        self._account((time.perf_counter() - start) * 1000.0)
+        return action
+
+    def _act_async(self, game):
+        action = ACTION_NOOP
+        if self.pending is not None and self.pending.done():
+            result, policy = self.pending.result()
+            self.pending = None
+            if self.worker == "process":
+                self.policy = policy
+            if game.tick - self.pending_tick <= self.max_lag_ticks:
+                action = result
+            else:
+                self.dropped += 1
+
+        if self.pending is None:
+            if self.executor is None:
+                pool = ThreadPoolExecutor if self.worker == "thread" else ProcessPoolExecutor
+                self.executor = pool(max_workers=1)
+            # the worker reads a frozen copy, never the live game
+            self.pending = self.executor.submit(_think, self.policy, game.clone())
+            self.pending_tick = game.tick
+        return action
+
+    def _account(self, ms):
+        self.calls += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        if self.budget_ms is not None and ms > self.budget_ms:
+            self.overruns += 1
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "mean_ms": self.total_ms / max(1, self.calls),
+            "max_ms": self.max_ms,
+            "overruns": self.overruns,
+            "dropped": self.dropped,
+        }
+
+    def _cancel(self):
+        """זורק את ההחלטה שבדרך. אחרי זה אף worker לא נוגע ב- self.policy."""
+        if self.pending is not None:
+            # cancel() does nothing once the worker has started. A thread worker
+            # is still calling act() on self.policy: wait it out before the
+            # caller resets or swaps the policy. A process worker acts on its
+            # own copy, so its result is just dropped without blocking the frame
+            if not self.pending.cancel() and self.worker == "thread":
+                wait((self.pending,))
+            self.pending = None
+
+    def close(self):
+        """עוצר את ה-worker (אם יש)."""
+        self._cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -1,11 +1,14 @@
 """
 entities.py
 מכיל את המחלקות:
-- Base  (בסיס)
-- Unit  (לוחם)
+- Base      (בסיס)
+- UnitPool  (כל הלוחמים של צד אחד, כמערכי NumPy)
 """
 
+import numpy as np
 import pygame
+from combat import SOURCE_UNIT, TARGET_BASE
+from pool import ColumnBuffer
 from settings import (
     GROUND_Y,
     PLAYER_BASE_COLOR,
@@ -19,21 +22,7 @@ from settings import (
     TEXT_COLOR,
 )
 import visuals
-from settings import (
-    PLAYER_BASE_MAX_HP,
-    ENEMY_BASE_MAX_HP,
-    BASE_HIT_FLASH_DURATION,
-    UNIT_WIDTH,
-    UNIT_HEIGHT,
-    UNIT_MAX_HP,
-    UNIT_SPEED,
-    UNIT_ATTACK_RANGE,
-    UNIT_ATTACK_DAMAGE,
-    UNIT_ATTACK_COOLDOWN,
-    UNIT_ATTACK_ANIM_DURATION,
-    UNIT_HIT_FLASH_DURATION,
-    UNIT_RECOIL_AMOUNT,
-)
+from settings import make_config
 
 
 class Base:
@@ -45,34 +34,37 @@ class Base:
     - צד (שחקן / אויב)
     """
 
-    def __init__(self, x, width, side):
+    __slots__ = ("side", "rect", "max_hp", "hp", "hit_flash_time", "hit_flash_duration")
+
+    def __init__(self, x, width, side, config=None):
         """
         x = מיקום בציר X
         width = רוחב הבסיס
         side = "player" או "enemy"
+        config = make_config() (ברירת מחדל: הערכים מ- settings.py)
         """
+        if config is None:
+            config = make_config()
         self.side = side
         # גובה הבסיס 140 פיקסלים
         self.rect = pygame.Rect(x, GROUND_Y - 140, width, 140)
         # HP ניתן לכוונון ב- settings.py
-        self.max_hp = PLAYER_BASE_MAX_HP if side == "player" else ENEMY_BASE_MAX_HP
+        self.max_hp = config.PLAYER_BASE_MAX_HP if side == "player" else config.ENEMY_BASE_MAX_HP
         self.hp = self.max_hp
         # used to show a brief red flash when base is hit
         self.hit_flash_time = 0
-        self.hit_flash_duration = BASE_HIT_FLASH_DURATION
+        self.hit_flash_duration = config.BASE_HIT_FLASH_DURATION
 
-    def take_damage(self, amount):
+    def take_damage(self, amount, now=0):
         """
         הפחתת חיים. אם מגיע ל-0, הבסיס מת (אין מינוס).
+        now = זמן המשחק (ms), לאפקט ההבהוב.
         """
         self.hp -= amount
         if self.hp < 0:
             self.hp = 0
         # register hit time for flash effect
-        try:
-            self.hit_flash_time = pygame.time.get_ticks()
-        except Exception:
-            self.hit_flash_time = 0
+        self.hit_flash_time = now
 
     def is_dead(self):
         """
@@ -80,7 +72,7 @@ class Base:
         """
         return self.hp <= 0
 
-    def draw(self, surface):
+    def draw(self, surface, now):
         """
         ציור הבסיס + פס חיים + טקסט.
         """
@@ -123,7 +115,6 @@ class Base:
         )
 
         # flash red briefly when hit
-        now = pygame.time.get_ticks()
         if now - getattr(self, "hit_flash_time", 0) < getattr(self, "hit_flash_duration", 0):
             alpha = 160
             flash = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
@@ -131,191 +122,322 @@ class Base:
             surface.blit(flash, (self.rect.left, self.rect.top))
 
 
-class Unit:
+class UnitPool(ColumnBuffer):
     """
-    מייצגת לוחם אחד (חייל).
-    לכל לוחם יש:
-    - צד (שחקן / אויב)
-    - מקום על המסך
-    - חיים
-    - מהירות הליכה
-    - טווח תקיפה
-    - נזק
-    - זמן המתנה בין תקיפות (cooldown)
+    מחזיקה את כל הלוחמים של צד אחד כמערכים (struct-of-arrays).
+    במקום אובייקט Unit לכל חייל, לכל שדה יש מערך NumPy אחד:
+    - x                  (מיקום שמאלי, float)
+    - hp                 (חיים)
+    - last_attack_time   (זמן התקיפה האחרונה, ms)
+    - attack_anim_time   (תחילת אנימציית התקיפה)
+    - target_x/target_y  (לאן מצוירת המכה)
+    - hit_flash_time     (הבהוב כשנפגעים)
+    - alive              (מסכת חיים)
+    הצד (side) והכיוון (dir) משותפים לכל הפול.
+    Slots [0, count) are in use; dead units are compacted away by compact().
+
+    אינדקס נתיב (lane index): כל הלוחמים על ציר X אחד, אז שומרים את
+    האינדקסים של החיים ממוינים לפי centerx. חיפוש "הקרוב ביותר" הוא
+    bisect (searchsorted) במקום מעבר על כל האויבים.
     """
 
-    def __init__(self, x, side):
+    _FIELDS = (
+        ("x", np.float64),
+        ("hp", np.int64),
+        ("last_attack_time", np.int64),
+        ("attack_anim_time", np.int64),
+        ("target_x", np.int64),
+        ("target_y", np.int64),
+        ("hit_flash_time", np.int64),
+        ("alive", np.bool_),
+    )
+
+    # "never" for timestamps, so fresh units show no animation/flash
+    _NEVER = -(10**9)
+
+    def __init__(self, side, capacity=64, config=None):
         """
-        x = מיקום התחלה בציר X
         side = "player" או "enemy"
+        config = make_config() (ברירת מחדל: הערכים מ- settings.py)
         """
+        if config is None:
+            config = make_config()
         self.side = side
-
-        # גודל הלוחם (ניתן לכוונן ב- settings.py)
-        self.width = UNIT_WIDTH
-        self.height = UNIT_HEIGHT
-
         # כיוון הליכה: שחקן הולך ימינה, אויב הולך שמאלה
         self.dir = 1 if side == "player" else -1
 
-        # מיקום
-        self.x = x
+        # נתוני לוחם (ניתנים לכוונון ב- settings.py)
+        self.width = config.UNIT_WIDTH
+        self.height = config.UNIT_HEIGHT
         self.y = GROUND_Y - self.height
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.max_hp = config.UNIT_MAX_HP
+        self.speed = config.UNIT_SPEED
+        self.attack_range = config.UNIT_ATTACK_RANGE
+        self.attack_damage = config.UNIT_ATTACK_DAMAGE
+        self.attack_cooldown = config.UNIT_ATTACK_COOLDOWN  # מילישניות
+        self.attack_anim_duration = config.UNIT_ATTACK_ANIM_DURATION
+        self.hit_flash_duration = config.UNIT_HIT_FLASH_DURATION
+        self.recoil_amount = config.UNIT_RECOIL_AMOUNT
 
-        # חיים
-        self.max_hp = UNIT_MAX_HP
-        self.hp = self.max_hp
-
-        # מהירות הליכה (פיקסלים לשניה)
-        self.speed = UNIT_SPEED
+        super().__init__(capacity)
 
-        # נתוני תקיפה (ניתנים לכוונון ב- settings.py)
-        self.attack_range = UNIT_ATTACK_RANGE
-        self.attack_damage = UNIT_ATTACK_DAMAGE
-        self.attack_cooldown = UNIT_ATTACK_COOLDOWN  # מילישניות
-        self.last_attack_time = 0
+        # lane index: alive slots sorted by centerx (refreshed lazily)
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_cx = np.zeros(0, dtype=np.int64)
+        self._index_dirty = False
 
-        self.alive = True
-        # animation / effects
-        self.attacking = False
-        self.attack_anim_time = 0
-        self.attack_anim_duration = UNIT_ATTACK_ANIM_DURATION
-        self.attack_target_pos = None
+    # ---------- יצירה / ניקוי ----------
 
-        # brief flash when hit
-        self.hit_flash_time = 0
-        self.hit_flash_duration = UNIT_HIT_FLASH_DURATION
+    def spawn(self, x):
+        """
+        לוחם חדש במיקום x. מחזיר את האינדקס שלו.
+        """
+        if self.count == self.capacity:
+            self._grow(max(16, self.capacity * 2))
+        i = self.count
+        self.x[i] = x
+        self.hp[i] = self.max_hp
+        self.last_attack_time[i] = 0
+        self.attack_anim_time[i] = self._NEVER
+        self.target_x[i] = 0
+        self.target_y[i] = 0
+        self.hit_flash_time[i] = self._NEVER
+        self.alive[i] = True
+        self.count += 1
+        self.order = np.append(self.order, i)
+        self._index_dirty = True
+        return i
+
+    def compact(self):
+        """
+        מוחק לוחמים מתים: מזיז את החיים לתחילת המערכים (בלי להקצות מערכים חדשים).
+        """
+        n = self.count
+        alive = self.alive[:n]
+        if alive.all():
+            return
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+
+        # remap the lane index to the new slots (order stays sorted)
+        new_slot = np.cumsum(alive) - 1
+        in_index = alive[self.order]
+        if not self._index_dirty:
+            self.sorted_cx = self.sorted_cx[in_index]
+        self.order = new_slot[self.order[in_index]]
+
+        for name, _ in self._FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[keep]
+        self.count = k
+
+    def clear(self):
+        """מוחק את כל הלוחמים (גם מאינדקס הנתיב)."""
+        super().clear()
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_cx = np.zeros(0, dtype=np.int64)
+        self._index_dirty = False
+
+    # ---------- snapshot ----------
+
+    def get_state(self):
+        """
+        כל המצב של הפול כ-bytes אחד (בשביל Game.snapshot).
+        The lane order is included so tie-breaks replay identically.
+        """
+        n = self.count
+        parts = [getattr(self, name)[:n].tobytes() for name, _ in self._FIELDS]
+        parts.append(self.order.tobytes())
+        parts.append(self.sorted_cx.tobytes())
+        return (n, len(self.order), len(self.sorted_cx), self._index_dirty, b"".join(parts))
+
+    def set_state(self, state):
+        n, n_order, n_sorted, dirty, blob = state
+        if n > self.capacity:
+            self._grow(n)
+        pos = 0
+        for name, dtype in self._FIELDS:
+            arr = np.frombuffer(blob, dtype=dtype, count=n, offset=pos)
+            getattr(self, name)[:n] = arr
+            pos += arr.nbytes
+        self.order = np.frombuffer(blob, dtype=np.int64, count=n_order, offset=pos).copy()
+        pos += self.order.nbytes
+        self.sorted_cx = np.frombuffer(blob, dtype=np.int64, count=n_sorted, offset=pos).copy()
+        self.count = n
+        self._index_dirty = dirty
+
+    # ---------- שאילתות ----------
+
+    def centerx(self):
+        """
+        מרכז X של כל לוחם (כמו rect.centerx של pygame: int(x) + width // 2).
+        """
+        return self.x[: self.count].astype(np.int64) + self.width // 2
 
-        # recoil pixels when attacking
-        self.recoil_amount = UNIT_RECOIL_AMOUNT
+    @property
+    def centery(self):
+        return self.y + self.height // 2
 
-    def is_in_range(self, other_rect):
+    def lane(self):
         """
-        בדיקה אם מישהו (יחידה או בסיס) נמצא בטווח התקיפה שלנו.
+        (order, sorted_cx): אינדקסים של הלוחמים החיים ממוינים לפי centerx.
+        The previous order is re-sorted instead of starting from scratch;
+        units only drift a few pixels per tick, so the input is nearly
+        sorted and the stable sort (timsort) runs in close to linear time.
         """
-        dist = abs(self.rect.centerx - other_rect.centerx)
-        return dist <= self.attack_range
-
-    def find_target(self, enemies, enemy_base):
+        if self._index_dirty:
+            order = self.order[self.alive[self.order]]
+            cx = self.centerx()[order]
+            s = np.argsort(cx, kind="stable")
+            self.order = order[s]
+            self.sorted_cx = cx[s]
+            self._index_dirty = False
+        return self.order, self.sorted_cx
+
+    def nearest(self, xs, max_dist):
         """
-        מחפשת מטרה קרובה:
-        קודם יחידת אויב, אם אין – בסיס אויב (אם בטווח).
+        לכל x ב-xs: האינדקס של הלוחם החי הקרוב ביותר במרחק <= max_dist
+        (או -1 אם אין). bisect על האינדקס הממוין, O(log n) לכל שאילתה.
+        xs יכול להיות גם מספר בודד (למשל טורט) -> מחזיר מערך 0-d.
         """
-        closest_enemy = None
-        closest_dist = 999999
-
-        # מחפשים יחידת אויב בטווח
-        for enemy in enemies:
-            if not enemy.alive:
-                continue
-            if not self.is_in_range(enemy.rect):
-                continue
+        xs = np.asarray(xs)
+        out = np.full(xs.shape, -1, dtype=np.int64)
+        order, sorted_cx = self.lane()
+        if len(order) == 0 or xs.size == 0:
+            return out
+        # most ticks the two fronts are still apart: one range check instead of the bisect
+        if xs.min() - max_dist > sorted_cx[-1] or xs.max() + max_dist < sorted_cx[0]:
+            return out
+
+        last = len(sorted_cx) - 1
+        pos = np.searchsorted(sorted_cx, xs)
+        left = np.maximum(pos - 1, 0)
+        right = np.minimum(pos, last)
+        d_left = np.abs(xs - sorted_cx[left])
+        d_right = np.abs(xs - sorted_cx[right])
+        best = np.where(d_left <= d_right, left, right)
+        ok = np.minimum(d_left, d_right) <= max_dist
+        out[ok] = order[best[ok]]
+        return out
+
+    def within(self, a, b):
+        """
+        כל הלוחמים החיים עם centerx בטווח [a, b], ממוינים לפי x.
+        Two bisects plus a slice of the lane index, for splash/area attacks.
+        """
+        order, sorted_cx = self.lane()
+        lo = np.searchsorted(sorted_cx, a, side="left")
+        hi = np.searchsorted(sorted_cx, b, side="right")
+        return order[lo:hi]
 
-            dist = abs(self.rect.centerx - enemy.rect.centerx)
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_enemy = enemy
+    def apply_damage(self, indices, amount, now=None):
+        """
+        נזק לכמה לוחמים בבת אחת (אינדקס יכול לחזור כמה פעמים).
+        now != None -> הבהוב פגיעה. מחזיר את האינדקסים שמתו עכשיו.
+        """
+        if np.size(indices) == 0:
+            return np.zeros(0, dtype=np.int64)
+        np.subtract.at(self.hp, indices, amount)
+        if now is not None:
+            self.hit_flash_time[indices] = now
+        hit = np.unique(indices)
+        killed = hit[self.alive[hit] & (self.hp[hit] <= 0)]
+        if len(killed) > 0:
+            self.alive[killed] = False
+            self._index_dirty = True
+        return killed
+
+    # ---------- עדכון ----------
+
+    def plan_attacks(self, now, enemies, enemy_base, combat, side):
+        """
+        שלב 1 של הקרב (לא משנה את הצד השני):
+        1) מי שיש לו אויב קרוב בטווח -> נרשם ב-combat כתקיפה (אם עבר ה-cooldown).
+        2) השאר -> יסמנו ללכת קדימה.
+        now = זמן המשחק (מהשעון של Game)
+        side = קוד הצד ב-combat (SIDE_PLAYER / SIDE_ENEMY)
+        מחזיר מסכה של הלוחמים שצריכים ללכת (בשביל walk()).
+        """
+        n = self.count
+        alive = self.alive[:n]
+        if n == 0:
+            return alive
+        cx = self.centerx()
 
-        if closest_enemy is not None:
-            return closest_enemy
+        # --- חיפוש מטרה: יחידת האויב הקרובה ביותר בטווח (bisect) ---
+        target = enemies.nearest(cx, self.attack_range)
 
+        has_unit = alive & (target >= 0)
         # אם אין יחידות בטווח – נבדוק אם הבסיס קרוב
-        if self.is_in_range(enemy_base.rect):
-            return enemy_base
+        base_cx = enemy_base.rect.centerx
+        has_base = alive & ~has_unit & (np.abs(cx - base_cx) <= self.attack_range)
+
+        # --- תקיפה: רק מי שעבר לו ה-cooldown ---
+        ready = (now - self.last_attack_time[:n]) >= self.attack_cooldown
+        attacking = (has_unit | has_base) & ready
+        if not attacking.any():
+            return alive & ~has_unit & ~has_base
+        hit_unit = np.flatnonzero(has_unit & ready)
+        hit_base = np.flatnonzero(has_base & ready)
+
+        self.last_attack_time[:n][attacking] = now
+        self.attack_anim_time[:n][attacking] = now
+
+        # prefer target center for the visual
+        victims = target[hit_unit]
+        self.target_x[hit_unit] = enemies.centerx()[victims]
+        self.target_y[hit_unit] = enemies.centery - 8
+        self.target_x[hit_base] = base_cx
+        self.target_y[hit_base] = enemy_base.rect.centery - 8
+
+        combat.add(side, SOURCE_UNIT, victims, self.attack_damage)
+        combat.add(side, SOURCE_UNIT, np.full(len(hit_base), TARGET_BASE), self.attack_damage)
+
+        # --- תנועה: אין אויב קרוב -> הולכים קדימה ---
+        return alive & ~has_unit & ~has_base
+
+    def walk(self, dt, moving):
+        """
+        מזיז קדימה את הלוחמים שב-moving. dt = זמן בין פריימים במילישניות.
+        """
+        if moving.any():
+            self.x[: self.count][moving] += self.dir * self.speed * (dt / 1000.0)
+            self._index_dirty = True
 
-        return None
+    # ---------- ציור ----------
 
-    def update(self, dt, now, enemies, enemy_base, particles=None):
+    def draw(self, surface, now, batch=None):
         """
-        עדכון הלוחם:
-        1) אם יש אויב קרוב -> נתקוף.
-        2) אחרת -> נלך קדימה.
-        dt = זמן בין פריימים במילישניות.
-        now = pygame.time.get_ticks()
+        ציור כל הלוחמים: גוף + ראש + פס חיים.
+        now = זמן המשחק (מהשעון של Game)
+        batch = visuals.RenderBatch: ה-glow של המכות נאסף לשכבה "units"
+        (Game מצייר אותה אחרי שני הצדדים). בלי batch הוא מצויר בסוף.
         """
-        if not self.alive:
-            return
-
-        target = self.find_target(enemies, enemy_base)
+        own = batch is None
+        if own:
+            batch = visuals.RenderBatch()
+        color = PLAYER_COLOR if self.side == "player" else ENEMY_COLOR
+        for i in range(self.count):
+            if not self.alive[i]:
+                continue
+            self._draw_one(surface, now, i, color, batch)
+        if own:
+            batch.flush(surface, "units")
 
-        if target is None:
-            # אין אויב קרוב -> הולכים קדימה
-            dx = self.dir * self.speed * (dt / 1000.0)
-            self.x += dx
-            self.rect.x = int(self.x)
-        else:
-            # יש אויב בטווח -> תוקפים אם עבר זמן מספיק
-            if now - self.last_attack_time >= self.attack_cooldown:
-                self.last_attack_time = now
-
-                # mark attack animation and apply damage
-                self.attacking = True
-                self.attack_anim_time = now
-                # prefer target center for the visual
-                try:
-                    self.attack_target_pos = (target.rect.centerx, target.rect.centery - 8)
-                except Exception:
-                    self.attack_target_pos = None
-
-                if isinstance(target, Unit):
-                    target.hp -= self.attack_damage
-                    # show hit flash on the target
-                    try:
-                        target.hit_flash_time = now
-                    except Exception:
-                        pass
-                    # spawn small blood/spark particles at target
-                    try:
-                        if particles is not None:
-                            particles.spawn_blood((target.rect.centerx, target.rect.centery))
-                    except Exception:
-                        pass
-                    if target.hp <= 0:
-                        target.alive = False
-                        try:
-                            if particles is not None:
-                                particles.spawn_explosion((target.rect.centerx, target.rect.centery), color=(200,60,60), count=10)
-                        except Exception:
-                            pass
-                elif isinstance(target, Base):
-                    target.take_damage(self.attack_damage)
-                    # spawn impact explosion and notify caller that base was hit
-                    try:
-                        if particles is not None:
-                            particles.spawn_explosion((target.rect.centerx, target.rect.centery))
-                    except Exception:
-                        pass
-                    # return event so Game can trigger screen shake
-                    return {"base_hit": True}
-
-        # אם אין חיים -> מת
-        if self.hp <= 0:
-            self.alive = False
-
-    def draw(self, surface):
-        """
-        ציור הלוחם: גוף + ראש + פס חיים.
-        """
-        if not self.alive:
-            return
+    def _draw_one(self, surface, now, i, color, batch):
+        rect = pygame.Rect(int(self.x[i]), self.y, self.width, self.height)
+        anim_time = int(self.attack_anim_time[i])
+        attacking = now - anim_time < self.attack_anim_duration
 
         # משיכה של אנימציית התקפה (ריקו) בזמן התקיפה
-        now = pygame.time.get_ticks()
         dx_offset = 0
-        anim_progress = 0.0
-        if self.attacking and now - self.attack_anim_time < self.attack_anim_duration:
-            anim_progress = (now - self.attack_anim_time) / float(self.attack_anim_duration)
+        if attacking:
+            anim_progress = (now - anim_time) / float(self.attack_anim_duration)
             # recoil: small backward push then return
             dx_offset = -self.dir * self.recoil_amount * (1.0 - abs(0.5 - anim_progress) * 2)
-        else:
-            # ensure attacking flag is reset after animation
-            if self.attacking:
-                self.attacking = False
 
         # גוף
-        color = PLAYER_COLOR if self.side == "player" else ENEMY_COLOR
-        draw_rect = self.rect.move(int(dx_offset), 0)
+        draw_rect = rect.move(int(dx_offset), 0)
         pygame.draw.rect(surface, color, draw_rect, border_radius=5)
 
         # ראש
@@ -324,11 +446,11 @@ class Unit:
         pygame.draw.circle(surface, (230, 220, 200), head_center, head_radius)
 
         # פס חיים
-        hp_ratio = self.hp / self.max_hp
+        hp_ratio = int(self.hp[i]) / self.max_hp
         bar_w = self.width
         bar_h = 5
-        bar_x = self.rect.left
-        bar_y = self.rect.top - 14
+        bar_x = rect.left
+        bar_y = rect.top - 14
 
         pygame.draw.rect(surface, HP_BAR_BG, (bar_x, bar_y, bar_w, bar_h))
 
@@ -346,26 +468,24 @@ class Unit:
         )
 
         # hit flash overlay
-        if now - getattr(self, "hit_flash_time", 0) < getattr(self, "hit_flash_duration", 0):
+        if now - int(self.hit_flash_time[i]) < self.hit_flash_duration:
             alpha = 180
-            flash = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+            flash = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
             flash.fill((220, 40, 40, alpha))
             surface.blit(flash, (draw_rect.left, draw_rect.top))
 
         # attack visual (slash/spark) towards target
-        if self.attack_target_pos and now - self.attack_anim_time < self.attack_anim_duration:
-            prog = (now - self.attack_anim_time) / float(self.attack_anim_duration)
+        if attacking:
+            prog = (now - anim_time) / float(self.attack_anim_duration)
             # line thickness peaks then fades
             thickness = int(1 + 6 * (1 - prog))
             start = (draw_rect.centerx, draw_rect.centery - 8)
-            end = self.attack_target_pos
+            end = (int(self.target_x[i]), int(self.target_y[i]))
             # bright line
             color_line = (255, 240, 120)
             pygame.draw.line(surface, color_line, start, end, thickness)
             # glow at hit
             glow_alpha = int(200 * (1 - prog))
-            glow_s = pygame.Surface((20, 20), pygame.SRCALPHA)
+            key, half = visuals.sprite_key((255, 200, 80), 8, glow_alpha)
             gx, gy = end
-            glow_s.fill((0, 0, 0, 0))
-            pygame.draw.circle(glow_s, (255, 200, 80, glow_alpha), (10, 10), 8)
-            surface.blit(glow_s, (gx - 10, gy - 10))
+            batch.add("units", visuals.SPRITES.get(key), (gx - half, gy - half))
@@ -0,0 +1,189 @@
+"""
+env.py
+ממשק סביבה (בסגנון gym) לאימון סוכנים על game.Game בלי חלון.
+
+    env = GameEnv(seed=0)
+    obs = env.reset()
+    obs, reward, done, info = env.step(ACTION_SPAWN)
+
+VecGameEnv מריץ N משחקים בלי תלות זה בזה, כולם באותו צעד, בתוך תהליך אחד,
+כמערכים של vecsim.VecSim (טיק אחד = פעולות NumPy על כל המשחקים).
+התצפיות (ראו observation.py), התגמולים וה-done הם מערכי NumPy שממולאים
+במקום בכל צעד.
+
+    python env.py [--envs 64] [--steps 2000] [--frame-skip 4]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game import Game, ACTION_NOOP, ACTION_SPAWN, ACTION_UPGRADE
+from observation import ObservationEncoder
+from settings import SIM_TICK_RATE, make_config
+from vecsim import VecSim, WINNER_PLAYER, WINNER_ENEMY
+
+
+# noop / spawn unit / upgrade turret
+N_ACTIONS = 3
+ACTIONS = (ACTION_NOOP, ACTION_SPAWN, ACTION_UPGRADE)
+
+# תגמול בסוף משחק (ניצחון / הפסד); תיקו = 0
+WIN_REWARD = 1.0
+
+
+class GameEnv:
+    """
+    משחק אחד כסביבה. כל step() = פעולה אחת ואז frame_skip טיקים של סימולציה.
+
+    reward = (נזק לבסיס האויב - נזק לבסיס שלנו) / max_hp בכל צעד,
+    ועוד +-WIN_REWARD כשהמשחק נגמר. done גם כשנגמר הזמן (max_seconds).
+    obs = מערך לכתיבת התצפית (ברירת מחדל: חדש); step() מחזיר תמיד את אותו מערך.
+    """
+
+    def __init__(self, seed=None, frame_skip=1, max_seconds=600, config=None, encoder=None, obs=None):
+        self.frame_skip = frame_skip
+        self.max_ticks = max_seconds * SIM_TICK_RATE
+        self.config = config if config is not None else make_config()
+        self.encoder = encoder if encoder is not None else ObservationEncoder()
+        self.obs = obs if obs is not None else self.encoder.empty()
+        self.game = Game(headless=True, seed=seed, config=self.config)
+        self._last_hp = (0, 0)
+
+    def reset(self, seed=None):
+        """משחק חדש; seed=None -> seed אקראי. מחזיר את התצפית הראשונה."""
+        self.game.reset(seed)
+        self._last_hp = (self.game.player_base.hp, self.game.enemy_base.hp)
+        return self.encoder.encode(self.game, self.obs)
+
+    def step(self, action):
+        game = self.game
+        game.apply_action(action)
+        for _ in range(self.frame_skip):
+            game.step()
+            if game.game_over:
+                break
+        reward = self._reward()
+        done = game.game_over or game.tick >= self.max_ticks
+        info = {"winner": game.winner or "draw", "tick": game.tick} if done else {}
+        return self.encoder.encode(game, self.obs), reward, done, info
+
+    def _reward(self):
+        game = self.game
+        player_hp = game.player_base.hp
+        enemy_hp = game.enemy_base.hp
+        last_player, last_enemy = self._last_hp
+        self._last_hp = (player_hp, enemy_hp)
+        reward = ((last_enemy - enemy_hp) - (last_player - player_hp)) / game.player_base.max_hp
+        if game.winner == "player":
+            reward += WIN_REWARD
+        elif game.winner == "enemy":
+            reward -= WIN_REWARD
+        return reward
+
+
+class VecGameEnv:
+    """
+    n משחקים כמו GameEnv בצעד משותף. step(actions) מקבל מערך של n פעולות
+    וממלא במקום את self.obs (n, encoder.size), self.rewards (n,) ו- self.dones (n,).
+
+    הסימולציה היא vecsim.VecSim: כל n המשחקים במערכים, וכל טיק הוא פעולות
+    NumPy על כולם יחד (אותן תוצאות כמו n אובייקטי GameEnv, בלי לולאה עליהם).
+
+    משחק שנגמר מתאפס מיד (כמו ב-gym vector envs): התצפית בשורה שלו היא של
+    המשחק החדש, וה-done/reward הם של המשחק שנגמר. seeds: seed, seed+1, ...
+    ואחרי כל איפוס ה-seed הבא שעוד לא שוחק (self.seeds = ה-seed של כל שורה;
+    המשחק headless עם האויב הישן לא משתמש ב-RNG, אז הוא רק מזהה את המשחק).
+    """
+
+    def __init__(self, n, seed=0, frame_skip=1, max_seconds=600, config=None, encoder=None):
+        self.n = n
+        self.frame_skip = frame_skip
+        self.max_ticks = max_seconds * SIM_TICK_RATE
+        self.encoder = encoder if encoder is not None else ObservationEncoder()
+        self.obs = self.encoder.empty(n)
+        self.rewards = np.zeros(n, dtype=np.float32)
+        self.dones = np.zeros(n, dtype=bool)
+        self.sim = VecSim(n, config)
+        self.seeds = np.arange(seed, seed + n, dtype=np.int64)
+        self._next_seed = seed
+        self._last_hp = (self.sim.player_base_hp.copy(), self.sim.enemy_base_hp.copy())
+        self.finished = []
+
+    def reset(self):
+        rows = np.arange(self.n)
+        self.sim.reset(rows)
+        self._take_seeds(rows)
+        self._last_hp = (self.sim.player_base_hp.copy(), self.sim.enemy_base_hp.copy())
+        self.rewards[:] = 0
+        self.dones[:] = False
+        return self.encoder.encode_sim(self.sim, self.obs)
+
+    def step(self, actions):
+        """
+        מחזיר (obs, rewards, dones, finished). finished = רשימה של
+        (index, info) למשחקים שנגמרו בצעד הזה.
+        """
+        sim = self.sim
+        sim.apply_actions(actions)
+        for _ in range(self.frame_skip):
+            # rows that are already over stand still, like GameEnv's break
+            sim.step()
+
+        # same reward as GameEnv._reward, for every game
+        last_player, last_enemy = self._last_hp
+        player_hp, enemy_hp = sim.player_base_hp, sim.enemy_base_hp
+        rewards = ((last_enemy - enemy_hp) - (last_player - player_hp)) / sim.config.PLAYER_BASE_MAX_HP
+        rewards += np.where(sim.winner == WINNER_PLAYER, WIN_REWARD, 0.0)
+        rewards -= np.where(sim.winner == WINNER_ENEMY, WIN_REWARD, 0.0)
+        self.rewards[:] = rewards
+        np.logical_or(sim.game_over, sim.tick >= self.max_ticks, out=self.dones)
+
+        finished = self.finished
+        finished.clear()
+        done = np.flatnonzero(self.dones)
+        if len(done) > 0:
+            winners = sim.winners(done)
+            for i, winner, tick in zip(done.tolist(), winners, sim.tick[done].tolist()):
+                finished.append((i, {"winner": winner or "draw", "tick": tick}))
+            sim.reset(done)
+            self._take_seeds(done)
+        self._last_hp = (player_hp.copy(), enemy_hp.copy())
+        return self.encoder.encode_sim(sim, self.obs), self.rewards, self.dones, finished
+
+    def _take_seeds(self, rows):
+        self.seeds[rows] = np.arange(self._next_seed, self._next_seed + len(rows))
+        self._next_seed += len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure VecGameEnv throughput with random actions.")
+    parser.add_argument("--envs", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--frame-skip", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    venv = VecGameEnv(args.envs, args.seed, args.frame_skip)
+    venv.reset()
+    rng = np.random.default_rng(args.seed)
+    # mostly noop, like a real agent most ticks
+    actions = rng.choice(N_ACTIONS, size=(args.steps, args.envs), p=[0.9, 0.07, 0.03])
+    episodes = 0
+    start = time.perf_counter()
+    for t in range(args.steps):
+        _, _, _, finished = venv.step(actions[t])
+        episodes += len(finished)
+    elapsed = time.perf_counter() - start
+
+    steps = args.steps * args.envs
+    print(f"{steps} env steps ({steps * args.frame_skip} ticks), {episodes} episodes in {elapsed:.1f} s")
+    print(f"{steps / elapsed:.0f} env steps/s, {steps * args.frame_skip / elapsed:.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+events.py
+תור אירועים של טיק אחד (מה קרה בקרב), מופרד ממי שמגיב להם.
+
+הסימולציה רק רושמת אירועים (hit, kill, base_hit, turret_fire). בסוף הקרב
+Game קורא ל- dispatch(), וכל צרכן (פרסים, חלקיקים, shake, סטטיסטיקות) מקבל
+את כל התור בבת אחת. במצב headless צרכני התצוגה לא נרשמים בכלל, ו-emit של
+סוג שאף אחד לא רוצה לא עושה כלום (wants[kind] == False).
+
+צרכן הוא כל callable שמקבל את התור, למשל ספירת הריגות לכל צד:
+
+    def count_kills(events):
+        kills[SIDE_PLAYER] += len(events.rows(EVENT_KILL, SIDE_PLAYER))
+
+    game.events.subscribe(count_kills, (EVENT_KILL,))
+"""
+
+import numpy as np
+
+from pool import ColumnBuffer
+
+
+# סוגי אירועים
+EVENT_HIT = 0  # פגיעה בלוחם: x,y = מרכז הלוחם, value = נזק
+EVENT_KILL = 1  # לוחם מת: x,y = המיקום שלו
+EVENT_BASE_HIT = 2  # פגיעה בבסיס: x,y = מרכז הבסיס, value = HP שירד בפועל
+EVENT_TURRET_FIRE = 3  # טורט ירה: x,y = הצריח, x2,y2 = המטרה, value = נזק
+EVENT_KINDS = 4
+
+
+class EventQueue(ColumnBuffer):
+    """
+    מערכים מוקצים מראש (כמו CombatBuffer): kind, side, source, x, y, x2, y2, value.
+    side = הצד שגרם לאירוע (התוקף). The arrays only grow and are reused every tick.
+    """
+
+    _FIELDS = (
+        ("kind", np.int8),
+        ("side", np.int8),
+        ("source", np.int8),
+        ("x", np.int64),
+        ("y", np.int64),
+        ("x2", np.int64),
+        ("y2", np.int64),
+        ("value", np.int64),
+    )
+
+    def __init__(self, capacity=256):
+        super().__init__(capacity)
+        self.consumers = []
+        # האם מישהו רשום לכל סוג
+        self.wants = [False] * EVENT_KINDS
+
+    def subscribe(self, consumer, kinds):
+        """consumer(queue) ייקרא ב- dispatch() אם היה לפחות אירוע אחד מ-kinds."""
+        self.consumers.append((consumer, tuple(kinds)))
+        for kind in kinds:
+            self.wants[kind] = True
+
+    def emit(self, kind, side, source, x, y, value=0, x2=0, y2=0):
+        """
+        מוסיף בלוק של אירועים מאותו סוג. כל שדה הוא מספר או מערך (באותו אורך).
+        """
+        if not self.wants[kind]:
+            return
+        k = max(np.size(x), np.size(value), np.size(x2))
+        if k == 0:
+            return
+        s = self._reserve(k)
+        self.kind[s] = kind
+        self.side[s] = side
+        self.source[s] = source
+        self.x[s] = x
+        self.y[s] = y
+        self.x2[s] = x2
+        self.y2[s] = y2
+        self.value[s] = value
+
+    def rows(self, kind, side=None):
+        """אינדקסים של האירועים מסוג kind (ואם צריך, רק של side), לפי הסדר."""
+        match = self.kind[: self.count] == kind
+        if side is not None:
+            match &= self.side[: self.count] == side
+        return np.flatnonzero(match)
+
+    def dispatch(self):
+        """מעביר את התור לכל הצרכנים ומרוקן אותו."""
+        if self.count == 0:
+            return
+        present = np.bincount(self.kind[: self.count], minlength=EVENT_KINDS) > 0
+        for consumer, kinds in self.consumers:
+            if any(present[kind] for kind in kinds):
+                consumer(self)
+        self.count = 0
+
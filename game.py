@@ -1,31 +1,69 @@
+import copy
+import random
+import numpy as np
 import pygame
 from settings import (
     WIDTH,
     HEIGHT,
     TEXT_COLOR,
+    SIM_TICK_RATE,
+    make_config,
 )
 import visuals
-from visuals import draw_gradient_background, draw_ground
+from visuals import RenderBatch, draw_gradient_background, draw_ground
 from settings import (
-    PLAYER_BASE_WIDTH,
-    ENEMY_BASE_WIDTH,
-    UNIT_COST,
-    MONEY_PER_SECOND,
-    XP_PER_SECOND,
-    ENEMY_SPAWN_INTERVAL,
-    MONEY_MAX,
-    XP_MAX,
-    BASE_TURRET_MAX_LEVEL,
-    BASE_TURRET_XP_COSTS,
-    BASE_TURRET_RANGES,
-    BASE_TURRET_DAMAGES,
-    BASE_TURRET_COOLDOWNS,
     DEFAULT_SCREEN_SHAKE_DURATION,
     DEFAULT_SCREEN_SHAKE_MAGNITUDE,
-    ENEMY_TURRET_AUTO_UPGRADE_INTERVAL,
 )
-from entities import Base, Unit
+from entities import Base, UnitPool
+from combat import (
+    CombatBuffer,
+    SIDE_PLAYER,
+    SIDE_ENEMY,
+    SOURCE_UNIT,
+    SOURCE_TURRET,
+    TARGET_BASE,
+)
 from effects import ParticleSystem, Background
+from events import (
+    EventQueue,
+    EVENT_HIT,
+    EVENT_KILL,
+    EVENT_BASE_HIT,
+    EVENT_TURRET_FIRE,
+)
+from timing import RealClock, SimClock
+from pool import ObjectPool
+
+
+# פעולות של שחקן (מקלדת / AI / replay)
+ACTION_NOOP = 0
+ACTION_SPAWN = 1
+ACTION_UPGRADE = 2
+
+# ניצוצות בסוף ירייה של טורט: (צבע, כמות) לכל צד
+TURRET_SPARKS = {
+    SIDE_PLAYER: ((255, 220, 120), 10),
+    SIDE_ENEMY: ((255, 180, 120), 8),
+}
+
+
+class GameSnapshot:
+    """
+    מצב הסימולציה של Game ברגע אחד (ראו Game.snapshot / Game.restore).
+    sim = tuple של ערכים פשוטים, units = מצב ה-UnitPool של כל צד (bytes),
+    cosmetic = חלקיקים/רקע/RNG/shake, או None אם לא נשמרו.
+    """
+
+    __slots__ = ("tick", "now", "sim", "player_units", "enemy_units", "cosmetic")
+
+    def __init__(self, tick, now, sim, player_units, enemy_units, cosmetic=None):
+        self.tick = tick
+        self.now = now
+        self.sim = sim
+        self.player_units = player_units
+        self.enemy_units = enemy_units
+        self.cosmetic = cosmetic
 
 
 class Game:
@@ -35,59 +73,124 @@ class Game:
     - יחידות
     - כסף ו-XP
     - טורט בסיס עם שדרוגים + אנימציית ירי
+
+    clock = אובייקט עם get_ticks() (ברירת מחדל: שעון pygame).
+    headless = בלי חלקיקים/רקע/ציור, בשביל סימולציה מהירה. במצב הזה
+    ברירת המחדל היא SimClock ומקדמים את המשחק עם advance() או step().
+    seed = seed ל-RNG של המשחק; אותו seed ואותם קלטים = אותה תוצאה.
+    config = make_config(...) עם ערכי האיזון למשחק הזה (ברירת מחדל: settings.py).
+    enemy_policy = מי שמחליט בשביל האויב (ראו enemy_ai.EnemyAI): act(game) -> ACTION_*
+    בכל טיק, עם כסף ו-XP משלו כמו לשחקן. None = האויב הישן (טיימר + שדרוג אוטומטי).
     """
 
-    def __init__(self):
+    def __init__(self, clock=None, headless=False, seed=None, config=None, enemy_policy=None):
+        self.headless = headless
+        if config is None:
+            config = make_config()
+        self.config = config
+        if clock is None:
+            clock = SimClock() if headless else RealClock()
+        self.clock = clock
+
+        # RNG לכל משחק (במקום random הגלובלי)
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # separate stream for draw() (screen shake, background flicker): it runs
+        # at render FPS, so it must not consume numbers from the simulation RNG
+        self.render_rng = random.Random(seed ^ 0x5EED)
+
+        # מספר הצעדים הקבועים שבוצעו (step)
+        self.tick = 0
+
         # בסיסים
-        self.player_base = Base(x=40, width=PLAYER_BASE_WIDTH, side="player")
-        self.enemy_base = Base(x=WIDTH - 40 - ENEMY_BASE_WIDTH, width=ENEMY_BASE_WIDTH, side="enemy")
+        self.player_base = Base(x=40, width=config.PLAYER_BASE_WIDTH, side="player", config=config)
+        self.enemy_base = Base(
+            x=WIDTH - 40 - config.ENEMY_BASE_WIDTH,
+            width=config.ENEMY_BASE_WIDTH,
+            side="enemy",
+            config=config,
+        )
+
+        # יחידות (מערכים לכל צד)
+        self.player_units = UnitPool("player", config=config)
+        self.enemy_units = UnitPool("enemy", config=config)
 
-        # יחידות
-        self.player_units = []
-        self.enemy_units = []
+        # סטטיסטיקות
+        self.player_units_spawned = 0
+        self.enemy_units_spawned = 0
+
+        # כוונות תקיפה של הטיק הנוכחי (קרב דו-שלבי)
+        self.combat = CombatBuffer()
 
         # כסף ו-XP
         self.money = 100
         self.xp = 0
-        self.money_per_second = MONEY_PER_SECOND
-        self.xp_per_second = XP_PER_SECOND
+        # הכלכלה של האויב (בשימוש רק כשיש enemy_policy)
+        self.enemy_money = 100
+        self.enemy_xp = 0
+        self.money_per_second = config.MONEY_PER_SECOND
+        self.xp_per_second = config.XP_PER_SECOND
 
         # עלות יצירת יחידה
-        self.unit_cost = UNIT_COST
+        self.unit_cost = config.UNIT_COST
 
         # טיימרים
-        self.last_income_time = pygame.time.get_ticks()
-        self.enemy_spawn_interval = ENEMY_SPAWN_INTERVAL
-        self.last_enemy_spawn_time = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
+        self.last_income_time = now
+        # income not paid out yet (in money*ms / xp*ms): a step is only 16-17 ms
+        self.money_remainder = 0
+        self.xp_remainder = 0
+        self.enemy_spawn_interval = config.ENEMY_SPAWN_INTERVAL
+        self.last_enemy_spawn_time = now
 
         # טורט בסיס (שחקן)
         self.base_turret_level = 0
-        self.base_turret_max_level = BASE_TURRET_MAX_LEVEL
+        self.base_turret_max_level = config.BASE_TURRET_MAX_LEVEL
 
         # עלות XP לכל רמה (אינדקס = רמה)
-        self.base_turret_xp_costs = BASE_TURRET_XP_COSTS
+        self.base_turret_xp_costs = config.BASE_TURRET_XP_COSTS
 
         # פרמטרים לכל רמה
-        self.base_turret_ranges = BASE_TURRET_RANGES
-        self.base_turret_damages = BASE_TURRET_DAMAGES
-        self.base_turret_cooldowns = BASE_TURRET_COOLDOWNS
+        self.base_turret_ranges = config.BASE_TURRET_RANGES
+        self.base_turret_damages = config.BASE_TURRET_DAMAGES
+        self.base_turret_cooldowns = config.BASE_TURRET_COOLDOWNS
         self.base_turret_last_shot = 0
 
         # יריות טורט (לאנימציה)
-        # כל ירייה: {"start": (x,y), "end": (x,y), "time": ms}
-        self.turret_shots = []
+        # כל ירייה: {"start": (x,y), "end": (x,y), "time": ms}, מ-pool לשימוש חוזר
+        self.turret_shots = ObjectPool(dict)
 
         # enemy turret (auto-upgrade + shots)
         self.enemy_turret_level = 0
         self.enemy_turret_last_shot = 0
-        self.enemy_turret_last_upgrade = pygame.time.get_ticks()
-        self.enemy_turret_upgrade_interval = ENEMY_TURRET_AUTO_UPGRADE_INTERVAL
-
-        # particle effects
-        self.particles = ParticleSystem()
-
-        # dynamic background
-        self.background = Background(self.particles)
+        self.enemy_turret_last_upgrade = now
+        self.enemy_turret_upgrade_interval = config.ENEMY_TURRET_AUTO_UPGRADE_INTERVAL
+
+        # AI של האויב
+        self.enemy_policy = enemy_policy
+        if enemy_policy is not None:
+            enemy_policy.reset(seed)
+
+        # particle effects + dynamic background (not needed when headless)
+        if headless:
+            self.particles = None
+            self.background = None
+        else:
+            self.particles = ParticleSystem(self.rng)
+            self.background = Background(self.particles, self.rng, self.render_rng)
+        # sprites collected per layer during draw() and blitted together
+        self.render_batch = RenderBatch()
+
+        # אירועי קרב: פרסים תמיד, אפקטים ו-shake רק כשיש ציור
+        self.events = EventQueue()
+        self.events.subscribe(self._reward_events, (EVENT_KILL, EVENT_BASE_HIT))
+        if not headless:
+            self.events.subscribe(
+                self._effect_events, (EVENT_HIT, EVENT_KILL, EVENT_BASE_HIT, EVENT_TURRET_FIRE)
+            )
+            self.events.subscribe(self._shake_events, (EVENT_BASE_HIT,))
 
         # screen shake
         self.shake_time = 0
@@ -107,14 +210,40 @@ class Game:
             self.money -= self.unit_cost
             # spawn a bit closer to the front so new units can immediately engage
             start_x = self.player_base.rect.right - 10
-            self.player_units.append(Unit(start_x, "player"))
+            self.player_units.spawn(start_x)
+            self.player_units_spawned += 1
 
     def spawn_enemy_unit(self):
         if self.game_over:
             return
         # spawn enemy slightly closer so they can hit newly spawned defenders
         start_x = self.enemy_base.rect.left - 15
-        self.enemy_units.append(Unit(start_x, "enemy"))
+        self.enemy_units.spawn(start_x)
+        self.enemy_units_spawned += 1
+
+    def buy_enemy_unit(self):
+        """לוחם אויב שנקנה מהכסף של האויב (כשיש enemy_policy)."""
+        if self.game_over:
+            return
+        if self.enemy_money >= self.unit_cost:
+            self.enemy_money -= self.unit_cost
+            self.spawn_enemy_unit()
+
+    def apply_action(self, action, side="player"):
+        """
+        מבצע פעולה אחת (ACTION_*) של side ("player" / "enemy").
+        פעולה לא חוקית פשוט לא עושה כלום.
+        """
+        if side == "player":
+            if action == ACTION_SPAWN:
+                self.spawn_player_unit()
+            elif action == ACTION_UPGRADE:
+                self.upgrade_base_turret()
+        else:
+            if action == ACTION_SPAWN:
+                self.buy_enemy_unit()
+            elif action == ACTION_UPGRADE:
+                self.upgrade_enemy_turret()
 
     # ---------- כסף ו-XP ----------
 
@@ -123,36 +252,42 @@ class Game:
         if delta <= 0:
             return
 
-        seconds = delta / 1000.0
-        self.money += int(self.money_per_second * seconds)
-        self.xp += int(self.xp_per_second * seconds)
-
-        if self.money > MONEY_MAX:
-            self.money = MONEY_MAX
-        if self.xp > XP_MAX:
-            self.xp = XP_MAX
+        # the fraction that doesn't add up to a whole coin / xp point is kept
+        # for the next step instead of being dropped
+        self.money_remainder += self.money_per_second * delta
+        self.xp_remainder += self.xp_per_second * delta
+        money = int(self.money_remainder // 1000)
+        xp = int(self.xp_remainder // 1000)
+        self.money_remainder -= money * 1000
+        self.xp_remainder -= xp * 1000
+        self.money = min(self.money + money, self.config.MONEY_MAX)
+        self.xp = min(self.xp + xp, self.config.XP_MAX)
+        self.enemy_money = min(self.enemy_money + money, self.config.MONEY_MAX)
+        self.enemy_xp = min(self.enemy_xp + xp, self.config.XP_MAX)
 
         self.last_income_time = now
 
-    def reward_for_kills_and_damage(self, enemy_before, enemy_after, base_hp_before):
-        killed = enemy_before - enemy_after
-        if killed > 0:
-            self.money += killed * 150
-            self.xp += killed * 100
-
-        base_damage = base_hp_before - self.enemy_base.hp
-        if base_damage > 0:
-            self.money += base_damage // 10
-            self.xp += base_damage // 5
+    def reward_for_kills_and_damage(self, killed, base_damage, side="player"):
+        money = killed * 150 + base_damage // 10
+        xp = killed * 100 + base_damage // 5
+        if side == "player":
+            self.money += money
+            self.xp += xp
+        else:
+            self.enemy_money += money
+            self.enemy_xp += xp
 
     # ---------- טורט בסיס ----------
 
-    def can_upgrade_turret(self):
-        if self.base_turret_level >= self.base_turret_max_level:
+    def can_upgrade_turret(self, side="player"):
+        if side == "player":
+            level, xp = self.base_turret_level, self.xp
+        else:
+            level, xp = self.enemy_turret_level, self.enemy_xp
+        if level >= self.base_turret_max_level:
             return False
-        next_level = self.base_turret_level + 1
-        cost = self.base_turret_xp_costs[next_level]
-        return self.xp >= cost
+        cost = self.base_turret_xp_costs[level + 1]
+        return xp >= cost
 
     def upgrade_base_turret(self):
         if self.game_over:
@@ -165,6 +300,16 @@ class Game:
         self.xp -= cost
         self.base_turret_level = next_level
 
+    def upgrade_enemy_turret(self):
+        """שדרוג טורט האויב מה-XP שלו (כשיש enemy_policy)."""
+        if self.game_over:
+            return
+        if not self.can_upgrade_turret("enemy"):
+            return
+        self.enemy_turret_level += 1
+        self.enemy_xp -= self.base_turret_xp_costs[self.enemy_turret_level]
+        self.enemy_turret_last_upgrade = self.clock.get_ticks()
+
     def update_base_turret(self, now):
         lvl = self.base_turret_level
         if lvl <= 0:
@@ -179,53 +324,21 @@ class Game:
 
         # חיפוש אויב קרוב בתוך טווח הטורט
         base_x = self.player_base.rect.centerx
-        base_y = self.player_base.rect.top - 15  # גובה הצריח בערך
-        target = None
-        closest = 999999
-
-        for enemy in self.enemy_units:
-            if not enemy.alive:
-                continue
-            dist = abs(enemy.rect.centerx - base_x)
-            if dist <= rng and dist < closest:
-                closest = dist
-                target = enemy
+        target = int(self.enemy_units.nearest(base_x, rng))
 
-        if target is None:
+        if target < 0:
             return
 
-        # ירייה (פגיעה + אנימציה)
+        # ירייה: נרשמת ב-combat, הפגיעה והאנימציה ב-resolve_combat
         self.base_turret_last_shot = now
-
-        # פגיעה
-        target.hp -= dmg
-        if target.hp <= 0:
-            target.alive = False
-
-        # יצירת "ירייה" לרינדור (קו מהבסיס לאויב)
-        start_pos = (base_x, base_y)
-        end_pos = (target.rect.centerx, target.rect.centery - 8)
-        self.turret_shots.append({"start": start_pos, "end": end_pos, "time": now})
-
-        # visual feedback: sparks at hit
-        try:
-            self.particles.spawn_sparks(end_pos, color=(255, 220, 120), count=10)
-        except Exception:
-            pass
-
-        # if hit base, larger explosion + shake
-        if isinstance(target, Base):
-            try:
-                self.particles.spawn_explosion(end_pos)
-            except Exception:
-                pass
-            self.trigger_shake(DEFAULT_SCREEN_SHAKE_DURATION, DEFAULT_SCREEN_SHAKE_MAGNITUDE)
+        self.combat.add(SIDE_PLAYER, SOURCE_TURRET, target, dmg)
+        self._emit_turret_fire(SIDE_PLAYER, self.player_base, self.enemy_units, self.enemy_base, target, dmg)
 
     def update_enemy_turret(self, now):
         """Enemy base turret automatic firing and periodic auto-upgrade."""
         lvl = self.enemy_turret_level
-        # auto-upgrade over time
-        if lvl < self.base_turret_max_level and now - self.enemy_turret_last_upgrade >= self.enemy_turret_upgrade_interval:
+        # auto-upgrade over time (only the legacy enemy; a policy pays XP instead)
+        if self.enemy_policy is None and lvl < self.base_turret_max_level and now - self.enemy_turret_last_upgrade >= self.enemy_turret_upgrade_interval:
             self.enemy_turret_level += 1
             self.enemy_turret_last_upgrade = now
 
@@ -241,53 +354,126 @@ class Game:
 
         # search for closest player unit in range
         base_x = self.enemy_base.rect.centerx
-        base_y = self.enemy_base.rect.top - 15
-        target = None
-        closest = 999999
-
-        for pu in self.player_units:
-            if not pu.alive:
-                continue
-            dist = abs(pu.rect.centerx - base_x)
-            if dist <= rng and dist < closest:
-                closest = dist
-                target = pu
+        target = int(self.player_units.nearest(base_x, rng))
 
         # if no unit, consider hitting player base
-        if target is None and self.player_base is not None:
-            dist = abs(self.player_base.rect.centerx - base_x)
-            if dist <= rng:
-                target = self.player_base
-
-        if target is None:
+        if target < 0 and abs(self.player_base.rect.centerx - base_x) <= rng:
+            target = TARGET_BASE
+        elif target < 0:
             return
 
-        # fire
+        # fire (resolved together with every other attack this tick)
         self.enemy_turret_last_shot = now
-        try:
-            target.hp -= dmg
-        except Exception:
-            pass
-        if isinstance(target, Unit) and target.hp <= 0:
-            target.alive = False
+        self.combat.add(SIDE_ENEMY, SOURCE_TURRET, target, dmg)
+        self._emit_turret_fire(SIDE_ENEMY, self.enemy_base, self.player_units, self.player_base, target, dmg)
 
-        try:
-            end_pos = (target.rect.centerx, target.rect.centery - 8)
-        except Exception:
-            end_pos = (base_x, base_y)
+    def _emit_turret_fire(self, side, own_base, units, base, target, dmg):
+        if not self.events.wants[EVENT_TURRET_FIRE]:
+            return
+        # from the turret (roughly above the base) to the target
+        if target == TARGET_BASE:
+            end = (base.rect.centerx, base.rect.centery - 8)
+        else:
+            end = (int(units.centerx()[target]), units.centery - 8)
+        self.events.emit(
+            EVENT_TURRET_FIRE, side, SOURCE_TURRET, own_base.rect.centerx, own_base.rect.top - 15, dmg, *end
+        )
 
-        # share turret_shots list for visual effect
-        self.turret_shots.append({"start": (base_x, base_y), "end": end_pos, "time": now})
-        try:
-            self.particles.spawn_sparks(end_pos, color=(255, 180, 120), count=8)
-        except Exception:
-            pass
+    # ---------- קרב ----------
+
+    def resolve_combat(self, now):
+        """
+        שלב 2 של הקרב: מחיל את כל כוונות התקיפה של הטיק בבת אחת.
+        נזק ומוות כאן; פרסים, אפקטים ו-shake דרך self.events בסוף.
+        כל התקיפות חושבו לפי המצב בתחילת הטיק, כך שהסדר לא משנה
+        (גם לוחם שמת עכשיו הספיק להכות).
+        """
+        buf = self.combat
+        if len(buf) == 0:
+            return
+        events = self.events
+        sides = (
+            (SIDE_PLAYER, self.enemy_units, self.enemy_base),
+            (SIDE_ENEMY, self.player_units, self.player_base),
+        )
+        for side, units, base in sides:
+            rows = buf.rows(side)
+            if len(rows) == 0:
+                continue
+            target = buf.target[rows]
+            damage = buf.damage[rows]
+            source = buf.source[rows]
+            on_unit = target != TARGET_BASE
+
+            # --- לוחמים ---
+            victims = target[on_unit]
+            flashed = victims[source[on_unit] == SOURCE_UNIT]
+            units.hit_flash_time[flashed] = now
+            killed = units.apply_damage(victims, damage[on_unit])
+            if events.wants[EVENT_HIT] and len(victims) > 0:
+                events.emit(EVENT_HIT, side, source[on_unit], units.centerx()[victims], units.centery, damage[on_unit])
+            if len(killed) > 0:
+                events.emit(EVENT_KILL, side, SOURCE_UNIT, units.centerx()[killed], units.centery)
+
+            # --- בסיס ---
+            hits = damage[~on_unit]
+            base_damage = int(hits.sum())
+            if base_damage > 0:
+                hp_before = base.hp
+                base.take_damage(base_damage, now)
+                # HP that each hit actually took (the base stops at 0)
+                dealt = np.diff(np.minimum(np.cumsum(hits), hp_before), prepend=0)
+                events.emit(EVENT_BASE_HIT, side, source[~on_unit], base.rect.centerx, base.rect.centery, dealt)
+
+        buf.clear()
+        events.dispatch()
+
+    # ---------- צרכני אירועים ----------
+
+    def _reward_events(self, events):
+        """פרסים (כסף + XP) על הריגות ונזק לבסיס, לכל צד."""
+        for side, name in ((SIDE_PLAYER, "player"), (SIDE_ENEMY, "enemy")):
+            killed = len(events.rows(EVENT_KILL, side))
+            base_damage = int(events.value[events.rows(EVENT_BASE_HIT, side)].sum())
+            if killed > 0 or base_damage > 0:
+                self.reward_for_kills_and_damage(killed, base_damage, name)
+
+    def _effect_events(self, events):
+        """חלקיקים ויריות טורט (רק כשיש ציור)."""
+        now = self.clock.get_ticks()
+        particles = self.particles
+        n = events.count
+        fields = (events.kind, events.side, events.source, events.x, events.y, events.x2, events.y2)
+        for kind, side, source, x, y, x2, y2 in zip(*(f[:n].tolist() for f in fields)):
+            if kind == EVENT_TURRET_FIRE:
+                # יצירת "ירייה" לרינדור (קו מהבסיס לאויב)
+                shot = self.turret_shots.acquire()
+                shot["start"] = (x, y)
+                shot["end"] = (x2, y2)
+                shot["time"] = now
+                color, count = TURRET_SPARKS[side]
+                particles.spawn_sparks((x2, y2), color=color, count=count)
+            elif kind == EVENT_KILL:
+                particles.spawn_explosion((x, y), color=(200, 60, 60), count=10)
+            elif source == SOURCE_TURRET:
+                # turret hits are drawn by their EVENT_TURRET_FIRE
+                continue
+            elif kind == EVENT_BASE_HIT:
+                # impact explosion at the base
+                particles.spawn_explosion((x, y))
+            else:
+                # small blood/spark particles at the target
+                particles.spawn_blood((x, y))
+
+    def _shake_events(self, events):
+        """רעידת מסך כשלוחם פוגע בבסיס."""
+        rows = events.rows(EVENT_BASE_HIT)
+        if (events.source[rows] == SOURCE_UNIT).any():
+            self.trigger_shake(DEFAULT_SCREEN_SHAKE_DURATION, DEFAULT_SCREEN_SHAKE_MAGNITUDE)
 
     def update_turret_shots(self, now):
         # משאירים רק יריות חדשות (אנימציה קצרה ~120ms)
-        self.turret_shots = [
-            s for s in self.turret_shots if now - s["time"] < 120
-        ]
+        self.turret_shots.sweep(lambda s: now - s["time"] < 120)
 
     # ---------- עדכון ----------
 
@@ -295,54 +481,46 @@ class Game:
         if self.game_over:
             return
 
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
 
         self.give_time_income(now)
 
-        if now - self.last_enemy_spawn_time >= self.enemy_spawn_interval:
+        if self.enemy_policy is not None:
+            self.apply_action(self.enemy_policy.act(self), "enemy")
+        elif now - self.last_enemy_spawn_time >= self.enemy_spawn_interval:
             self.spawn_enemy_unit()
             self.last_enemy_spawn_time = now
 
         # update background
-        try:
+        if self.background is not None:
             self.background.update(dt)
-        except Exception:
-            pass
-
-        enemy_before = len(self.enemy_units)
-        base_hp_before = self.enemy_base.hp
-
-        for u in self.player_units:
-            ev = u.update(dt, now, self.enemy_units, self.enemy_base, self.particles)
-            if ev and ev.get("base_hit"):
-                self.trigger_shake(DEFAULT_SCREEN_SHAKE_DURATION, DEFAULT_SCREEN_SHAKE_MAGNITUDE)
-
-        for u in self.enemy_units:
-            ev = u.update(dt, now, self.player_units, self.player_base, self.particles)
-            if ev and ev.get("base_hit"):
-                self.trigger_shake(DEFAULT_SCREEN_SHAKE_DURATION, DEFAULT_SCREEN_SHAKE_MAGNITUDE)
 
+        # שלב 1: כל התוקפים רושמים כוונות לפי המצב בתחילת הטיק
+        player_moving = self.player_units.plan_attacks(
+            now, self.enemy_units, self.enemy_base, self.combat, SIDE_PLAYER
+        )
+        enemy_moving = self.enemy_units.plan_attacks(
+            now, self.player_units, self.player_base, self.combat, SIDE_ENEMY
+        )
         # טורט בסיס (player + enemy)
         self.update_base_turret(now)
         # enemy turret (auto-upgrade + fire)
-        try:
-            self.update_enemy_turret(now)
-        except Exception:
-            pass
+        self.update_enemy_turret(now)
+
+        # מי שלא תוקף הולך קדימה
+        self.player_units.walk(dt, player_moving)
+        self.enemy_units.walk(dt, enemy_moving)
+
+        # שלב 2: נזק, מוות, פרסים ואפקטים בבת אחת
+        self.resolve_combat(now)
         self.update_turret_shots(now)
 
         # update particles system
-        try:
+        if self.particles is not None:
             self.particles.update(dt)
-        except Exception:
-            pass
 
-        self.player_units = [u for u in self.player_units if u.alive]
-        self.enemy_units = [u for u in self.enemy_units if u.alive]
-
-        enemy_after = len(self.enemy_units)
-
-        self.reward_for_kills_and_damage(enemy_before, enemy_after, base_hp_before)
+        self.player_units.compact()
+        self.enemy_units.compact()
 
         if self.player_base.is_dead():
             self.game_over = True
@@ -351,6 +529,35 @@ class Game:
             self.game_over = True
             self.winner = "player"
 
+    def advance(self, ms):
+        """
+        מקדם את השעון המדומה ב-ms ומעדכן את המשחק (מצב headless).
+        """
+        self.clock.advance(ms)
+        self.update(ms)
+
+    def coast(self, ms):
+        """
+        אחרי שהסימולציה נעצרה (game over, או סוף replay): השעון ממשיך לרוץ
+        בשביל הציור בלבד, כדי ש-shake, הבהובי פגיעה, אנימציות תקיפה, יריות
+        טורט וחלקיקים ייגמרו. שום דבר בסימולציה לא משתנה.
+        """
+        self.clock.advance(ms)
+        self.update_turret_shots(self.clock.get_ticks())
+        if self.particles is not None:
+            self.particles.update(ms)
+
+    def step(self):
+        """
+        צעד סימולציה קבוע אחד (1 / SIM_TICK_RATE שניות).
+        Tick lengths are whole milliseconds (16/17/17 at 60 Hz), so the
+        clock never accumulates floating point drift.
+        """
+        start = self.tick * 1000 // SIM_TICK_RATE
+        end = (self.tick + 1) * 1000 // SIM_TICK_RATE
+        self.tick += 1
+        self.advance(end - start)
+
     # ---------- ציור ----------
 
     def draw_turret_shots(self, surface):
@@ -364,7 +571,7 @@ class Game:
             pygame.draw.circle(surface, glow_color, end, 6)
 
     def trigger_shake(self, duration_ms, magnitude):
-        self.shake_time = pygame.time.get_ticks()
+        self.shake_time = self.clock.get_ticks()
         self.shake_duration = duration_ms
         self.shake_magnitude = magnitude
 
@@ -418,23 +625,30 @@ class Game:
                 (WIDTH // 2 - t2.get_width() // 2, HEIGHT // 2 + 20),
             )
 
+    def set_lod(self, lod):
+        """רמת הפירוט של האפקטים (lod.LodLevel, למשל מ- LodGovernor)."""
+        if self.particles is not None:
+            self.particles.lod = lod
+
     def draw(self, surface):
+        now = self.clock.get_ticks()
+
         # draw everything to a temp surface so we can apply screen shake
         temp = pygame.Surface((WIDTH, HEIGHT))
         # dynamic background (includes gradient)
+        batch = self.render_batch
         try:
-            self.background.draw(temp)
+            self.background.draw(temp, batch)
         except Exception:
             draw_gradient_background(temp)
         draw_ground(temp)
 
-        self.player_base.draw(temp)
-        self.enemy_base.draw(temp)
+        self.player_base.draw(temp, now)
+        self.enemy_base.draw(temp, now)
 
-        for u in self.player_units:
-            u.draw(temp)
-        for u in self.enemy_units:
-            u.draw(temp)
+        self.player_units.draw(temp, now, batch)
+        self.enemy_units.draw(temp, now, batch)
+        batch.flush(temp, "units")
 
         # turret shots and UI
         self.draw_turret_shots(temp)
@@ -442,23 +656,21 @@ class Game:
 
         # particles on top
         try:
-            self.particles.draw(temp)
+            self.particles.draw(temp, batch)
+            batch.flush(temp, "particles")
         except Exception:
-            pass
+            batch.clear()
 
         # compute shake offset
         ox = oy = 0
         if self.shake_duration > 0:
-            now = pygame.time.get_ticks()
             elapsed = now - self.shake_time
             if elapsed < self.shake_duration:
                 # damping factor
                 rem = 1.0 - (elapsed / float(self.shake_duration))
                 mag = int(self.shake_magnitude * rem)
-                import random
-
-                ox = random.randint(-mag, mag)
-                oy = random.randint(-mag // 2, mag // 2)
+                ox = self.render_rng.randint(-mag, mag)
+                oy = self.render_rng.randint(-mag // 2, mag // 2)
             else:
                 self.shake_duration = 0
                 self.shake_magnitude = 0
@@ -467,7 +679,146 @@ class Game:
         surface.fill((0, 0, 0))
         surface.blit(temp, (ox, oy))
 
+    # ---------- snapshot / restore ----------
+
+    def snapshot(self, include_cosmetic=False):
+        """
+        מצב הסימולציה (בסיסים, יחידות, כלכלה, טיימרים של טורטים ואויב).
+        include_cosmetic=True שומר גם חלקיקים, רקע, יריות טורט, shake וה-RNG
+        (עותק עמוק, איטי בהרבה - בשביל rollback של משחק עם חלון).
+        """
+        pb = self.player_base
+        eb = self.enemy_base
+        sim = (
+            pb.hp,
+            pb.hit_flash_time,
+            eb.hp,
+            eb.hit_flash_time,
+            self.money,
+            self.xp,
+            self.enemy_money,
+            self.enemy_xp,
+            self.last_income_time,
+            self.money_remainder,
+            self.xp_remainder,
+            self.last_enemy_spawn_time,
+            self.base_turret_level,
+            self.base_turret_last_shot,
+            self.enemy_turret_level,
+            self.enemy_turret_last_shot,
+            self.enemy_turret_last_upgrade,
+            self.player_units_spawned,
+            self.enemy_units_spawned,
+            self.game_over,
+            self.winner,
+        )
+        cosmetic = None
+        if include_cosmetic:
+            cosmetic = self._copy_cosmetic(
+                (
+                    self.rng.getstate(),
+                    self.render_rng.getstate(),
+                    self.particles,
+                    self.background,
+                    [dict(shot) for shot in self.turret_shots],
+                    (self.shake_time, self.shake_duration, self.shake_magnitude),
+                )
+            )
+        return GameSnapshot(
+            self.tick,
+            self.clock.get_ticks(),
+            sim,
+            self.player_units.get_state(),
+            self.enemy_units.get_state(),
+            cosmetic,
+        )
+
+    def restore(self, snap):
+        """
+        מחזיר את המשחק למצב של snap. אפשר לשחזר מאותו snapshot כמה פעמים.
+        השעון חוזר אחורה רק אם הוא SimClock (לשעון אמיתי אין "אחורה").
+        """
+        (
+            self.player_base.hp,
+            self.player_base.hit_flash_time,
+            self.enemy_base.hp,
+            self.enemy_base.hit_flash_time,
+            self.money,
+            self.xp,
+            self.enemy_money,
+            self.enemy_xp,
+            self.last_income_time,
+            self.money_remainder,
+            self.xp_remainder,
+            self.last_enemy_spawn_time,
+            self.base_turret_level,
+            self.base_turret_last_shot,
+            self.enemy_turret_level,
+            self.enemy_turret_last_shot,
+            self.enemy_turret_last_upgrade,
+            self.player_units_spawned,
+            self.enemy_units_spawned,
+            self.game_over,
+            self.winner,
+        ) = snap.sim
+        self.player_units.set_state(snap.player_units)
+        self.enemy_units.set_state(snap.enemy_units)
+        self.combat.clear()
+        self.events.clear()
+        self.tick = snap.tick
+        if isinstance(self.clock, SimClock):
+            self.clock.now = snap.now
+
+        if snap.cosmetic is not None and not self.headless:
+            rng_state, render_state, particles, background, shots, shake = self._copy_cosmetic(
+                snap.cosmetic
+            )
+            self.rng.setstate(rng_state)
+            self.render_rng.setstate(render_state)
+            # the background copy carries its own RNGs; point them back at ours
+            # (the particle system keeps its copied NumPy generator)
+            background.rng = self.rng
+            background.render_rng = self.render_rng
+            self.particles = particles
+            self.background = background
+            self.turret_shots.clear()
+            for shot in shots:
+                self.turret_shots.acquire().update(shot)
+            self.shake_time, self.shake_duration, self.shake_magnitude = shake
+
+    def clone(self, enemy_policy=None):
+        """
+        עותק headless של המשחק (אותם settings ו-seed, SimClock משלו), בשביל lookahead.
+        enemy_policy = ה-AI של האויב בעותק (None = הטיימר הישן). ה-AI של המשחק
+        המקורי לא מועתק: הוא יכול להחזיק worker או מצב שלא שייך לעותק.
+        """
+        twin = Game(clock=SimClock(), headless=True, seed=self.seed, config=self.config, enemy_policy=enemy_policy)
+        twin.restore(self.snapshot())
+        return twin
+
+    @staticmethod
+    def _copy_cosmetic(state):
+        if state[3] is None:
+            return copy.deepcopy(state)
+        # the pre-rendered sky and particle sprites are shared caches, and
+        # pygame surfaces can't be copied this way
+        sky = state[3].base_surface
+        sprites = state[2].sprites
+        return copy.deepcopy(state, {id(sky): sky, id(sprites): sprites})
+
     # ---------- איפוס ----------
 
-    def reset(self):
-        self.__init__()
+    def reset(self, seed=None):
+        """
+        משחק חדש. seed=None -> seed חדש ואקראי.
+        """
+        if isinstance(self.clock, SimClock):
+            # a fresh match restarts simulated time at zero
+            self.clock = SimClock()
+        self.__init__(
+            clock=self.clock,
+            headless=self.headless,
+            seed=seed,
+            config=self.config,
+            enemy_policy=self.enemy_policy,
+        )
@@ -0,0 +1,121 @@
+"""
+lod.py
+רמות פירוט (LOD) לאפקטים, ו- LodGovernor שבוחר רמה לפי זמני הפריים.
+
+רמה 0 = הכל. כל רמה מעליה מורידה עוד משהו: פחות חלקיקים בכל פיצוץ,
+חיים קצרים יותר, בלי עשן, פחות שובלי טילים, ובציור מדלגים על חלקיקים
+כמעט שקופים. הסימולציה לא מושפעת - רק מה שרואים.
+
+    governor = LodGovernor(target_fps=60)
+    game.set_lod(governor.update(clock.get_rawtime()))  # פעם בפריים
+"""
+
+
+class LodLevel:
+    """
+    spawn = כפולה למספר החלקיקים בכל spawn, life = כפולה לזמן החיים,
+    smoke = האם יש עשן, tracers = כמה חלקיקים בשובל של טיל (0 = בלי),
+    min_alpha = רמת האלפא (מתוך visuals.SPRITE_ALPHA_LEVELS) שמתחתיה לא מציירים.
+    """
+
+    __slots__ = ("spawn", "life", "smoke", "tracers", "min_alpha")
+
+    def __init__(self, spawn, life, smoke, tracers, min_alpha):
+        self.spawn = spawn
+        self.life = life
+        self.smoke = smoke
+        self.tracers = tracers
+        self.min_alpha = min_alpha
+
+    def count(self, n):
+        """כמה חלקיקים במקום n (לפחות 1 אם n > 0)."""
+        if n <= 0:
+            return 0
+        return max(1, int(n * self.spawn + 0.5))
+
+
+# smoke is the biggest and slowest-fading particle, so it goes first
+LOD_LEVELS = (
+    LodLevel(spawn=1.0, life=1.0, smoke=True, tracers=7, min_alpha=1),
+    LodLevel(spawn=0.75, life=0.85, smoke=True, tracers=4, min_alpha=2),
+    LodLevel(spawn=0.6, life=0.75, smoke=False, tracers=3, min_alpha=3),
+    LodLevel(spawn=0.4, life=0.6, smoke=False, tracers=2, min_alpha=5),
+    LodLevel(spawn=0.25, life=0.5, smoke=False, tracers=0, min_alpha=7),
+)
+
+
+class LodGovernor:
+    """
+    מחזיק ממוצע נע של זמן העבודה בפריים (ms, בלי ההמתנה של clock.tick)
+    ומשווה אותו לתקציב של target_fps:
+    - מעל התקציב  -> רמה אחת למטה באיכות (level + 1)
+    - מתחת ל- recover * תקציב לאורך recover_frames -> רמה אחת למעלה
+    אחרי כל שינוי מחכים hold_frames פריימים, כדי שהממוצע יספיק להגיב.
+    """
+
+    def __init__(
+        self,
+        target_fps=60,
+        levels=LOD_LEVELS,
+        smoothing=0.1,
+        recover=0.6,
+        hold_frames=30,
+        recover_frames=120,
+    ):
+        self.budget_ms = 1000.0 / target_fps
+        self.levels = levels
+        self.smoothing = smoothing
+        self.recover = recover
+        self.hold_frames = hold_frames
+        self.recover_frames = recover_frames
+        self.level = 0
+        self.frame_ms = 0.0
+        self._since_change = 0
+        self._calm = 0
+
+        # סטטיסטיקות
+        self.frames = 0
+        self.downgrades = 0
+        self.upgrades = 0
+
+    @property
+    def lod(self):
+        return self.levels[self.level]
+
+    def update(self, frame_ms):
+        """מעדכן לפי זמן הפריים האחרון ומחזיר את ה- LodLevel הנוכחי."""
+        if self.frames == 0:
+            self.frame_ms = float(frame_ms)
+        else:
+            self.frame_ms += (frame_ms - self.frame_ms) * self.smoothing
+        self.frames += 1
+        self._since_change += 1
+
+        if self.frame_ms < self.budget_ms * self.recover:
+            self._calm += 1
+        else:
+            self._calm = 0
+
+        if self._since_change >= self.hold_frames:
+            if self.frame_ms > self.budget_ms and self.level < len(self.levels) - 1:
+                self._set(self.level + 1)
+                self.downgrades += 1
+            elif self._calm >= self.recover_frames and self.level > 0:
+                self._set(self.level - 1)
+                self.upgrades += 1
+        return self.levels[self.level]
+
+    def _set(self, level):
+        self.level = level
+        self._since_change = 0
+        self._calm = 0
+
+    def stats(self):
+        return {
+            "level": self.level,
+            "frame_ms": self.frame_ms,
+            "budget_ms": self.budget_ms,
+            "frames": self.frames,
+            "downgrades": self.downgrades,
+            "upgrades": self.upgrades,
+        }
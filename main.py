@@ -1,14 +1,57 @@
+import argparse
+import os
 import sys
 import pygame
-from settings import WIDTH, HEIGHT, FPS, TEXT_COLOR
-from visuals import draw_gradient_background, draw_ground, ensure_fonts
-from game import Game
+from settings import WIDTH, HEIGHT, FPS, TEXT_COLOR, SIM_TICK_RATE, SIM_MAX_FRAME_MS
+from visuals import SPRITES, draw_gradient_background, draw_ground, ensure_fonts
+from game import Game, ACTION_SPAWN, ACTION_UPGRADE
+from enemy_ai import EnemyAI
+from lod import LodGovernor
+from policies import POLICIES, make_policy
+from replay import ReplayRecorder
+from timing import SimClock
 from music import play_background_music
 
 from menu import Menu, draw_game_over_menu
 
 
+def finish_replay(recorder, record_dir):
+    """שומר את ה-replay של המשחק שנגמר (אם מקליטים)."""
+    if recorder is None:
+        return
+    replay = recorder.finish()
+    replay.save(os.path.join(record_dir, f"match-{replay.seed}.gowr"))
+
+
+def restart(game, recorder, record_dir):
+    """game.reset() + replay חדש. מחזיר את ה-recorder של המשחק החדש."""
+    finish_replay(recorder, record_dir)
+    game.reset()
+    return ReplayRecorder(game) if record_dir else None
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Mini Age of War")
+    parser.add_argument("--record", metavar="DIR", help="save a replay of every match into DIR")
+    parser.add_argument("--enemy", choices=sorted(POLICIES), help="AI policy for the enemy (default: spawn timer)")
+    parser.add_argument("--enemy-worker", choices=["thread", "process"], help="run the enemy AI off the frame loop")
+    parser.add_argument("--enemy-budget-ms", type=float, default=None, help="per-tick time budget for the enemy AI")
+    parser.add_argument("--lod-stats", action="store_true", help="print the effects level-of-detail stats on exit")
+    args = parser.parse_args()
+    if args.record and args.enemy:
+        # a replay stores only the player's inputs and assumes the built-in enemy
+        parser.error("--record only works with the built-in enemy")
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+    recorder = None
+
+    def act(action):
+        # כל פעולה של השחקן עוברת דרך ה-recorder כדי שתיכנס ל-replay
+        if recorder is not None:
+            recorder.record(action)
+        else:
+            game.apply_action(action)
+
     pygame.init()
     # ensure visuals fonts are created after pygame.init()
     ensure_fonts()
@@ -23,7 +66,15 @@ def main():
     pygame.display.set_caption("Mini Age of War - Pygame (OOP)")
     clock = pygame.time.Clock()
 
-    game = Game()
+    # the simulation runs on its own clock in fixed steps, decoupled from FPS
+    enemy = None
+    if args.enemy:
+        enemy = EnemyAI(make_policy(args.enemy, realtime=True), budget_ms=args.enemy_budget_ms, worker=args.enemy_worker)
+    game = Game(clock=SimClock(), enemy_policy=enemy)
+    step_ms = 1000.0 / SIM_TICK_RATE
+    accumulator = 0.0
+    # fewer/shorter-lived particles when frames get too slow for FPS
+    governor = LodGovernor(target_fps=FPS)
 
     # menu instance
     menu = Menu(["Start Game", "Quit"])
@@ -42,7 +93,7 @@ def main():
                 if event.type == pygame.KEYDOWN:
                     res = menu.handle_key(event.key)
                     if res == "Start Game":
-                        game.reset()
+                        recorder = restart(game, recorder, args.record)
                         state = "playing"
                     elif res == "Quit":
                         running = False
@@ -51,7 +102,7 @@ def main():
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     res = menu.handle_mouse(event.pos)
                     if res == "Start Game":
-                        game.reset()
+                        recorder = restart(game, recorder, args.record)
                         state = "playing"
                     elif res == "Quit":
                         running = False
@@ -61,19 +112,19 @@ def main():
                         if event.key == pygame.K_ESCAPE:
                             running = False
                         if event.key == pygame.K_SPACE:
-                            game.spawn_player_unit()
+                            act(ACTION_SPAWN)
                         if event.key == pygame.K_1:
-                            game.upgrade_base_turret()
+                            act(ACTION_UPGRADE)
                         # R: reset while playing
                         if event.key == pygame.K_r:
-                            game.reset()
+                            recorder = restart(game, recorder, args.record)
                             state = "playing"
                     else:
                         # when game over, allow returning to menu, restarting or quitting
                         if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                             state = "menu"
                         elif event.key == pygame.K_r:
-                            game.reset()
+                            recorder = restart(game, recorder, args.record)
                             state = "playing"
                         elif event.key in (pygame.K_q, pygame.K_ESCAPE):
                             running = False
@@ -85,14 +136,31 @@ def main():
         # draw/update per state
         if state == "menu":
             menu.draw(screen)
+            accumulator = 0.0
         elif state == "playing":
             if not game.game_over:
-                game.update(dt)
+                # fixed-step accumulator: run as many sim ticks as real time allows
+                accumulator += min(dt, SIM_MAX_FRAME_MS)
+                while accumulator >= step_ms:
+                    game.step()
+                    accumulator -= step_ms
+            else:
+                # the match is over but shake, flashes and shots still fade out
+                game.coast(min(dt, SIM_MAX_FRAME_MS))
             # draw the game (Game.draw already shows the overlay + message when game_over)
+            # get_rawtime = last frame's work, without the FPS-cap wait
+            game.set_lod(governor.update(clock.get_rawtime()))
             game.draw(screen)
 
         pygame.display.flip()
 
+    finish_replay(recorder, args.record)
+    if args.lod_stats:
+        print("lod:", governor.stats())
+        print("particle sprites:", game.particles.sprites.stats())
+        print("other sprites:", SPRITES.stats())
+    if enemy is not None:
+        enemy.close()
     pygame.quit()
     sys.exit()
 
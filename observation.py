@@ -0,0 +1,150 @@
+"""
+observation.py
+קידוד מצב של Game למערך NumPy בגודל קבוע (קלט לסוכן / רשת).
+
+מבנה התצפית (float32, באורך encoder.size):
+    [player count | player hp | enemy count | enemy hp]  היסטוגרמות לאורך המסלול (bins כל אחת)
+    ואחריהן SCALARS (ראו למטה).
+
+count = מספר הלוחמים בכל תא, hp = סכום ה-HP היחסי (hp / max_hp) שלהם.
+encode() כותב לתוך מערך קיים (למשל שורה של מערך משותף), בלי הקצאות.
+"""
+
+import numpy as np
+
+from settings import WIDTH
+
+
+# שמות הסקלרים, לפי הסדר שלהם אחרי ההיסטוגרמות
+SCALARS = (
+    "player_base_hp",
+    "enemy_base_hp",
+    "money",
+    "xp",
+    "can_spawn",
+    "can_upgrade",
+    "player_turret_level",
+    "enemy_turret_level",
+    "player_turret_cooldown",
+    "enemy_turret_cooldown",
+    "enemy_spawn_timer",
+)
+
+
+class ObservationEncoder:
+    """
+    bins = מספר התאים לאורך המסלול (0..WIDTH) בכל היסטוגרמה.
+    חוצצי העבודה מוקצים פעם אחת ומוגדלים רק כשיש יותר לוחמים מאי פעם.
+    """
+
+    def __init__(self, bins=16, capacity=64):
+        self.bins = bins
+        self.size = 4 * bins + len(SCALARS)
+        self.bin_scale = bins / float(WIDTH)
+        self._pos = np.zeros(capacity, dtype=np.float64)
+        self._idx = np.zeros(capacity, dtype=np.intp)
+
+    def empty(self, n=None):
+        """מערך תצפיות חדש: (size,) או (n, size) רציף, לשימוש חוזר."""
+        shape = (self.size,) if n is None else (n, self.size)
+        return np.zeros(shape, dtype=np.float32)
+
+    def encode(self, game, out):
+        """כותב את התצפית של game לתוך out (באורך self.size) ומחזיר אותו."""
+        bins = self.bins
+        out[: 4 * bins] = 0.0
+        self._lane(game.player_units, out[:bins], out[bins : 2 * bins])
+        self._lane(game.enemy_units, out[2 * bins : 3 * bins], out[3 * bins : 4 * bins])
+
+        config = game.config
+        now = game.clock.get_ticks()
+        s = 4 * bins
+        out[s] = game.player_base.hp / game.player_base.max_hp
+        out[s + 1] = game.enemy_base.hp / game.enemy_base.max_hp
+        out[s + 2] = game.money / config.MONEY_MAX
+        out[s + 3] = game.xp / config.XP_MAX
+        out[s + 4] = game.money >= game.unit_cost
+        out[s + 5] = game.can_upgrade_turret()
+        out[s + 6] = game.base_turret_level / game.base_turret_max_level
+        out[s + 7] = game.enemy_turret_level / game.base_turret_max_level
+        out[s + 8] = self._cooldown(game, game.base_turret_level, game.base_turret_last_shot, now)
+        out[s + 9] = self._cooldown(game, game.enemy_turret_level, game.enemy_turret_last_shot, now)
+        out[s + 10] = min(1.0, (now - game.last_enemy_spawn_time) / game.enemy_spawn_interval)
+        return out
+
+    def encode_batch(self, games, out):
+        """out = מערך (len(games), size); כל משחק נכתב לשורה שלו."""
+        for i, game in enumerate(games):
+            self.encode(game, out[i])
+        return out
+
+    def encode_sim(self, sim, out):
+        """
+        כמו encode() לכל המשחקים של vecsim.VecSim בבת אחת: out = (sim.n, size).
+        ההיסטוגרמות דרך bincount אחד לכל צד על כל המשחקים (שורה g = תאים g*bins...).
+        """
+        bins = self.bins
+        n = sim.n
+        offsets = np.arange(n)[:, None] * bins
+        for lanes, s in ((sim.players, 0), (sim.enemies, 2 * bins)):
+            m = lanes.width_used()
+            if m == 0:
+                out[:, s : s + 2 * bins] = 0.0
+                continue
+            alive = lanes.alive[:, :m]
+            pos = (lanes.x[:, :m] + lanes.width / 2) * self.bin_scale
+            idx = (np.clip(pos, 0, bins - 1).astype(np.intp) + offsets)[alive]
+            out[:, s : s + bins] = np.bincount(idx, minlength=n * bins).reshape(n, bins)
+            hp = lanes.hp[:, :m][alive] / lanes.max_hp
+            out[:, s + bins : s + 2 * bins] = np.bincount(idx, hp, minlength=n * bins).reshape(n, bins)
+
+        config = sim.config
+        max_level = sim.turret_max_level
+        now = sim.now
+        s = 4 * bins
+        out[:, s] = sim.player_base_hp / config.PLAYER_BASE_MAX_HP
+        out[:, s + 1] = sim.enemy_base_hp / config.ENEMY_BASE_MAX_HP
+        out[:, s + 2] = sim.money / config.MONEY_MAX
+        out[:, s + 3] = sim.xp / config.XP_MAX
+        out[:, s + 4] = sim.money >= config.UNIT_COST
+        out[:, s + 5] = sim.can_upgrade()
+        out[:, s + 6] = sim.player_turret_level / max_level
+        out[:, s + 7] = sim.enemy_turret_level / max_level
+        out[:, s + 8] = self._cooldowns(sim, sim.player_turret_level, sim.player_turret_last_shot)
+        out[:, s + 9] = self._cooldowns(sim, sim.enemy_turret_level, sim.enemy_turret_last_shot)
+        out[:, s + 10] = np.minimum(1.0, (now - sim.last_enemy_spawn_time) / config.ENEMY_SPAWN_INTERVAL)
+        return out
+
+    def _lane(self, units, count, hp):
+        n = units.count
+        if n == 0:
+            return
+        if n > len(self._pos):
+            self._pos = np.zeros(units.capacity, dtype=np.float64)
+            self._idx = np.zeros(units.capacity, dtype=np.intp)
+        pos = self._pos[:n]
+        idx = self._idx[:n]
+        # תא לפי מרכז הלוחם, חסום לטווח המסלול
+        np.add(units.x[:n], units.width / 2, out=pos)
+        np.multiply(pos, self.bin_scale, out=pos)
+        np.clip(pos, 0, self.bins - 1, out=pos)
+        idx[:] = pos
+        # dead units are compacted away at the end of every tick
+        np.add.at(count, idx, 1.0)
+        np.divide(units.hp[:n], units.max_hp, out=pos)
+        np.add.at(hp, idx, pos)
+
+    @staticmethod
+    def _cooldown(game, level, last_shot, now):
+        """כמה מה-cooldown של הטורט עוד נשאר (0 = מוכן לירות)."""
+        if level <= 0:
+            return 0.0
+        cd = game.base_turret_cooldowns[level]
+        return max(0.0, cd - (now - last_shot)) / cd
+
+    @staticmethod
+    def _cooldowns(sim, level, last_shot):
+        """_cooldown לכל המשחקים (רמה 0 = 0)."""
+        cd = sim.turret_cooldowns[level]
+        left = np.maximum(0.0, cd - (sim.now - last_shot)) / np.maximum(cd, 1)
+        return np.where(level > 0, left, 0.0)
@@ -0,0 +1,399 @@
+"""
+policies.py
+שחקנים אוטומטיים (scripted / AI) למשחקים בלי חלון.
+
+כל מדיניות (policy) מקבלת את Game ומחזירה פעולה אחת (ACTION_*) לכל טיק.
+BatchPolicy מקבלת מערך תצפיות של הרבה משחקים (observation.py) ומחזירה
+מערך פעולות בקריאה אחת (ראו scheduler.py).
+"""
+
+import copy
+import random
+import time
+
+import numpy as np
+
+from enemy_ai import EnemyView
+from game import ACTION_NOOP, ACTION_SPAWN, ACTION_UPGRADE
+from observation import SCALARS
+from transposition import ZobristHasher
+
+
+class Policy:
+    """
+    בסיס לכל המדיניות. reset() נקרא בתחילת כל משחק עם ה-seed שלו.
+    seeded = האם ה-seed משנה את ההחלטות (רק policies אקראיות).
+    """
+
+    name = "noop"
+    seeded = False
+
+    def reset(self, seed):
+        pass
+
+    def act(self, game):
+        return ACTION_NOOP
+
+
+class IdlePolicy(Policy):
+    """לא עושה כלום (בסיס להשוואה)."""
+
+    name = "idle"
+
+
+class GreedyPolicy(Policy):
+    """משדרג טורט ברגע שאפשר, אחרת שולח לוחם ברגע שיש כסף."""
+
+    name = "greedy"
+
+    def act(self, game):
+        if game.can_upgrade_turret():
+            return ACTION_UPGRADE
+        if game.money >= game.unit_cost:
+            return ACTION_SPAWN
+        return ACTION_NOOP
+
+
+class SaverPolicy(Policy):
+    """
+    אוסף כסף ושולח גל של לוחמים בבת אחת (wave לפי גודל).
+    """
+
+    name = "saver"
+
+    def __init__(self, wave=4):
+        self.wave = wave
+        self.sending = 0
+
+    def reset(self, seed):
+        self.sending = 0
+
+    def act(self, game):
+        if game.can_upgrade_turret():
+            return ACTION_UPGRADE
+        if self.sending == 0 and game.money >= game.unit_cost * self.wave:
+            self.sending = self.wave
+        if self.sending > 0 and game.money >= game.unit_cost:
+            self.sending -= 1
+            return ACTION_SPAWN
+        return ACTION_NOOP
+
+
+class RandomPolicy(Policy):
+    """
+    פעולה אקראית כל טיק (RNG משלה, seed מהמשחק, כדי שהכל יהיה דטרמיניסטי).
+    """
+
+    name = "random"
+    seeded = True
+
+    def __init__(self, p_spawn=0.02, p_upgrade=0.01):
+        self.p_spawn = p_spawn
+        self.p_upgrade = p_upgrade
+        self.rng = random.Random()
+
+    def reset(self, seed):
+        self.rng = random.Random(seed)
+
+    def act(self, game):
+        r = self.rng.random()
+        if r < self.p_upgrade:
+            return ACTION_UPGRADE
+        if r < self.p_upgrade + self.p_spawn:
+            return ACTION_SPAWN
+        return ACTION_NOOP
+
+
+class Plan:
+    """
+    רצף פעולות מועמד ל- LookaheadPolicy: מחכים delay_ms, מבצעים את action
+    ברגע שהוא חוקי (למשל חוסכים עד שיש XP לשדרוג), ואז ממשיכים עם then
+    (Policy) או לא עושים כלום.
+    """
+
+    def __init__(self, label, action=ACTION_NOOP, delay_ms=0, then=None):
+        self.label = label
+        self.action = action
+        self.delay_ms = delay_ms
+        self.then = then
+        self.fired = False
+
+    def begin(self):
+        self.fired = False
+        return self
+
+    def act(self, view, elapsed_ms):
+        if not self.fired:
+            if elapsed_ms < self.delay_ms:
+                return ACTION_NOOP
+            if self.action == ACTION_SPAWN and view.money < view.unit_cost:
+                return ACTION_NOOP
+            if self.action == ACTION_UPGRADE and not view.can_upgrade_turret():
+                return ACTION_NOOP
+            self.fired = True
+            if self.action != ACTION_NOOP:
+                return self.action
+        if self.then is not None:
+            return self.then.act(view)
+        return ACTION_NOOP
+
+
+class _Puppet:
+    """enemy_policy לעותקים: לא מחליט כלום בעצמו, הפעולות מגיעות מה-rollout."""
+
+    name = "puppet"
+
+    def reset(self, seed):
+        pass
+
+    def act(self, game):
+        return ACTION_NOOP
+
+
+class LookaheadPolicy(Policy):
+    """
+    מדמה קדימה כל Plan מ-plans על עותק headless של המשחק (horizon_ms של זמן
+    משחק) ובוחרת את זו עם הציון הכי טוב (ראו evaluate). הבחירה מתבצעת כל
+    decide_every_ms, ובין לבין ממשיכים את ה-Plan שנבחרה.
+
+    budget_ms = זמן מקסימלי להחלטה (וגם ה-deadline של EnemyAI, אם קרוב יותר).
+    כמה plans נבדקות תלוי במהירות המחשב; budget_ms=None בודק את כולן (דטרמיניסטי,
+    וכך make_policy בונה אותה לריצות headless).
+    rollout_step_ms = צעד הסימולציה בתוך ה-rollout: גס מ-step() הרגיל, כי
+    מה שחשוב הוא הכיוון של המשחק ולא כל פיקסל.
+    opponent = המודל של היריב ב-rollouts (כשהאויב הוא AI או כשאנחנו האויב).
+    table = TranspositionTable (לא חובה): מצב שכבר נבדק (לפי ZobristHasher)
+    מקבל את אותה Plan בלי rollouts, אם כל ה-plans נבדקו בו. חיפוש שנקטע
+    ב-budget נשמר עם מסכת ה-plans שנבדקו: בביקור הבא ה-Plan הכי טובה שלו רצה
+    ראשונה, ואחריה רק plans שעוד לא נבדקו, עד שהרשומה מלאה.
+    עובד גם כשחקן וגם כ-enemy_policy (דרך EnemyView).
+    """
+
+    name = "lookahead"
+
+    def __init__(
+        self,
+        horizon_ms=4000,
+        decide_every_ms=500,
+        budget_ms=20,
+        rollout_step_ms=50,
+        plans=None,
+        opponent=None,
+        table=None,
+        hasher=None,
+    ):
+        self.horizon_ms = horizon_ms
+        self.decide_every_ms = decide_every_ms
+        self.budget_ms = budget_ms
+        self.rollout_step_ms = rollout_step_ms
+        self.plans = plans if plans is not None else self.default_plans()
+        self.opponent = opponent if opponent is not None else GreedyPolicy()
+        self.table = table
+        self.hasher = hasher if hasher is not None or table is None else ZobristHasher()
+        self.reset(0)
+
+    @staticmethod
+    def default_plans():
+        return [
+            Plan("greedy", then=GreedyPolicy()),
+            Plan("spawn now", ACTION_SPAWN),
+            Plan("save for turret", ACTION_UPGRADE, then=GreedyPolicy()),
+            Plan("wait 1s, then greedy", delay_ms=1000, then=GreedyPolicy()),
+            Plan("wait"),
+        ]
+
+    def reset(self, seed):
+        self.current = None
+        self.current_start = 0
+        self.next_decision = 0
+        # סטטיסטיקות
+        self.decisions = 0
+        self.rollouts = 0
+        self.rollout_seconds = 0.0
+        self.searches = 0
+        self.cache_hits = 0
+        self.partial_hits = 0
+        self.choices = {}
+
+    def act(self, view):
+        side = getattr(view, "side", "player")
+        game = view.game if side == "enemy" else view
+        now = game.clock.get_ticks()
+        if self.current is None or now >= self.next_decision:
+            deadline = None
+            if self.budget_ms is not None:
+                deadline = time.perf_counter() + self.budget_ms / 1000.0
+            if getattr(view, "deadline", None) is not None:
+                deadline = min(deadline or view.deadline, view.deadline)
+            best = self.decide(game, side, deadline)
+            self.current = copy.deepcopy(best).begin()
+            self.current_start = now
+            self.next_decision = now + self.decide_every_ms
+            self.choices[best.label] = self.choices.get(best.label, 0) + 1
+        return self.current.act(view, now - self.current_start)
+
+    def decide(self, game, side, deadline):
+        """מחזיר את ה-Plan עם הציון הכי טוב מבין אלה שהספיקו לרוץ עד deadline."""
+        self.decisions += 1
+        key = None
+        # plans to run, in order; with a partial entry its best plan goes first
+        order = range(len(self.plans))
+        evaluated = 0
+        if self.table is not None:
+            key = self.hasher.key(game, side)
+            cached = self.table.get(key)
+            if cached is not None:
+                cached_best, _, evaluated = cached
+                if evaluated == self._all_plans:
+                    self.cache_hits += 1
+                    return self.plans[cached_best]
+                # the other plans already evaluated lost to cached_best: skip them
+                self.partial_hits += 1
+                order = [cached_best] + [i for i in order if not evaluated >> i & 1]
+
+        # with the built-in enemy the clone runs the same timer; otherwise both
+        # sides are driven by the rollout (our plan + the opponent model)
+        legacy = game.enemy_policy is None and side == "player"
+        twin = game.clone(None if legacy else _Puppet())
+        start = twin.snapshot()
+        self.searches += 1
+
+        best, best_score = order[0], None
+        t0 = time.perf_counter()
+        for i in order:
+            if best_score is not None and deadline is not None and time.perf_counter() >= deadline:
+                break
+            twin.restore(start)
+            score = self.rollout(twin, self.plans[i].begin(), side, legacy)
+            self.rollouts += 1
+            evaluated |= 1 << i
+            if best_score is None or score > best_score:
+                best, best_score = i, score
+        self.rollout_seconds += time.perf_counter() - t0
+        if key is not None:
+            self.table.put(key, (best, best_score, evaluated))
+        return self.plans[best]
+
+    @property
+    def _all_plans(self):
+        """מסכת ה-plans של רשומה מלאה בטבלה."""
+        return (1 << len(self.plans)) - 1
+
+    def rollout(self, twin, plan, side, legacy):
+        other = "enemy" if side == "player" else "player"
+        ours = twin if side == "player" else EnemyView(twin)
+        theirs = EnemyView(twin) if side == "player" else twin
+        elapsed = 0
+        while elapsed < self.horizon_ms and not twin.game_over:
+            twin.apply_action(plan.act(ours, elapsed), side)
+            if not legacy:
+                twin.apply_action(self.opponent.act(theirs), other)
+            twin.advance(self.rollout_step_ms)
+            elapsed += self.rollout_step_ms
+        return self.evaluate(ours)
+
+    @staticmethod
+    def evaluate(view):
+        """
+        ציון מהצד של view: הפרש HP בסיסים + כוח הלוחמים + משאבים שלא נוצלו.
+        ניצחון/הפסד גוברים על הכל.
+        """
+        game = getattr(view, "game", view)
+        if game.game_over:
+            won = game.winner == getattr(view, "side", "player")
+            return 1e9 if won else -1e9
+        own, opp = view.player_units, view.enemy_units
+        units = (own.hp[: own.count].sum() - opp.hp[: opp.count].sum()) * 0.5
+        bases = view.player_base.hp - view.enemy_base.hp
+        turrets = (view.base_turret_level - view.enemy_turret_level) * 150
+        return bases + units + turrets + view.money * 0.5 + view.xp * 0.2
+
+    def stats(self):
+        ms_per_search = self.rollout_seconds * 1000.0 / max(1, self.searches)
+        return {
+            "decisions": self.decisions,
+            "rollouts": self.rollouts,
+            "rollouts_per_s": self.rollouts / max(1e-9, self.rollout_seconds),
+            "ms_per_decision": self.rollout_seconds * 1000.0 / max(1, self.decisions),
+            "cache_hits": self.cache_hits,
+            "partial_hits": self.partial_hits,
+            # each hit skipped one search of average cost
+            "saved_ms": self.cache_hits * ms_per_search,
+            "choices": dict(self.choices),
+        }
+
+
+class BatchPolicy:
+    """
+    בסיס למדיניות על אצווה. act_batch(obs) מקבל (k, encoder.size) ומחזיר
+    k פעולות (מערך int). obs הוא view לזיכרון של ה-scheduler: לא לשמור אותו.
+    """
+
+    name = "noop"
+
+    def reset(self, seed):
+        pass
+
+    def act_batch(self, obs):
+        return np.zeros(len(obs), dtype=np.int64)
+
+
+class GreedyBatchPolicy(BatchPolicy):
+    """GreedyPolicy על אצווה: אותן החלטות, מתוך עמודות can_upgrade / can_spawn."""
+
+    name = "greedy"
+
+    def __init__(self, bins=16):
+        base = 4 * bins
+        self.can_spawn = base + SCALARS.index("can_spawn")
+        self.can_upgrade = base + SCALARS.index("can_upgrade")
+
+    def act_batch(self, obs):
+        actions = np.where(obs[:, self.can_spawn] > 0, ACTION_SPAWN, ACTION_NOOP)
+        actions[obs[:, self.can_upgrade] > 0] = ACTION_UPGRADE
+        return actions
+
+
+class LinearPolicy(BatchPolicy):
+    """
+    argmax(obs @ weights + bias): מדיניות לינארית, כמו השכבה האחרונה של רשת.
+    weights = (size, 3). ברירת מחדל: משקלים אקראיים קטנים (לבדיקות מהירות).
+    """
+
+    name = "linear"
+
+    def __init__(self, weights=None, bias=None, size=None, seed=0):
+        if weights is None:
+            weights = np.random.default_rng(seed).normal(0.0, 0.1, size=(size, 3))
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = np.zeros(3, dtype=np.float32) if bias is None else np.asarray(bias, dtype=np.float32)
+
+    def act_batch(self, obs):
+        return np.argmax(obs @ self.weights + self.bias, axis=1)
+
+
+# שם -> מחלקה (בשביל שורת הפקודה)
+POLICIES = {
+    cls.name: cls
+    for cls in (IdlePolicy, GreedyPolicy, SaverPolicy, RandomPolicy, LookaheadPolicy)
+}
+
+
+# הגדרות לריצות headless (batch, sweep, tournament, scheduler): בלי תקציב זמן
+# אמיתי, כדי שהתוצאות לא יהיו תלויות בעומס על המחשב
+HEADLESS_OPTIONS = {
+    "lookahead": {"budget_ms": None},
+}
+
+
+def make_policy(name, realtime=False):
+    """
+    מדיניות חדשה לפי שם. realtime=True (משחק חי, main.py --enemy) -> ברירות
+    המחדל של המחלקה, כולל תקציב הזמן של lookahead; אחרת HEADLESS_OPTIONS.
+    """
+    try:
+        cls = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"unknown policy {name!r}, choose from {sorted(POLICIES)}") from None
+    options = {} if realtime else HEADLESS_OPTIONS.get(name, {})
+    return cls(**options)
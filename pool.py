@@ -0,0 +1,112 @@
+"""
+pool.py
+מאגר אובייקטים לשימוש חוזר (free list), בשביל חלקיקים, יריות וטילים.
+
+במקום ליצור אובייקט חדש לכל ניצוץ ולבנות רשימה חדשה בכל פריים,
+האובייקטים נשארים ברשימה אחת: [0, count) פעילים, השאר פנויים.
+אובייקט שמת מוחלף עם האחרון הפעיל (swap-remove) ונשאר לשימוש הבא.
+
+ColumnBuffer הוא אותו רעיון לנתונים מספריים: עמודה (מערך NumPy) לכל שדה,
+[0, count) בשימוש, והמערכים רק גדלים. CombatBuffer, EventQueue ו- UnitPool
+בנויים עליו, והטבלאות של vecsim גדלות דרך grow_columns.
+"""
+
+import numpy as np
+
+
+class ObjectPool:
+    """
+    factory = פונקציה בלי פרמטרים שיוצרת אובייקט ריק.
+    The caller re-initialises whatever acquire() returns.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.items = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        items = self.items
+        for i in range(self.count):
+            yield items[i]
+
+    def acquire(self):
+        """
+        מחזיר אובייקט פנוי (או חדש אם אין) ומסמן אותו כפעיל.
+        """
+        if self.count == len(self.items):
+            self.items.append(self.factory())
+        obj = self.items[self.count]
+        self.count += 1
+        return obj
+
+    def sweep(self, is_alive):
+        """
+        מוציא את כל האובייקטים ש-is_alive(obj) מחזיר עליהם False,
+        בלי להקצות רשימה חדשה (הסדר של הפעילים יכול להשתנות).
+        """
+        items = self.items
+        i = 0
+        n = self.count
+        while i < n:
+            obj = items[i]
+            if is_alive(obj):
+                i += 1
+            else:
+                n -= 1
+                items[i] = items[n]
+                items[n] = obj
+        self.count = n
+
+    def clear(self):
+        self.count = 0
+
+
+def grow_columns(owner, fields, capacity, keep, rows=()):
+    """
+    מחליף כל עמודה (name, dtype) ב- fields של owner במערך חדש באורך capacity,
+    ומעתיק את keep הערכים הראשונים. rows = צורה לפני העמודה (למשל (n,) לטבלה
+    של n שורות, שגדלה לאורך הציר האחרון).
+    """
+    for name, dtype in fields:
+        new = np.zeros(rows + (capacity,), dtype=dtype)
+        old = getattr(owner, name, None)
+        if old is not None:
+            new[..., :keep] = old[..., :keep]
+        setattr(owner, name, new)
+
+
+class ColumnBuffer:
+    """
+    מערכים מוקצים מראש, אחד לכל שדה ב- _FIELDS ((name, dtype), ...) של
+    תת-המחלקה. [0, count) בשימוש; clear() מרוקן בלי לשחרר זיכרון.
+    """
+
+    _FIELDS = ()
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        grow_columns(self, self._FIELDS, capacity, self.count)
+        self.capacity = capacity
+
+    def _reserve(self, k):
+        """מקום ל-k שורות חדשות בסוף (הכפלה כשצריך). מחזיר slice שלהן."""
+        end = self.count + k
+        if end > self.capacity:
+            self._grow(max(end, self.capacity * 2))
+        s = slice(self.count, end)
+        self.count = end
+        return s
+
+    def clear(self):
+        self.count = 0
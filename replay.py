@@ -0,0 +1,240 @@
+"""
+replay.py
+הקלטה והפעלה של משחקים (replay).
+
+מה נשמר: seed של המשחק, ערכי settings ששונו (overrides), ורשימת פעולות
+(tick, action). המשחק דטרמיניסטי, אז זה מספיק כדי לשחזר אותו בדיוק.
+
+פורמט בינארי:
+    b"GOWR" | version (u8) | seed (u64) | len (u32) + JSON של overrides
+    ואז רשומה לכל פעולה: varint של (delta_tick << 2 | action).
+    פעולה עד ~0.5 שניה אחרי הקודמת = בייט אחד, עד ~68 שניות = 2 בייטים.
+    הרשומה האחרונה היא ACTION_END עם ה-tick שבו ההקלטה נעצרה.
+
+    python replay.py info FILE
+    python replay.py play FILE [--render] [--speed 2]
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game import Game
+from settings import TUNABLES, SIM_TICK_RATE, make_config
+
+
+MAGIC = b"GOWR"
+# 2: passive income keeps its sub-coin remainder (v1 replays no longer match)
+VERSION = 2
+
+# סוף ההקלטה (רק בקובץ, לא פעולה של Game)
+ACTION_END = 3
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if b < 0x80:
+            return value, pos
+        shift += 7
+
+
+def config_overrides(config):
+    """רק הערכים ששונים מברירת המחדל של settings.py (כדי שהקובץ יישאר קטן)."""
+    default = make_config()
+    return {
+        name: getattr(config, name)
+        for name in TUNABLES
+        if getattr(config, name) != getattr(default, name)
+    }
+
+
+class Replay:
+    """
+    seed + overrides + actions (רשימת (tick, action)) + end_tick.
+    """
+
+    def __init__(self, seed, overrides=None, actions=None, end_tick=0):
+        self.seed = seed
+        self.overrides = overrides or {}
+        self.actions = actions if actions is not None else []
+        self.end_tick = end_tick
+
+    def to_bytes(self):
+        settings_json = json.dumps(self.overrides, sort_keys=True, separators=(",", ":")).encode()
+        out = bytearray(MAGIC)
+        out += struct.pack("<BQI", VERSION, self.seed, len(settings_json))
+        out += settings_json
+        last = 0
+        for tick, action in self.actions:
+            _write_varint(out, (tick - last) << 2 | action)
+            last = tick
+        _write_varint(out, (self.end_tick - last) << 2 | ACTION_END)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != MAGIC:
+            raise ValueError("not a replay file")
+        version, seed, n = struct.unpack_from("<BQI", data, 4)
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        pos = 4 + struct.calcsize("<BQI")
+        overrides = json.loads(data[pos : pos + n])
+        pos += n
+
+        actions = []
+        tick = 0
+        while True:
+            value, pos = _read_varint(data, pos)
+            tick += value >> 2
+            action = value & 3
+            if action == ACTION_END:
+                return cls(seed, overrides, actions, tick)
+            actions.append((tick, action))
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def new_game(self, **kwargs):
+        """Game חדש עם ה-seed וה-settings של ההקלטה."""
+        return Game(seed=self.seed, config=make_config(**self.overrides), **kwargs)
+
+
+class ReplayRecorder:
+    """
+    מקליט את הפעולות של משחק אחד. record() לפני game.step() של אותו tick.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.replay = Replay(game.seed, config_overrides(game.config))
+
+    def record(self, action):
+        """מבצע את הפעולה ב-game ורושם אותה."""
+        self.replay.actions.append((self.game.tick, action))
+        self.game.apply_action(action)
+
+    def finish(self):
+        self.replay.end_tick = self.game.tick
+        return self.replay
+
+
+def _apply_actions(game, actions, i):
+    """מבצע את כל הפעולות של ה-tick הנוכחי; מחזיר את האינדקס הבא."""
+    while i < len(actions) and actions[i][0] == game.tick:
+        game.apply_action(actions[i][1])
+        i += 1
+    return i
+
+
+def play_headless(replay):
+    """
+    מריץ את ההקלטה מחדש בלי חלון, כמה שיותר מהר. מחזיר את ה-Game בסוף.
+    """
+    game = replay.new_game(headless=True)
+    actions = replay.actions
+    i = 0
+    while game.tick < replay.end_tick and not game.game_over:
+        i = _apply_actions(game, actions, i)
+        game.step()
+    return game
+
+
+def play_rendered(replay, speed=1.0):
+    """
+    מציג את ההקלטה בחלון. speed = פי כמה מהזמן האמיתי (2 = כפול).
+    """
+    import pygame
+    from settings import WIDTH, HEIGHT, FPS
+    from timing import SimClock
+    from visuals import ensure_fonts
+
+    pygame.init()
+    ensure_fonts()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(f"Replay (seed {replay.seed}, x{speed:g})")
+    clock = pygame.time.Clock()
+
+    game = replay.new_game(clock=SimClock())
+    step_ms = 1000.0 / SIM_TICK_RATE
+    accumulator = 0.0
+    i = 0
+    running = True
+    while running:
+        dt = clock.tick(FPS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                running = False
+
+        if game.tick < replay.end_tick and not game.game_over:
+            accumulator += dt * speed
+            while accumulator >= step_ms and game.tick < replay.end_tick and not game.game_over:
+                i = _apply_actions(game, replay.actions, i)
+                game.step()
+                accumulator -= step_ms
+        else:
+            # playback is over: let shake, flashes and shots fade out
+            game.coast(int(dt * speed))
+
+        game.draw(screen)
+        pygame.display.flip()
+
+    pygame.quit()
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or play back a recorded match.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    info = sub.add_parser("info")
+    info.add_argument("file")
+    play = sub.add_parser("play")
+    play.add_argument("file")
+    play.add_argument("--render", action="store_true", help="show the match in a window")
+    play.add_argument("--speed", type=float, default=1.0, help="playback speed when rendering")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.file)
+    if args.command == "info":
+        size = os.path.getsize(args.file)
+        print(f"seed {replay.seed}, overrides {replay.overrides or '-'}")
+        print(f"{len(replay.actions)} actions over {replay.end_tick / SIM_TICK_RATE:.1f} s, {size} bytes")
+        return
+
+    if args.render:
+        game = play_rendered(replay, args.speed)
+    else:
+        start = time.perf_counter()
+        game = play_headless(replay)
+        elapsed = time.perf_counter() - start
+        print(f"{game.tick} ticks in {elapsed * 1000:.1f} ms ({game.tick / elapsed:.0f} ticks/s)")
+    print(f"winner: {game.winner or 'none'}, player base {game.player_base.hp}, enemy base {game.enemy_base.hp}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+scheduler.py
+הרבה משחקים headless במקביל עם קריאה אחת ל-policy בכל צעד.
+
+בכל צעד: כל המשחקים הפעילים מקודדים לשורות של מערך תצפיות אחד,
+policy.act_batch() נקרא פעם אחת על כל האצווה, והפעולות מפוזרות חזרה
+למשחקים. משחק שנגמר מוחלף מיד ב-seed הבא; כשנגמרים ה-seeds, המשחקים
+הפעילים נשארים צפופים בתחילת המערך (swap-remove), כך ש- obs[:active]
+הוא תמיד view רציף.
+
+    python scheduler.py --matches 256 --batch 64 [--policy greedy|linear]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from batch import MatchResult
+from enemy_ai import EnemyAI
+from game import Game
+from observation import ObservationEncoder
+from policies import GreedyBatchPolicy, LinearPolicy, make_policy
+from settings import SIM_TICK_RATE, make_config
+
+
+class _Slot:
+    """משחק פעיל אחד + דגימות ה-HP שלו."""
+
+    __slots__ = ("game", "player_hp", "enemy_hp")
+
+    def __init__(self, game):
+        self.game = game
+        self.player_hp = [game.player_base.hp]
+        self.enemy_hp = [game.enemy_base.hp]
+
+
+class MatchScheduler:
+    """
+    מריץ משחק לכל seed, עד batch_size בבת אחת, עם BatchPolicy אחת לכל השחקנים.
+
+    frame_skip = טיקים בין החלטות. enemy = שם policy לאויב (None = הטיימר הישן).
+    run() הוא generator של MatchResult לפי סדר הסיום (לא לפי סדר ה-seeds).
+    """
+
+    def __init__(
+        self,
+        seeds,
+        policy,
+        batch_size=64,
+        frame_skip=1,
+        max_ms=10 * 60 * 1000,
+        sample_ms=1000,
+        overrides=None,
+        enemy=None,
+        encoder=None,
+    ):
+        self.seeds = iter(seeds)
+        self.policy = policy
+        self.batch_size = batch_size
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ms * SIM_TICK_RATE // 1000
+        self.sample_every = max(1, sample_ms * SIM_TICK_RATE // 1000)
+        self.config = make_config(**(overrides or {}))
+        self.enemy = enemy
+        self.encoder = encoder if encoder is not None else ObservationEncoder()
+        self.obs = self.encoder.empty(batch_size)
+        self.slots = []
+
+        # סטטיסטיקות
+        self.policy_calls = 0
+        self.decisions = 0
+        self.policy_seconds = 0.0
+
+    def _new_slot(self):
+        seed = next(self.seeds, None)
+        if seed is None:
+            return None
+        enemy = EnemyAI(make_policy(self.enemy)) if self.enemy is not None else None
+        return _Slot(Game(headless=True, seed=seed, config=self.config, enemy_policy=enemy))
+
+    def run(self):
+        slots = self.slots
+        while len(slots) < self.batch_size:
+            slot = self._new_slot()
+            if slot is None:
+                break
+            slots.append(slot)
+
+        encoder = self.encoder
+        while slots:
+            active = len(slots)
+            obs = self.obs[:active]
+            for i, slot in enumerate(slots):
+                encoder.encode(slot.game, obs[i])
+            t = time.perf_counter()
+            actions = self.policy.act_batch(obs)
+            self.policy_seconds += time.perf_counter() - t
+            self.policy_calls += 1
+            self.decisions += active
+
+            i = 0
+            while i < len(slots):
+                slot = slots[i]
+                if self._advance(slot, actions[i]):
+                    yield self._result(slot)
+                    slot = self._new_slot()
+                    if slot is not None:
+                        slots[i] = slot
+                    else:
+                        # swap-remove: keep the live games packed at the front;
+                        # this tick's action for the moved game is carried with it
+                        last = len(slots) - 1
+                        slots[i] = slots[last]
+                        actions[i] = actions[last]
+                        slots.pop()
+                        continue
+                i += 1
+
+    def _advance(self, slot, action):
+        """פעולה + frame_skip טיקים. מחזיר True אם המשחק נגמר."""
+        game = slot.game
+        game.apply_action(action)
+        for _ in range(self.frame_skip):
+            game.step()
+            if game.tick % self.sample_every == 0:
+                slot.player_hp.append(game.player_base.hp)
+                slot.enemy_hp.append(game.enemy_base.hp)
+            if game.game_over or game.tick >= self.max_ticks:
+                return True
+        return False
+
+    def _result(self, slot):
+        game = slot.game
+        if game.tick % self.sample_every != 0:
+            slot.player_hp.append(game.player_base.hp)
+            slot.enemy_hp.append(game.enemy_base.hp)
+        return MatchResult(
+            seed=game.seed,
+            policy=self.policy.name,
+            winner=game.winner or "draw",
+            duration_ms=game.clock.get_ticks(),
+            player_units_spawned=game.player_units_spawned,
+            enemy_units_spawned=game.enemy_units_spawned,
+            player_turret_level=game.base_turret_level,
+            enemy_turret_level=game.enemy_turret_level,
+            player_base_hp=tuple(slot.player_hp),
+            enemy_base_hp=tuple(slot.enemy_hp),
+            enemy=self.enemy or "timer",
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many matches with one batched policy call per step.")
+    parser.add_argument("--matches", type=int, default=256)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 8, 64], help="batch sizes to compare")
+    parser.add_argument("--policy", choices=["greedy", "linear"], default="greedy")
+    parser.add_argument("--enemy", default=None, help="enemy policy (default: the built-in spawn timer)")
+    parser.add_argument("--frame-skip", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-seconds", type=int, default=600, help="game time limit per match")
+    args = parser.parse_args()
+
+    encoder = ObservationEncoder()
+    for batch_size in args.batch:
+        if args.policy == "linear":
+            policy = LinearPolicy(size=encoder.size, seed=args.seed)
+        else:
+            policy = GreedyBatchPolicy(encoder.bins)
+        sched = MatchScheduler(
+            range(args.seed, args.seed + args.matches),
+            policy,
+            batch_size=batch_size,
+            frame_skip=args.frame_skip,
+            max_ms=args.max_seconds * 1000,
+            enemy=args.enemy,
+            encoder=encoder,
+        )
+        wins = {"player": 0, "enemy": 0, "draw": 0}
+        start = time.perf_counter()
+        for result in sched.run():
+            wins[result.winner] += 1
+        elapsed = time.perf_counter() - start
+        print(
+            f"batch {batch_size:4d}: {args.matches / elapsed:6.1f} matches/s, "
+            f"{sched.decisions / elapsed:8.0f} decisions/s, {sched.policy_calls} policy calls, "
+            f"{sched.policy_seconds / sched.decisions * 1e6:5.2f} us policy time per decision "
+            f"(player {wins['player']} / enemy {wins['enemy']} / draw {wins['draw']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
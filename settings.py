@@ -3,12 +3,19 @@ settings.py
 קובץ של הגדרות קבועות + ציור רקע ואדמה.
 """
 
+from types import SimpleNamespace
+
 # גודל חלון
 WIDTH, HEIGHT = 1000, 600
 
-# FPS = כמה פעמים בשניה מעדכנים את המשחק
+# FPS = כמה פעמים בשניה מציירים את המסך
 FPS = 60
 
+# קצב הסימולציה (צעדים קבועים בשניה, לא תלוי ב-FPS)
+SIM_TICK_RATE = 60
+# max time (ms) the main loop will catch up in one frame
+SIM_MAX_FRAME_MS = 250
+
 # גובה האדמה
 GROUND_Y = HEIGHT - 80
 
@@ -78,4 +85,58 @@ DEFAULT_SCREEN_SHAKE_DURATION = 300
 DEFAULT_SCREEN_SHAKE_MAGNITUDE = 10
 
 
+# =========================
+# Per-match config
+# הקבועים שאפשר לשנות לכל משחק (sweep / ניסויים) בלי לטעון מחדש מודולים
+# =========================
+
+TUNABLES = (
+    "PLAYER_BASE_MAX_HP",
+    "ENEMY_BASE_MAX_HP",
+    "PLAYER_BASE_WIDTH",
+    "ENEMY_BASE_WIDTH",
+    "BASE_HIT_FLASH_DURATION",
+    "UNIT_WIDTH",
+    "UNIT_HEIGHT",
+    "UNIT_MAX_HP",
+    "UNIT_SPEED",
+    "UNIT_ATTACK_RANGE",
+    "UNIT_ATTACK_DAMAGE",
+    "UNIT_ATTACK_COOLDOWN",
+    "UNIT_ATTACK_ANIM_DURATION",
+    "UNIT_HIT_FLASH_DURATION",
+    "UNIT_RECOIL_AMOUNT",
+    "UNIT_COST",
+    "MONEY_PER_SECOND",
+    "XP_PER_SECOND",
+    "MONEY_MAX",
+    "XP_MAX",
+    "ENEMY_SPAWN_INTERVAL",
+    "BASE_TURRET_MAX_LEVEL",
+    "BASE_TURRET_XP_COSTS",
+    "BASE_TURRET_RANGES",
+    "BASE_TURRET_DAMAGES",
+    "BASE_TURRET_COOLDOWNS",
+    "ENEMY_TURRET_AUTO_UPGRADE_INTERVAL",
+)
+
+
+def make_config(**overrides):
+    """
+    מחזיר אובייקט עם כל ה-TUNABLES (ערכי ברירת המחדל מהקובץ הזה),
+    ועליהם overrides, למשל make_config(UNIT_COST=25).
+    Game, Base ו-UnitPool קוראים את הערכים ממנו ולא ישירות מהמודול.
+    """
+    unknown = sorted(set(overrides) - set(TUNABLES))
+    if unknown:
+        raise KeyError(f"unknown setting(s): {', '.join(unknown)}")
+    values = {name: globals()[name] for name in TUNABLES}
+    values.update(overrides)
+    # lists are copied so one match can never edit another match's levels
+    for name, value in values.items():
+        if isinstance(value, (list, tuple)):
+            values[name] = list(value)
+    return SimpleNamespace(**values)
+
+
 # Note: rendering helpers and fonts were moved to visuals.py
@@ -0,0 +1,154 @@
+"""
+sweep.py
+חיפוש פרמטרי איזון: grid או random על הקבועים מ- settings.py.
+כל שילוב רץ כמה משחקים headless במקביל, והתוצאות נכתבות לקובץ CSV תוך כדי ריצה.
+
+    python sweep.py --param UNIT_COST=25,35,45 --param UNIT_ATTACK_DAMAGE=10,12,14 --matches 20
+    python sweep.py --random 50 --param UNIT_COST=20:60 --param ENEMY_SPAWN_INTERVAL=2000:4000
+    python sweep.py --param "BASE_TURRET_RANGES=[0,200,250,300],[0,250,300,350]"
+
+ערך בצורה lo:hi הוא טווח (רק ב- --random); אחרת רשימת ערכים מופרדת בפסיקים (JSON).
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from batch import run_jobs, seed_independent
+from settings import TUNABLES
+
+
+class Range:
+    """טווח lo:hi לחיפוש random (int אם שני הקצוות int)."""
+
+    def __init__(self, lo, hi):
+        self.lo = lo
+        self.hi = hi
+
+    def sample(self, rng):
+        if isinstance(self.lo, int) and isinstance(self.hi, int):
+            return rng.randint(self.lo, self.hi)
+        return rng.uniform(self.lo, self.hi)
+
+
+def parse_param(text):
+    """
+    "NAME=1,2,3" -> ("NAME", [1, 2, 3]); "NAME=lo:hi" -> ("NAME", Range(lo, hi)).
+    """
+    name, sep, rhs = text.partition("=")
+    name = name.strip()
+    if not sep:
+        raise ValueError(f"expected NAME=VALUES, got {text!r}")
+    if name not in TUNABLES:
+        raise ValueError(f"{name} is not tunable, choose from: {', '.join(TUNABLES)}")
+    rhs = rhs.strip()
+    if ":" in rhs and not rhs.startswith("["):
+        lo, hi = rhs.split(":", 1)
+        return name, Range(json.loads(lo), json.loads(hi))
+    return name, json.loads("[" + rhs + "]")
+
+
+def grid(params):
+    """כל השילובים (מכפלה קרטזית) של רשימות הערכים."""
+    for name, values in params:
+        if isinstance(values, Range):
+            raise ValueError(f"{name}: ranges (lo:hi) need --random")
+    names = [name for name, _ in params]
+    for combo in itertools.product(*(values for _, values in params)):
+        yield dict(zip(names, combo))
+
+
+def random_search(params, count, seed):
+    """count שילובים אקראיים: Range -> דגימה בטווח, רשימה -> בחירה אחת."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        point = {}
+        for name, values in params:
+            point[name] = values.sample(rng) if isinstance(values, Range) else rng.choice(values)
+        yield point
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid/random sweep over settings.py balance constants.")
+    parser.add_argument("--param", action="append", default=[], help="NAME=v1,v2,... or NAME=lo:hi")
+    parser.add_argument("--random", type=int, default=0, help="random search with this many points")
+    parser.add_argument("--matches", type=int, default=10, help="matches per parameter point")
+    parser.add_argument("--policy", default="greedy")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-seconds", type=int, default=600, help="game time limit per match")
+    parser.add_argument("--out", default="sweep.csv")
+    args = parser.parse_args()
+
+    params = [parse_param(p) for p in args.param]
+    if args.random:
+        points = list(random_search(params, args.random, args.seed))
+    else:
+        points = list(grid(params))
+    names = [name for name, _ in params]
+
+    # אותם seeds לכל נקודה, כדי שההבדל יהיה רק בפרמטרים
+    matches = args.matches
+    if matches > 1 and seed_independent(args.policy):
+        # every seed would write an identical row: the win rate could only be 0% or 100%
+        print(f"{args.policy} vs timer plays the same game on every seed: 1 match per point, not {matches}")
+        matches = 1
+    seeds = range(args.seed, args.seed + matches)
+    jobs = [
+        (seed, args.policy, args.max_seconds * 1000, 1000, point)
+        for point in points
+        for seed in seeds
+    ]
+
+    columns = names + [
+        "seed",
+        "winner",
+        "duration_ms",
+        "player_units_spawned",
+        "enemy_units_spawned",
+        "player_turret_level",
+        "enemy_turret_level",
+        "player_base_hp",
+        "enemy_base_hp",
+    ]
+    start = time.perf_counter()
+    wins = {}
+    with open(args.out, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for (_, _, _, _, point), r in zip(jobs, run_jobs(jobs, args.workers)):
+            values = [json.dumps(point[name]) if isinstance(point[name], list) else point[name] for name in names]
+            writer.writerow(
+                values
+                + [
+                    r.seed,
+                    r.winner,
+                    r.duration_ms,
+                    r.player_units_spawned,
+                    r.enemy_units_spawned,
+                    r.player_turret_level,
+                    r.enemy_turret_level,
+                    r.player_base_hp[-1],
+                    r.enemy_base_hp[-1],
+                ]
+            )
+            key = json.dumps(point, sort_keys=True)
+            wins[key] = wins.get(key, 0) + (r.winner == "player")
+    elapsed = time.perf_counter() - start
+
+    for key, w in wins.items():
+        if matches == 1:
+            print(f"{key}: player {'won' if w else 'did not win'}")
+        else:
+            print(f"{key}: player win rate {w / matches:.0%} ({matches} matches)")
+    print(f"{len(jobs)} matches over {len(points)} points in {elapsed:.1f} s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+timing.py
+שעונים למשחק: שעון אמיתי (pygame) ושעון מדומה לסימולציה בלי חלון.
+"""
+
+import pygame
+
+
+class RealClock:
+    """Wall-clock time, read from pygame.time.get_ticks()."""
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class SimClock:
+    """
+    שעון מדומה: הזמן מתקדם רק כשקוראים ל-advance().
+    Used by headless games so a match runs as fast as the CPU allows.
+    """
+
+    def __init__(self, start_ms=0):
+        self.now = start_ms
+
+    def get_ticks(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms
+        return self.now
@@ -0,0 +1,143 @@
+"""
+tournament.py
+טורניר round-robin בין policies (self-play): כל זוג משחק על שני הצדדים של Game,
+המשחקים רצים headless על כל הליבות, ודירוג Elo מתעדכן אחרי כל משחק.
+
+כל תוצאה נכתבת מיד לקובץ JSONL. הרצה חוזרת עם אותו --out ממשיכה מאיפה
+שנעצרה: משחקים שכבר בקובץ לא רצים שוב, וה-Elo נבנה מחדש לפי הסדר בקובץ.
+
+    python tournament.py --policies idle greedy saver random --games 4 [--workers N] [--out tournament.jsonl]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from batch import run_jobs, seed_independent
+from policies import POLICIES
+
+
+class Elo:
+    """דירוג Elo לכל שם. תיקו = חצי ניצחון."""
+
+    def __init__(self, k=32, initial=1500.0):
+        self.k = k
+        self.initial = initial
+        self.ratings = {}
+
+    def rating(self, name):
+        return self.ratings.get(name, self.initial)
+
+    def expected(self, a, b):
+        return 1.0 / (1.0 + 10 ** ((self.rating(b) - self.rating(a)) / 400.0))
+
+    def update(self, a, b, score):
+        """score = 1 (a ניצח), 0.5 (תיקו) או 0 (b ניצח)."""
+        delta = self.k * (score - self.expected(a, b))
+        self.ratings[a] = self.rating(a) + delta
+        self.ratings[b] = self.rating(b) - delta
+
+
+def schedule(policies, games, first_seed=0):
+    """
+    כל זוג מסודר (player, enemy) עם games משחקים, seeds first_seed, first_seed+1, ...
+    זוג בלי אקראיות (batch.seed_independent) משחק פעם אחת בלבד: כל seed היה
+    נותן את אותו משחק, ואותה תוצאה הייתה נספרת ב-Elo games פעמים.
+    מחזיר רשימה של (player, enemy, seed), משחק אחד מכל זוג בכל סבב.
+    """
+    pairs = list(itertools.permutations(policies, 2))
+    rounds = {pair: 1 if seed_independent(*pair) else games for pair in pairs}
+    return [(a, b, first_seed + g) for g in range(games) for a, b in pairs if g < rounds[a, b]]
+
+
+def load_results(path):
+    """
+    תוצאות קודמות מהקובץ (אם יש), לפי הסדר שנכתבו. שורה שבורה בסוף
+    (הרצה שנעצרה באמצע כתיבה) נחתכת מהקובץ, כדי שאפשר יהיה להמשיך לכתוב אחריה.
+    """
+    results = []
+    if not os.path.exists(path):
+        return results
+    valid = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            valid += len(line)
+    os.truncate(path, valid)
+    return results
+
+
+def score_of(winner):
+    return {"player": 1.0, "enemy": 0.0}.get(winner, 0.5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round-robin self-play tournament with Elo ratings.")
+    parser.add_argument("--policies", nargs="+", default=["idle", "greedy", "saver", "random"], choices=sorted(POLICIES))
+    parser.add_argument(
+        "--games", type=int, default=4, help="matches per ordered pair (each side); 1 for pairs without randomness"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0, help="first match seed")
+    parser.add_argument("--max-seconds", type=int, default=120, help="game time limit per match (then a draw)")
+    parser.add_argument("--k", type=float, default=32, help="Elo K factor")
+    parser.add_argument("--out", default="tournament.jsonl")
+    parser.add_argument("--fresh", action="store_true", help="ignore and overwrite an existing --out")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    elo = Elo(args.k)
+    table = {}  # (player, enemy) -> [wins, draws, losses] מהצד של player
+
+    def record(r):
+        player, enemy = r["player"], r["enemy"]
+        elo.update(player, enemy, score_of(r["winner"]))
+        row = table.setdefault((player, enemy), [0, 0, 0])
+        row[{"player": 0, "enemy": 2}.get(r["winner"], 1)] += 1
+
+    previous = [] if args.fresh else load_results(args.out)
+    for r in previous:
+        record(r)
+    done = {(r["player"], r["enemy"], r["seed"]) for r in previous}
+    todo = [m for m in schedule(args.policies, args.games, args.seed) if m not in done]
+    if previous:
+        print(f"resuming: {len(previous)} matches in {args.out}, {len(todo)} to go")
+
+    jobs = [(seed, player, args.max_seconds * 1000, 1000, None, enemy) for player, enemy, seed in todo]
+    start = time.perf_counter()
+    with open(args.out, "a" if previous else "w") as out:
+        for (player, enemy, seed), result in zip(todo, run_jobs(jobs, workers)):
+            r = {
+                "player": player,
+                "enemy": enemy,
+                "seed": seed,
+                "winner": result.winner,
+                "duration_ms": result.duration_ms,
+            }
+            out.write(json.dumps(r) + "\n")
+            out.flush()
+            record(r)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'policy':<12} {'elo':>7}")
+    for name in sorted(args.policies, key=elo.rating, reverse=True):
+        print(f"{name:<12} {elo.rating(name):7.1f}")
+    print("\nplayer vs enemy: wins / draws / losses (player side)")
+    for (player, enemy), (w, d, l) in sorted(table.items()):
+        print(f"  {player:>10} vs {enemy:<10} {w:3d} / {d:3d} / {l:3d}")
+    if todo:
+        rate = len(todo) / elapsed
+        print(f"\n{len(todo)} matches in {elapsed:.1f} s: {rate:.2f} matches/s, {rate / workers:.2f} per core ({workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+transposition.py
+טבלת transposition ל-AI שמחפש קדימה (LookaheadPolicy ודומים).
+
+ZobristHasher מקצר מצב של Game למפתח של 64 ביט אחרי קוונטיזציה: כמה לוחמים
+יש בכל תא של המסלול וכמה HP בממוצע, כסף/XP בדליים, רמות טורט, HP בסיסים
+והטיימר של האויב. מצבים כמעט זהים -> אותו מפתח.
+
+TranspositionTable שומרת ערכים (למשל ציון + הפעולה הכי טובה) לפי מפתח,
+עם גבול על מספר הרשומות (LRU) וסטטיסטיקות פגיעה.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from settings import WIDTH
+
+
+class ZobristHasher:
+    """
+    מפתח = XOR של מספרים אקראיים קבועים, אחד לכל (תכונה, ערך מקוונטז).
+
+    bins = תאים לאורך המסלול, hp_levels = רמות HP ממוצע לתא,
+    max_count = מספר לוחמים בתא שמעליו הכל נחשב אותו דבר.
+    """
+
+    # (שם, מספר ערכים) לכל סקלר מקוונטז, לפי הסדר ב- _scalars()
+    SCALARS = (
+        ("money", 64),
+        ("xp", 64),
+        ("enemy_money", 64),
+        ("enemy_xp", 64),
+        ("player_turret", 8),
+        ("enemy_turret", 8),
+        ("player_base_hp", 32),
+        ("enemy_base_hp", 32),
+        ("enemy_spawn_timer", 16),
+        ("side", 2),
+    )
+
+    def __init__(self, bins=32, hp_levels=4, max_count=15, seed=0x5A0B, width=None):
+        self.bins = bins
+        self.hp_levels = hp_levels
+        self.max_count = max_count
+        self.bin_scale = bins / float(width or WIDTH)
+        rng = np.random.default_rng(seed)
+        bits = np.iinfo(np.uint64).max
+        # [side, bin, count, hp level]
+        self.unit_keys = rng.integers(
+            0, bits, size=(2, bins, max_count + 1, hp_levels), dtype=np.uint64, endpoint=True
+        )
+        self.scalar_keys = [
+            rng.integers(0, bits, size=n, dtype=np.uint64, endpoint=True) for _, n in self.SCALARS
+        ]
+        self._bins = np.arange(bins)
+
+    def key(self, game, side="player"):
+        """מפתח של 64 ביט (int) למצב של game מהצד של side."""
+        h = self._lane(game.player_units, 0) ^ self._lane(game.enemy_units, 1)
+        for keys, value in zip(self.scalar_keys, self._scalars(game, side)):
+            h ^= int(keys[min(value, len(keys) - 1)])
+        return h
+
+    def _lane(self, units, side):
+        n = units.count
+        cell = np.minimum((units.x[:n] + units.width / 2) * self.bin_scale, self.bins - 1).astype(np.intp)
+        cell = np.maximum(cell, 0)
+        count = np.bincount(cell, minlength=self.bins)
+        hp = np.bincount(cell, weights=units.hp[:n], minlength=self.bins)
+        # ממוצע HP בתא -> רמה 0..hp_levels-1 (תא ריק = 0)
+        level = (hp * self.hp_levels) // (np.maximum(count, 1) * units.max_hp + 1)
+        count = np.minimum(count, self.max_count)
+        keys = self.unit_keys[side, self._bins, count, level.astype(np.intp)]
+        return int(np.bitwise_xor.reduce(keys))
+
+    @staticmethod
+    def _scalars(game, side):
+        cost = max(1, game.unit_cost)
+        now = game.clock.get_ticks()
+        return (
+            game.money // cost,
+            game.xp // 25,
+            game.enemy_money // cost,
+            game.enemy_xp // 25,
+            game.base_turret_level,
+            game.enemy_turret_level,
+            game.player_base.hp * 31 // game.player_base.max_hp,
+            game.enemy_base.hp * 31 // game.enemy_base.max_hp,
+            max(0, now - game.last_enemy_spawn_time) * 15 // max(1, game.enemy_spawn_interval),
+            0 if side == "player" else 1,
+        )
+
+
+class TranspositionTable:
+    """
+    מפתח -> ערך, עד capacity רשומות. כשמתמלא נזרקת הרשומה שהכי מזמן לא
+    השתמשו בה (LRU). get() מעדכן hits / misses.
+    """
+
+    def __init__(self, capacity=100_000):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = value
+
+    def clear(self):
+        self.entries.clear()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
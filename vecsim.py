@@ -0,0 +1,429 @@
+"""
+vecsim.py
+הרבה משחקים headless בצעד משותף, כשכל המצב שלהם במערכי NumPy.
+
+VecSim מריץ את אותם חוקים כמו Game.step() (בלי ציור, עם האויב הישן: טיימר
++ שדרוג טורט אוטומטי), אבל לכל n המשחקים יחד: כל שדה של משחק הוא מערך (n,),
+וכל שדה של לוחם הוא מערך (n, U). כל טיק הוא כמה עשרות פעולות NumPy על כל
+המשחקים, בלי לולאת Python על משחקים או על לוחמים.
+
+התוצאה זהה ביט-לביט ל-Game עם אותן פעולות (אותו כסף, HP, טורטים, לוחמים
+ומנצח בכל טיק); env.VecGameEnv בנוי על זה. כל שינוי בחוקים ב- game.py /
+entities.py צריך שינוי תואם כאן: python check_vecsim.py בודק את שניהם.
+
+    sim = VecSim(1024)
+    sim.apply_actions(actions)  # ACTION_* לכל משחק
+    sim.step()                  # טיק אחד לכל משחק שעוד לא נגמר
+"""
+
+import numpy as np
+
+from combat import SIDE_PLAYER, SIDE_ENEMY
+from game import ACTION_SPAWN, ACTION_UPGRADE
+from pool import grow_columns
+from settings import SIM_TICK_RATE, WIDTH, make_config
+
+
+# מפתח מיון לתא ריק / לוחם מת (גדול מכל centerx)
+_EMPTY = 1 << 20
+# offset בין שורות (משחקים) במערך החיפוש השטוח
+_ROW = 1 << 22
+
+WINNER_NONE = 0
+WINNER_PLAYER = 1
+WINNER_ENEMY = 2
+WINNERS = (None, "player", "enemy")
+
+
+class _Lanes:
+    """
+    הלוחמים של צד אחד בכל המשחקים: x, hp, last_attack, alive בצורת (n, U).
+
+    כל שורה שמורה בסדר של אינדקס הנתיב של UnitPool: אחרי רענון ממוינת לפי
+    centerx (יציב - שוויון נשבר לפי הסדר הקודם), ולוחם חדש נוסף בסוף. כך
+    העמודה של לוחם היא בדיוק המקום שלו ב- UnitPool.order, ושבירת השוויון
+    בחיפוש "הקרוב ביותר" זהה.
+    """
+
+    _FIELDS = (
+        ("x", np.float64),
+        ("hp", np.int64),
+        ("last_attack", np.int64),
+        ("alive", np.bool_),
+    )
+
+    def __init__(self, n, capacity, config, side):
+        self.dir = 1 if side == SIDE_PLAYER else -1
+        self.width = config.UNIT_WIDTH
+        self.max_hp = config.UNIT_MAX_HP
+        self.speed = config.UNIT_SPEED
+        self.range = config.UNIT_ATTACK_RANGE
+        self.damage = config.UNIT_ATTACK_DAMAGE
+        self.cooldown = config.UNIT_ATTACK_COOLDOWN
+        self.capacity = 0
+        self._grow(n, capacity)
+        # עמודות בשימוש בכל שורה (כולל מתים שעוד לא סודרו לסוף)
+        self.used = np.zeros(n, dtype=np.int64)
+
+    def _grow(self, n, capacity):
+        grow_columns(self, self._FIELDS, capacity, self.capacity, rows=(n,))
+        self.capacity = capacity
+        self._cols = np.arange(capacity)
+
+    def spawn(self, rows, x):
+        """לוחם חדש בסוף כל שורה ב- rows (מערך אינדקסים), במיקום x."""
+        if len(rows) == 0:
+            return
+        if self.used[rows].max() >= self.capacity:
+            self._grow(len(self.used), self.capacity * 2)
+        cols = self.used[rows]
+        self.x[rows, cols] = x
+        self.hp[rows, cols] = self.max_hp
+        self.last_attack[rows, cols] = 0
+        self.alive[rows, cols] = True
+        self.used[rows] += 1
+
+    def reset_rows(self, rows):
+        self.alive[rows] = False
+        self.used[rows] = 0
+
+    def width_used(self):
+        """כמה עמודות צריך לעבור עליהן (המקסימום בין השורות)."""
+        return int(self.used.max()) if len(self.used) else 0
+
+    def centerx(self, m):
+        # same as UnitPool.centerx: int(x) + width // 2
+        return self.x[:, :m].astype(np.int64) + self.width // 2
+
+    def arrange(self, m, refresh, count):
+        """
+        מתים עוברים לסוף (כמו compact), ובשורות ש- refresh מיון יציב לפי
+        centerx (כמו UnitPool.lane). שורות אחרות שומרות על הסדר שלהן.
+        count = מספר החיים בכל שורה.
+        """
+        self.used[:] = count
+        if m == 0:
+            return
+        alive = self.alive[:, :m]
+        cols = self._cols[:m]
+        key = np.where(refresh[:, None], self.centerx(m), cols)
+        key = np.where(alive, key, _EMPTY)
+        perm = np.argsort(key, axis=1, kind="stable")
+        # units walk in step, so most rows are already in order
+        rows = np.flatnonzero((perm != cols).any(axis=1))
+        if len(rows) > 0:
+            flat = (perm[rows] + rows[:, None] * self.capacity).ravel()
+            for name, _ in self._FIELDS:
+                arr = getattr(self, name)
+                arr[rows, :m] = arr.ravel()[flat].reshape(len(rows), m)
+
+    def nearest(self, cx, rows, xs, max_dist):
+        """
+        UnitPool.nearest בשורות rows (שמוינו ב- arrange ויש בהן לוחמים):
+        cx = self.centerx(m), xs = (len(rows), k) נקודות חיפוש, max_dist =
+        מספר או מערך (len(rows),). מחזיר (len(rows), k) עמודות של הלוחם
+        הקרוב ביותר, או -1.
+        """
+        out = np.full(xs.shape, -1, dtype=np.int64)
+        m = cx.shape[1]
+        count = self.used[rows]
+        cx = cx[rows]
+        # most ticks the two fronts are still apart: one range check per game
+        lo = cx[:, 0]
+        hi = cx[np.arange(len(rows)), count - 1]
+        max_dist = np.broadcast_to(max_dist, count.shape)
+        near = np.flatnonzero((xs.min(axis=1) - max_dist <= hi) & (xs.max(axis=1) + max_dist >= lo))
+        if len(near) == 0:
+            return out
+
+        cx, xs, count, max_dist = cx[near], xs[near], count[near], max_dist[near]
+        offset = np.arange(len(near))[:, None]
+        # every row sorted, and rows apart by _ROW -> one sorted flat array
+        live = self._cols[:m] < count[:, None]
+        flat = (np.where(live, cx, _EMPTY) + offset * _ROW).ravel()
+        pos = np.searchsorted(flat, xs + offset * _ROW) - offset * m
+        last = (count - 1)[:, None]
+        left = np.minimum(np.maximum(pos - 1, 0), last)
+        right = np.minimum(pos, last)
+        d_left = np.abs(xs - np.take_along_axis(cx, left, axis=1))
+        d_right = np.abs(xs - np.take_along_axis(cx, right, axis=1))
+        best = np.where(d_left <= d_right, left, right)
+        ok = np.minimum(d_left, d_right) <= max_dist[:, None]
+        out[near] = np.where(ok, best, -1)
+        return out
+
+
+class VecSim:
+    """
+    n משחקים headless בצעד משותף (אותם חוקים כמו Game, ראו למעלה).
+
+    שדות לכל משחק (מערכי (n,)): tick, now, money, xp, enemy_money, enemy_xp,
+    player_base_hp, enemy_base_hp, player_turret_level, enemy_turret_level,
+    game_over, winner (WINNER_*), player_units_spawned, enemy_units_spawned.
+    players / enemies = _Lanes של כל צד. config אחד לכל המשחקים.
+    """
+
+    _SCALARS = (
+        ("tick", np.int64),
+        ("now", np.int64),
+        ("money", np.int64),
+        ("xp", np.int64),
+        ("enemy_money", np.int64),
+        ("enemy_xp", np.int64),
+        ("money_remainder", np.int64),
+        ("xp_remainder", np.int64),
+        ("last_income_time", np.int64),
+        ("last_enemy_spawn_time", np.int64),
+        ("player_base_hp", np.int64),
+        ("enemy_base_hp", np.int64),
+        ("player_turret_level", np.int64),
+        ("player_turret_last_shot", np.int64),
+        ("enemy_turret_level", np.int64),
+        ("enemy_turret_last_shot", np.int64),
+        ("enemy_turret_last_upgrade", np.int64),
+        ("player_units_spawned", np.int64),
+        ("enemy_units_spawned", np.int64),
+        ("game_over", bool),
+        ("winner", np.int8),
+    )
+
+    def __init__(self, n, config=None, capacity=32):
+        if config is None:
+            config = make_config()
+        self.n = n
+        self.config = config
+        for name, dtype in self._SCALARS:
+            setattr(self, name, np.zeros(n, dtype=dtype))
+        self.players = _Lanes(n, capacity, config, SIDE_PLAYER)
+        self.enemies = _Lanes(n, capacity, config, SIDE_ENEMY)
+
+        # מקומות קבועים (כמו Base.rect ב- Game)
+        self.player_base_x = 40 + config.PLAYER_BASE_WIDTH // 2
+        enemy_left = WIDTH - 40 - config.ENEMY_BASE_WIDTH
+        self.enemy_base_x = enemy_left + config.ENEMY_BASE_WIDTH // 2
+        self.player_spawn_x = 40 + config.PLAYER_BASE_WIDTH - 10
+        self.enemy_spawn_x = enemy_left - 15
+
+        # טבלאות הטורט לפי רמה
+        self.turret_ranges = np.asarray(config.BASE_TURRET_RANGES, dtype=np.int64)
+        self.turret_damages = np.asarray(config.BASE_TURRET_DAMAGES, dtype=np.int64)
+        self.turret_cooldowns = np.asarray(config.BASE_TURRET_COOLDOWNS, dtype=np.int64)
+        self.turret_costs = np.asarray(config.BASE_TURRET_XP_COSTS, dtype=np.int64)
+        self.turret_max_level = config.BASE_TURRET_MAX_LEVEL
+
+        self.reset(np.arange(n))
+
+    # ---------- איפוס ----------
+
+    def reset(self, rows):
+        """משחק חדש בשורות rows (כמו Game.reset עם SimClock חדש)."""
+        config = self.config
+        for name, _ in self._SCALARS:
+            getattr(self, name)[rows] = 0
+        self.money[rows] = 100
+        self.enemy_money[rows] = 100
+        self.player_base_hp[rows] = config.PLAYER_BASE_MAX_HP
+        self.enemy_base_hp[rows] = config.ENEMY_BASE_MAX_HP
+        self.players.reset_rows(rows)
+        self.enemies.reset_rows(rows)
+
+    # ---------- פעולות ----------
+
+    def apply_actions(self, actions):
+        """Game.apply_action(action) לכל משחק (פעולה לא חוקית לא עושה כלום)."""
+        actions = np.asarray(actions)
+        live = ~self.game_over
+        spawn = np.flatnonzero(live & (actions == ACTION_SPAWN) & (self.money >= self.config.UNIT_COST))
+        self.money[spawn] -= self.config.UNIT_COST
+        self.players.spawn(spawn, self.player_spawn_x)
+        self.player_units_spawned[spawn] += 1
+
+        level = self.player_turret_level
+        upgrade = live & (actions == ACTION_UPGRADE) & (level < self.turret_max_level)
+        cost = self.turret_costs[np.minimum(level + 1, self.turret_max_level)]
+        upgrade &= self.xp >= cost
+        self.xp[upgrade] -= cost[upgrade]
+        level[upgrade] += 1
+
+    def can_upgrade(self):
+        level = self.player_turret_level
+        cost = self.turret_costs[np.minimum(level + 1, self.turret_max_level)]
+        return (level < self.turret_max_level) & (self.xp >= cost)
+
+    # ---------- טיק ----------
+
+    def step(self):
+        """טיק אחד (Game.step) לכל משחק שעוד לא נגמר. מחזיר מסכה של מי שהתקדם."""
+        live = ~self.game_over
+        if not live.any():
+            return live
+        # Game.step: whole-millisecond ticks (16/17/17 at 60 Hz)
+        start = self.tick * 1000 // SIM_TICK_RATE
+        end = (self.tick + 1) * 1000 // SIM_TICK_RATE
+        dt = np.where(live, end - start, 0)
+        self.tick[live] += 1
+        self.now[live] = end[live]
+        now = self.now
+
+        self._income(live)
+        self._enemy_spawns(live, now)
+
+        players, enemies = self.players, self.enemies
+        mp = players.width_used()
+        me = enemies.width_used()
+
+        # turrets that will look for a target this tick (enemy upgrades first)
+        self._enemy_turret_upgrade(live, now)
+        p_level = self.player_turret_level
+        e_level = self.enemy_turret_level
+        p_fire = live & (p_level > 0) & (now - self.player_turret_last_shot >= self.turret_cooldowns[p_level])
+        e_fire = live & (e_level > 0) & (now - self.enemy_turret_last_shot >= self.turret_cooldowns[e_level])
+
+        # a lane is re-sorted only when someone queries it (UnitPool.lane is lazy)
+        p_count = np.count_nonzero(players.alive[:, :mp], axis=1)
+        e_count = np.count_nonzero(enemies.alive[:, :me], axis=1)
+        e_queried = live & ((p_count > 0) | p_fire)
+        p_queried = live & ((e_count > 0) | e_fire)
+        players.arrange(mp, p_queried, p_count)
+        enemies.arrange(me, e_queried, e_count)
+        p_cx = players.centerx(mp)
+        e_cx = enemies.centerx(me)
+
+        # שלב 1: כוונות תקיפה לפי המצב בתחילת הטיק
+        p_plan = self._plan(players, p_cx, live, enemies, e_cx, self.enemy_base_x, now)
+        e_plan = self._plan(enemies, e_cx, live, players, p_cx, self.player_base_x, now)
+        p_shot = self._turret_target(enemies, e_cx, p_fire, p_level, self.player_base_x)
+        e_shot = self._turret_target(players, p_cx, e_fire, e_level, self.enemy_base_x)
+        # the enemy turret falls back to the player base when it is in range
+        e_base_shot = e_fire & (e_shot < 0) & (np.abs(self.player_base_x - self.enemy_base_x) <= self.turret_ranges[e_level])
+        p_fired = p_fire & (p_shot >= 0)
+        e_fired = e_fire & ((e_shot >= 0) | e_base_shot)
+        self.player_turret_last_shot[p_fired] = now[p_fired]
+        self.enemy_turret_last_shot[e_fired] = now[e_fired]
+
+        # מי שלא תוקף הולך קדימה
+        self._walk(players, p_plan[0], dt)
+        self._walk(enemies, e_plan[0], dt)
+
+        # שלב 2: נזק, מוות ופרסים
+        no_shot = np.zeros(self.n, dtype=bool)
+        self._resolve(SIDE_PLAYER, players, enemies, p_plan, p_shot, p_fired, p_level, no_shot)
+        self._resolve(SIDE_ENEMY, enemies, players, e_plan, e_shot, e_fired & ~e_base_shot, e_level, e_base_shot)
+
+        player_dead = live & (self.player_base_hp <= 0)
+        enemy_dead = live & ~player_dead & (self.enemy_base_hp <= 0)
+        self.game_over |= player_dead | enemy_dead
+        self.winner[player_dead] = WINNER_ENEMY
+        self.winner[enemy_dead] = WINNER_PLAYER
+        return live
+
+    def _income(self, live):
+        delta = np.where(live, self.now - self.last_income_time, 0)
+        paid = delta > 0
+        self.money_remainder[paid] += self.config.MONEY_PER_SECOND * delta[paid]
+        self.xp_remainder[paid] += self.config.XP_PER_SECOND * delta[paid]
+        # the remainder is always < 1000 in rows that were not paid
+        money = self.money_remainder // 1000
+        xp = self.xp_remainder // 1000
+        self.money_remainder -= money * 1000
+        self.xp_remainder -= xp * 1000
+        cap_money, cap_xp = self.config.MONEY_MAX, self.config.XP_MAX
+        for field, gain, cap in ((self.money, money, cap_money), (self.xp, xp, cap_xp),
+                                 (self.enemy_money, money, cap_money), (self.enemy_xp, xp, cap_xp)):
+            field[paid] = np.minimum(field[paid] + gain[paid], cap)
+        self.last_income_time[paid] = self.now[paid]
+
+    def _enemy_spawns(self, live, now):
+        due = np.flatnonzero(live & (now - self.last_enemy_spawn_time >= self.config.ENEMY_SPAWN_INTERVAL))
+        self.enemies.spawn(due, self.enemy_spawn_x)
+        self.enemy_units_spawned[due] += 1
+        self.last_enemy_spawn_time[due] = now[due]
+
+    def _enemy_turret_upgrade(self, live, now):
+        due = (
+            live
+            & (self.enemy_turret_level < self.turret_max_level)
+            & (now - self.enemy_turret_last_upgrade >= self.config.ENEMY_TURRET_AUTO_UPGRADE_INTERVAL)
+        )
+        self.enemy_turret_level[due] += 1
+        self.enemy_turret_last_upgrade[due] = now[due]
+
+    def _plan(self, lanes, cx, live, foes, foe_cx, foe_base_x, now):
+        """
+        UnitPool.plan_attacks לכל המשחקים. מחזיר (moving, target, hit_unit, hit_base):
+        target = עמודה בצד השני, hit_unit / hit_base = מי תוקף עכשיו.
+        """
+        m = cx.shape[1]
+        alive = lanes.alive[:, :m] & live[:, None]
+        target = np.full(cx.shape, -1, dtype=np.int64)
+        rows = np.flatnonzero(live & (lanes.used > 0) & (foes.used > 0))
+        if len(rows) > 0:
+            target[rows] = foes.nearest(foe_cx, rows, cx[rows], lanes.range)
+        has_unit = alive & (target >= 0)
+        has_base = alive & ~has_unit & (np.abs(cx - foe_base_x) <= lanes.range)
+        ready = (now[:, None] - lanes.last_attack[:, :m]) >= lanes.cooldown
+        hit_unit = has_unit & ready
+        hit_base = has_base & ready
+        np.copyto(lanes.last_attack[:, :m], now[:, None], where=hit_unit | hit_base)
+        moving = alive & ~has_unit & ~has_base
+        return moving, target, hit_unit, hit_base
+
+    def _turret_target(self, foes, foe_cx, fire, level, base_x):
+        """עמודת המטרה של כל טורט שיורה (או -1)."""
+        target = np.full(self.n, -1, dtype=np.int64)
+        rows = np.flatnonzero(fire & (foes.used > 0))
+        if len(rows) > 0:
+            xs = np.full((len(rows), 1), base_x, dtype=np.int64)
+            target[rows] = foes.nearest(foe_cx, rows, xs, self.turret_ranges[level[rows]])[:, 0]
+        return target
+
+    def _walk(self, lanes, moving, dt):
+        if not moving.any():
+            return
+        # same float expression as UnitPool.walk: dir * speed * (dt / 1000.0)
+        step = lanes.dir * lanes.speed * (dt / 1000.0)
+        lanes.x[:, : moving.shape[1]] += np.where(moving, step[:, None], 0.0)
+
+    def _resolve(self, side, lanes, victims, plan, shot, shot_unit, level, shot_base):
+        """
+        Game.resolve_combat לצד התוקף side (הלוחמים שלו = lanes): נזק ללוחמים
+        ולבסיס של הצד השני, מוות, ופרסים (150 כסף + 100 XP להריגה, נזק לבסיס
+        // 10 ו- // 5).
+        """
+        _, target, hit_unit, hit_base = plan
+        n = self.n
+        dmg = self.turret_damages[level]
+
+        # לוחמים: כל הפגיעות כתאים בטבלה השטוחה (שורה * capacity + עמודה)
+        r, c = np.nonzero(hit_unit)
+        t = np.flatnonzero(shot_unit)
+        cells = np.concatenate((r * victims.capacity + target[r, c], t * victims.capacity + shot[t]))
+        killed = np.zeros(n, dtype=np.int64)
+        if len(cells) > 0:
+            hp = victims.hp.reshape(-1)
+            np.subtract.at(hp, cells, np.concatenate((np.full(len(r), lanes.damage), dmg[t])))
+            hit = np.unique(cells)
+            dead = hit[victims.alive.reshape(-1)[hit] & (hp[hit] <= 0)]
+            np.put(victims.alive, dead, False)
+            killed = np.bincount(dead // victims.capacity, minlength=n)
+
+        # בסיס: כל הפגיעות יחד, ה-HP לא יורד מתחת ל-0
+        hits = np.count_nonzero(hit_base, axis=1) * lanes.damage + np.where(shot_base, dmg, 0)
+        base_hp = self.enemy_base_hp if side == SIDE_PLAYER else self.player_base_hp
+        dealt = np.minimum(hits, base_hp)
+        base_hp -= dealt
+
+        money = killed * 150 + dealt // 10
+        xp = killed * 100 + dealt // 5
+        if side == SIDE_PLAYER:
+            self.money += money
+            self.xp += xp
+        else:
+            self.enemy_money += money
+            self.enemy_xp += xp
+
+    # ---------- שאילתות ----------
+
+    def winners(self, rows):
+        """שמות המנצחים ("player" / "enemy" / None) בשורות rows."""
+        return [WINNERS[w] for w in self.winner[rows].tolist()]
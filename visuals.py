@@ -1,3 +1,6 @@
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 from settings import WIDTH, HEIGHT, GROUND_Y, BG_TOP, BG_BOTTOM, GROUND_COLOR
 
@@ -30,3 +33,170 @@ def draw_gradient_background(surface):
 def draw_ground(surface):
     """Draw ground rectangle at the bottom (moved from settings)."""
     pygame.draw.rect(surface, GROUND_COLOR, (0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
+
+
+# =========================
+#   Particle sprite cache
+# =========================
+
+# radius is quantized to half pixels, alpha to 16 levels (0 = invisible)
+SPRITE_RADIUS_STEPS = 2
+SPRITE_ALPHA_LEVELS = 16
+# the key space of one match: smoke (the biggest particle) is up to 16 px,
+# and effects.py / game.py use about a dozen particle colors
+SPRITE_MAX_RADIUS = 16
+SPRITE_COLORS = 12
+# room for every key, so a fight never re-renders sprites (about 1.5 KB each,
+# ~1000 of them actually show up in a match)
+SPRITE_CACHE_CAPACITY = SPRITE_COLORS * SPRITE_MAX_RADIUS * SPRITE_RADIUS_STEPS * SPRITE_ALPHA_LEVELS
+
+
+def sprite_keys(color, radius, alpha):
+    """
+    Vectorized cache keys: color = (n, 3) uint8 rows, radius = float array,
+    alpha = int array 0..255. Returns (keys, half) where half is the offset
+    from a particle's center to its sprite's top-left corner.
+    """
+    rq = np.maximum(1, np.rint(radius * SPRITE_RADIUS_STEPS)).astype(np.int64)
+    aq = (alpha.astype(np.int64) * (SPRITE_ALPHA_LEVELS - 1) + 127) // 255
+    rgb = (color[:, 0].astype(np.int64) << 16) | (color[:, 1].astype(np.int64) << 8) | color[:, 2]
+    keys = (rgb << 16) | (rq << 4) | aq
+    return keys, _sprite_half(rq)
+
+
+def sprite_key(color, radius, alpha):
+    """sprite_keys() for a single circle: returns (key, half)."""
+    rq = max(1, round(radius * SPRITE_RADIUS_STEPS))
+    aq = (alpha * (SPRITE_ALPHA_LEVELS - 1) + 127) // 255
+    rgb = (color[0] << 16) | (color[1] << 8) | color[2]
+    return (rgb << 16) | (rq << 4) | aq, _sprite_half(rq)
+
+
+def _sprite_half(rq):
+    # +1 px for the soft fringe
+    return -(-rq // SPRITE_RADIUS_STEPS) + 1
+
+
+class SpriteCache:
+    """
+    Pre-rendered soft circles for particles, keyed by sprite_keys().
+    Holds at most capacity sprites; the least recently used one is dropped
+    when it is full. get() updates hits / misses.
+    """
+
+    def __init__(self, capacity=SPRITE_CACHE_CAPACITY):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        sprite = self.entries.get(key)
+        if sprite is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        if len(self.entries) >= self.capacity:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= self._size(old)
+            self.evictions += 1
+        sprite = self._render(key)
+        self.entries[key] = sprite
+        self.bytes += self._size(sprite)
+        return sprite
+
+    @staticmethod
+    def _render(key):
+        aq = key & 0xF
+        rq = (key >> 4) & 0xFFF
+        rgb = key >> 16
+        color = ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
+        alpha = aq * 255 // (SPRITE_ALPHA_LEVELS - 1)
+        radius = rq / SPRITE_RADIUS_STEPS
+        half = int(_sprite_half(rq))
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        # soft edge: a half-transparent ring one pixel outside the core
+        pygame.draw.circle(sprite, (*color, alpha // 2), (half, half), radius + 1)
+        pygame.draw.circle(sprite, (*color, alpha), (half, half), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    @staticmethod
+    def _size(sprite):
+        return sprite.get_pitch() * sprite.get_height()
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+# sprites outside the particle system (missiles, drones, attack glow)
+SPRITES = SpriteCache()
+
+
+# =========================
+#   Batched blitting
+# =========================
+
+
+def _blits(surface, pairs):
+    # pygame-ce has fblits (no per-blit rects, faster); pygame has blits
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
+
+
+class RenderBatch:
+    """
+    Collects (sprite, (x, y)) pairs per layer during a frame, then draws each
+    layer with a single blits call instead of one blit per sprite.
+    Whoever owns a layer decides when to flush it, which keeps the draw order.
+    """
+
+    def __init__(self):
+        self.layers = {}
+        self.flushes = 0
+        self.blitted = 0
+
+    def add(self, layer, sprite, pos):
+        self.layers.setdefault(layer, []).append((sprite, pos))
+
+    def extend(self, layer, pairs):
+        self.layers.setdefault(layer, []).extend(pairs)
+
+    def flush(self, surface, layer):
+        """Draws everything queued on layer and empties it."""
+        pairs = self.layers.get(layer)
+        if not pairs:
+            return
+        _blits(surface, pairs)
+        self.flushes += 1
+        self.blitted += len(pairs)
+        pairs.clear()
+
+    def clear(self):
+        self.layers.clear()